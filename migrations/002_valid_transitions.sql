@@ -0,0 +1,54 @@
+-- Migration: 002_valid_transitions.sql
+-- Description: Encode the pipeline transition matrix server-side
+-- Requirements: 7.2 (Enforce valid state transitions), 8.5 (Optimistic locking)
+--
+-- This migration mirrors VALID_TRANSITIONS from src/pipeline/state/models.py
+-- into a lookup table so that a transition can be validated and applied in a
+-- single conditional UPDATE (see PostgresStateRepository.append_transition).
+-- Without it the state machine validates in Python between its SELECT and its
+-- UPDATE, leaving a check-then-act window between the two statements.
+--
+-- Keep this table in sync with VALID_TRANSITIONS when stages or transitions
+-- change.
+
+-- =============================================================================
+-- Valid Transitions Table
+-- =============================================================================
+
+CREATE TABLE valid_transitions (
+    -- Stage the pipeline state is leaving
+    from_stage TEXT NOT NULL,
+
+    -- Stage the pipeline state is entering
+    to_stage TEXT NOT NULL,
+
+    PRIMARY KEY (from_stage, to_stage)
+);
+
+COMMENT ON TABLE valid_transitions IS
+    'Allowed pipeline stage transitions, mirroring VALID_TRANSITIONS in '
+    'src/pipeline/state/models.py. Consulted by conditional transition updates.';
+
+INSERT INTO valid_transitions (from_stage, to_stage) VALUES
+    -- PENDING: Initial state, can start intake or fail immediately
+    ('pending', 'intake'),
+    ('pending', 'failed'),
+    -- INTAKE: May need clarification, proceed to provisioning, or fail
+    ('intake', 'clarification'),
+    ('intake', 'provisioning'),
+    ('intake', 'failed'),
+    -- CLARIFICATION: Re-evaluate, proceed if complete, or fail
+    ('clarification', 'intake'),
+    ('clarification', 'provisioning'),
+    ('clarification', 'failed'),
+    -- PROVISIONING: Proceed to implementation or fail
+    ('provisioning', 'implementation'),
+    ('provisioning', 'failed'),
+    -- IMPLEMENTATION: Create PR or fail
+    ('implementation', 'pr_creation'),
+    ('implementation', 'failed'),
+    -- PR_CREATION: Complete or fail
+    ('pr_creation', 'completed'),
+    ('pr_creation', 'failed'),
+    -- FAILED: Can only recover to PENDING for manual retry
+    ('failed', 'pending');
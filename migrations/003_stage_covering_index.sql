@@ -0,0 +1,21 @@
+-- Migration: 003_stage_covering_index.sql
+-- Description: Cover stage listings, pages and counts with a single index
+-- Requirements: 7.5 (Support querying issues by current state)
+--
+-- count_by_stage(), iter_by_stage() and list_by_stage_page() filter
+-- pipeline_states by current_stage. The listings order by
+-- (created_at, issue_id), and list_by_stage_page() resumes after the
+-- (created_at, issue_id) position of the previous page. Keying the index on
+-- all three columns lets counts run as index-only scans (the visibility map
+-- allows skipping the heap), lets listings walk the index in order instead
+-- of sorting, and lets the row comparison (created_at, issue_id) > ($4, $5)
+-- start a range scan at the cursor. The index supersedes
+-- idx_pipeline_states_stage.
+--
+-- CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so
+-- apply this file with autocommit (e.g. psql without --single-transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pipeline_states_stage_created_id
+    ON pipeline_states(current_stage, created_at, issue_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_pipeline_states_stage;
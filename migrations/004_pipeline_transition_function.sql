@@ -0,0 +1,78 @@
+-- Migration: 004_pipeline_transition_function.sql
+-- Description: Apply a stage transition server-side without a prior read
+-- Requirements: 7.2 (Enforce valid state transitions), 7.3 (Record transition
+--               timestamps), 7.4 (Store error details on failure)
+--
+-- PipelineStateMachine.advance() moves an issue to a new stage without first
+-- reading its state: this function locks the row, reads the current stage,
+-- checks it against valid_transitions, updates the state and records the
+-- transition, all in the one call (see
+-- PostgresStateRepository.apply_transition). The row lock serializes
+-- concurrent advances of the same issue, so no expected version is needed.
+--
+-- The error column follows PipelineStateMachine._error_after(): a transition
+-- to 'failed' stores p_failed_error, recovery from 'failed' to 'pending'
+-- clears it, and any other transition keeps it. Keep the two in sync.
+--
+-- Returns no row if the issue does not exist, and a row with a NULL
+-- applied_version if the stored stage does not allow the transition.
+
+CREATE OR REPLACE FUNCTION pipeline_transition(
+    p_issue_id TEXT,
+    p_to_stage TEXT,
+    p_timestamp TIMESTAMP WITH TIME ZONE,
+    p_details JSONB,
+    p_failed_error TEXT
+)
+RETURNS TABLE (previous_stage TEXT, applied_version INTEGER)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    SELECT s.current_stage
+    INTO previous_stage
+    FROM pipeline_states s
+    WHERE s.issue_id = p_issue_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM valid_transitions v
+        WHERE v.from_stage = previous_stage AND v.to_stage = p_to_stage
+    ) THEN
+        applied_version := NULL;
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    UPDATE pipeline_states s
+    SET
+        current_stage = p_to_stage,
+        error = CASE
+            WHEN p_to_stage = 'failed' THEN p_failed_error
+            WHEN previous_stage = 'failed' AND p_to_stage = 'pending' THEN NULL
+            ELSE s.error
+        END,
+        updated_at = p_timestamp,
+        version = s.version + 1
+    WHERE s.issue_id = p_issue_id
+    RETURNING s.version INTO applied_version;
+
+    INSERT INTO state_transitions (
+        issue_id,
+        from_stage,
+        to_stage,
+        timestamp,
+        details
+    )
+    VALUES (p_issue_id, previous_stage, p_to_stage, p_timestamp, p_details);
+
+    RETURN NEXT;
+END;
+$$;
+
+COMMENT ON FUNCTION pipeline_transition(TEXT, TEXT, TIMESTAMP WITH TIME ZONE, JSONB, TEXT) IS
+    'Locks, validates and applies a stage transition in one call; see '
+    'PipelineStateMachine.advance().';
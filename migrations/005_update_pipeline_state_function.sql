@@ -0,0 +1,95 @@
+-- Migration: 005_update_pipeline_state_function.sql
+-- Description: Apply a versioned state update and its new transitions
+--              server-side
+-- Requirements: 8.3 (Use database transactions for state updates),
+--               8.5 (Implement optimistic locking)
+--
+-- PostgresStateRepository.update_with_version() writes a whole state under
+-- an optimistic lock. This function performs the version check, bumps the
+-- version and inserts the transitions the database does not have yet, all
+-- in the one call, so the version arithmetic lives next to the data.
+--
+-- The history arrives as parallel arrays, oldest first. When the caller
+-- knows how many of them are already stored it sends only the new ones and
+-- passes p_known_skip = 0; otherwise p_known_skip is NULL and the stored
+-- transitions are counted, less p_history_offset for a history that was
+-- read with a limit.
+--
+-- Returns one row: the new version, or NULL if the expected version did not
+-- match (including when the issue does not exist), and the number of
+-- transitions inserted.
+
+CREATE OR REPLACE FUNCTION update_pipeline_state(
+    p_issue_id TEXT,
+    p_expected_version INTEGER,
+    p_stage TEXT,
+    p_classification JSONB,
+    p_workspace_path TEXT,
+    p_pr_number INTEGER,
+    p_error TEXT,
+    p_updated_at TIMESTAMP WITH TIME ZONE,
+    p_from_stages TEXT[],
+    p_to_stages TEXT[],
+    p_timestamps TIMESTAMP WITH TIME ZONE[],
+    p_details JSONB[],
+    p_history_offset INTEGER,
+    p_known_skip INTEGER
+)
+RETURNS TABLE (applied_version INTEGER, inserted_count INTEGER)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_skip BIGINT;
+BEGIN
+    inserted_count := 0;
+
+    UPDATE pipeline_states s
+    SET
+        current_stage = p_stage,
+        classification = p_classification,
+        workspace_path = p_workspace_path,
+        pr_number = p_pr_number,
+        error = p_error,
+        updated_at = p_updated_at,
+        version = s.version + 1
+    WHERE s.issue_id = p_issue_id AND s.version = p_expected_version
+    RETURNING s.version INTO applied_version;
+
+    IF NOT FOUND THEN
+        applied_version := NULL;
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    v_skip := COALESCE(
+        p_known_skip,
+        (
+            SELECT COUNT(*) FROM state_transitions t
+            WHERE t.issue_id = p_issue_id
+        ) - p_history_offset
+    );
+
+    INSERT INTO state_transitions (
+        issue_id,
+        from_stage,
+        to_stage,
+        timestamp,
+        details
+    )
+    SELECT p_issue_id, h.from_stage, h.to_stage, h.ts, h.details
+    FROM unnest(p_from_stages, p_to_stages, p_timestamps, p_details)
+        WITH ORDINALITY AS h(from_stage, to_stage, ts, details, position)
+    WHERE h.position > v_skip
+    ORDER BY h.position;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN NEXT;
+END;
+$$;
+
+COMMENT ON FUNCTION update_pipeline_state(
+    TEXT, INTEGER, TEXT, JSONB, TEXT, INTEGER, TEXT, TIMESTAMP WITH TIME ZONE,
+    TEXT[], TEXT[], TIMESTAMP WITH TIME ZONE[], JSONB[], INTEGER, INTEGER
+) IS
+    'Checks the expected version, bumps it and inserts new transitions in one '
+    'call; see PostgresStateRepository.update_with_version().';
@@ -25,7 +25,7 @@ Source:
 
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
@@ -81,7 +81,7 @@ Respond with this exact JSON structure:
 def _build_classification_prompt(
     title: str,
     body: str,
-    labels: list[str],
+    labels: Sequence[str],
 ) -> str:
     """Build the user prompt for issue classification.
 
@@ -295,7 +295,7 @@ class IssueClassifier:
         self,
         title: str,
         body: str,
-        labels: list[str],
+        labels: Sequence[str],
     ) -> IssueClassification:
         """Classify a GitHub issue using the LLM.
 
@@ -320,7 +320,7 @@ class IssueClassifier:
             extra={
                 "title": title[:100],
                 "body_length": len(body) if body else 0,
-                "labels": labels,
+                "labels": list(labels),
             },
         )
 
@@ -354,7 +354,7 @@ class IssueClassifier:
         self,
         title: str,
         body: str,
-        labels: list[str],
+        labels: Sequence[str],
     ) -> IssueClassification:
         """Perform the actual LLM classification.
 
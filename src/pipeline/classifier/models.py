@@ -13,9 +13,10 @@ approach in webhook/models.py, state/models.py, and github/models.py.
 """
 
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class IssueType(str, Enum):
@@ -64,8 +65,14 @@ class IssueClassification(BaseModel):
             Should be empty when completeness_score >= 3.
         confidence: Optional confidence score for the classification (0.0-1.0).
         reasoning: Optional explanation of the classification decision.
+
+    Instances are frozen: a classification is produced once by the
+    classifier and then only read, which lets the serialized form be
+    cached in ``as_dict``.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     issue_type: IssueType = Field(
         ...,
         description="The classified type of the issue",
@@ -171,6 +178,35 @@ class IssueClassification(BaseModel):
             "reasoning": self.reasoning,
         }
 
+    @cached_property
+    def as_dict(self) -> dict:
+        """Dictionary representation of the classification, computed once.
+
+        The classification is serialized for state persistence, clarification
+        handling, and logging; caching avoids walking the fields each time.
+        The returned dict is shared and must not be mutated; use ``to_dict``
+        for a private copy.
+
+        Returns:
+            dict: Cached dictionary representation of the classification.
+        """
+        return self.to_dict()
+
+    def model_copy(
+        self,
+        *,
+        update: Optional[dict[str, Any]] = None,
+        deep: bool = False,
+    ) -> "IssueClassification":
+        """Copy the model, dropping the cached ``as_dict`` value.
+
+        Pydantic copies the instance ``__dict__`` verbatim, which would carry
+        a stale cached dictionary into a copy with updated fields.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("as_dict", None)
+        return copied
+
     @classmethod
     def from_dict(cls, data: dict) -> "IssueClassification":
         """Create an IssueClassification from a dictionary.
@@ -88,6 +88,9 @@ class GitHubClient:
     - Automatic retry with exponential backoff for transient failures
     - Rate limit handling by respecting X-RateLimit-* headers
     - Support for both github.com and GitHub Enterprise Server
+    - A pooled, keep-alive connection shared by every caller of the
+      instance, so one client should be created per process and injected
+      into ClarificationManager and PRCreator
 
     Attributes:
         token: GitHub API token (PAT or GitHub App token).
@@ -96,6 +99,10 @@ class GitHubClient:
         base_delay: Base delay in seconds for exponential backoff.
         max_delay: Maximum delay in seconds between retries.
         timeout: Request timeout in seconds.
+        max_connections: Maximum number of concurrent pooled connections.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        http2: Whether to negotiate HTTP/2 (requires the ``h2`` package).
 
     Example:
         >>> client = GitHubClient(token="ghp_xxx")
@@ -111,6 +118,12 @@ class GitHubClient:
     # HTTP status codes that should trigger a retry
     RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
+    # Connection pool defaults; idle connections are kept warm so each
+    # pipeline stage reuses an established TLS session
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+    DEFAULT_KEEPALIVE_EXPIRY = 75.0
+
     def __init__(
         self,
         token: str,
@@ -119,6 +132,10 @@ class GitHubClient:
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
     ):
         """Initialize the GitHub client.
 
@@ -130,6 +147,11 @@ class GitHubClient:
             base_delay: Base delay in seconds for exponential backoff.
             max_delay: Maximum delay in seconds between retries.
             timeout: Request timeout in seconds.
+            max_connections: Maximum number of concurrent pooled connections.
+            max_keepalive_connections: Maximum idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept before
+                              closing.
+            http2: Whether to negotiate HTTP/2. Requires ``httpx[http2]``.
         """
         self.token = token
         self.base_url = base_url.rstrip("/")
@@ -137,6 +159,10 @@ class GitHubClient:
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
         self._client: Optional[httpx.AsyncClient] = None
 
     @property
@@ -151,6 +177,12 @@ class GitHubClient:
                 base_url=self.base_url,
                 headers=self._default_headers(),
                 timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2,
             )
         return self._client
 
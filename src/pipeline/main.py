@@ -178,34 +178,7 @@ def _create_state_repository():
     The PostgreSQL implementation is wired when database persistence is
     configured (task 4.2).
     """
-    from .state.models import PipelineStage, PipelineState
-
-    class InMemoryStateRepository:
-        """Minimal in-memory state repository for local development."""
-
-        def __init__(self):
-            self._states: dict[str, PipelineState] = {}
-
-        async def save(self, state: PipelineState) -> None:
-            self._states[state.issue_id] = state
-
-        async def get(self, issue_id: str):
-            return self._states.get(issue_id)
-
-        async def list_by_stage(self, stage: PipelineStage):
-            return [
-                s for s in self._states.values()
-                if s.current_stage == stage
-            ]
-
-        async def update_with_version(self, state: PipelineState) -> bool:
-            existing = self._states.get(state.issue_id)
-            if existing is None:
-                return False
-            if existing.version != state.version - 1:
-                return False
-            self._states[state.issue_id] = state
-            return True
+    from .state.memory import InMemoryStateRepository
 
     return InMemoryStateRepository()
 
@@ -288,13 +261,13 @@ async def github_webhook(request: Request):
     Returns:
         dict: Acknowledgment of webhook receipt.
     """
-    payload = await request.json()
+    body = await request.body()
 
     if webhook_handler is None or orchestrator is None:
         logger.error("Pipeline not initialized")
         return {"status": "error", "message": "Pipeline not initialized"}
 
-    event = webhook_handler.parse_issue_event(payload)
+    event = webhook_handler.parse_issue_event_bytes(body)
     if event is None:
         return {"status": "ignored", "message": "Unsupported or invalid event"}
 
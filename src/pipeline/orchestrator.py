@@ -100,10 +100,11 @@ class PipelineOrchestrator:
         issue_id = event.issue_id
         repository = event.full_repository
 
-        logger.info(
-            "Starting pipeline for issue",
-            extra={"issue_id": issue_id, "action": event.action.value},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting pipeline for issue",
+                extra={"issue_id": issue_id, "action": event.action.value},
+            )
 
         state = await self._create_pipeline_state(issue_id, repository)
         if state is None:
@@ -147,7 +148,7 @@ class PipelineOrchestrator:
         classification = await self._classify_issue(event)
 
         await self.state_machine.set_classification(
-            issue_id, classification.to_dict()
+            issue_id, classification.as_dict
         )
 
         if classification.needs_clarification:
@@ -172,14 +173,15 @@ class PipelineOrchestrator:
                 body=event.body,
                 labels=event.labels,
             )
-            logger.info(
-                "Issue classified",
-                extra={
-                    "issue_id": issue_id,
-                    "issue_type": classification.issue_type.value,
-                    "completeness": classification.completeness_score,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Issue classified",
+                    extra={
+                        "issue_id": issue_id,
+                        "issue_type": classification.issue_type.value,
+                        "completeness": classification.completeness_score,
+                    },
+                )
             return classification
         except Exception as exc:
             await self._fail(issue_id, repository, "classification", exc)
@@ -204,10 +206,11 @@ class PipelineOrchestrator:
                 issue_number=event.issue_number,
                 classification=classification,
             )
-            logger.info(
-                "Issue sent to clarification",
-                extra={"issue_id": issue_id},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Issue sent to clarification",
+                    extra={"issue_id": issue_id},
+                )
         except Exception as exc:
             await self._fail(issue_id, repository, "clarification", exc)
 
@@ -247,17 +250,17 @@ class PipelineOrchestrator:
                 knowledge_provider=self.knowledge_provider,
             )
 
-            await self.state_machine.set_workspace_path(
-                issue_id, str(workspace.path)
-            )
+            workspace_path = str(workspace.path)
+            await self.state_machine.set_workspace_path(issue_id, workspace_path)
 
-            logger.info(
-                "Workspace provisioned",
-                extra={
-                    "issue_id": issue_id,
-                    "workspace": str(workspace.path),
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Workspace provisioned",
+                    extra={
+                        "issue_id": issue_id,
+                        "workspace": workspace_path,
+                    },
+                )
         except Exception as exc:
             await self._fail(issue_id, repository, "provisioning", exc)
             return
@@ -293,13 +296,14 @@ class PipelineOrchestrator:
                 )
                 return
 
-            logger.info(
-                "Kiro CLI completed",
-                extra={
-                    "issue_id": issue_id,
-                    "duration": kiro_result.duration_seconds,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Kiro CLI completed",
+                    extra={
+                        "issue_id": issue_id,
+                        "duration": kiro_result.duration_seconds,
+                    },
+                )
         except Exception as exc:
             await self._fail(issue_id, repository, "implementation", exc)
             return
@@ -342,13 +346,14 @@ class PipelineOrchestrator:
                 issue_id, repository, pr_result.pr_number, pr_result.pr_url
             )
 
-            logger.info(
-                "Pipeline completed",
-                extra={
-                    "issue_id": issue_id,
-                    "pr_number": pr_result.pr_number,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Pipeline completed",
+                    extra={
+                        "issue_id": issue_id,
+                        "pr_number": pr_result.pr_number,
+                    },
+                )
         except Exception as exc:
             await self._fail(issue_id, repository, "pr_creation", exc)
 
@@ -363,16 +368,18 @@ class PipelineOrchestrator:
         to_stage: PipelineStage,
         details: Optional[dict] = None,
     ) -> None:
-        """Transition state and emit a state-transition event."""
-        state = await self.state_machine.transition(
+        """Transition state and emit a state-transition event.
+
+        Only the applied transition is needed here, so advance() is used
+        to write it without reading the state first.
+        """
+        transition = await self.state_machine.advance(
             issue_id, to_stage, details
         )
         await self._emit_transition_event(
             issue_id,
             repository,
-            state.state_history[-1].from_stage.value
-            if state.state_history
-            else "unknown",
+            transition.from_stage.value,
             to_stage.value,
         )
 
@@ -391,7 +398,7 @@ class PipelineOrchestrator:
         )
 
         try:
-            await self.state_machine.transition(
+            await self.state_machine.advance(
                 issue_id,
                 PipelineStage.FAILED,
                 details={"error": error_message},
@@ -21,6 +21,59 @@ from src.pipeline.knowledge.provider import KnowledgeProvider
 
 logger = logging.getLogger(__name__)
 
+# Markdown templates are rendered once at import time; each document is
+# produced by a single str.format call. Substituted values are never
+# re-parsed, so braces in issue content are emitted verbatim.
+
+_CONTEXT_TEMPLATE = (
+    "# Context: {title}\n"
+    "\n"
+    "## Issue Details\n"
+    "\n"
+    "**Title:** {title}\n"
+    "\n"
+    "{description}"
+    "\n"
+    "{classification}"
+    "{knowledge}"
+)
+
+_DESCRIPTION_TEMPLATE = "**Description:**\n\n{body}\n"
+
+_NO_DESCRIPTION = "**Description:** _No description provided._\n"
+
+_CLASSIFICATION_TEMPLATE = (
+    "## Classification\n"
+    "\n"
+    "- **Type:** {issue_type}\n"
+    "- **Completeness:** {completeness}/5"
+    "{packages}"
+    "{requirements}"
+    "\n"
+)
+
+_PACKAGES_LINE_TEMPLATE = "\n- **Affected Packages:** {packages}"
+
+_REQUIREMENTS_HEADER = "\n\n### Requirements\n"
+
+_KNOWLEDGE_TEMPLATE = "\n## Knowledge Context\n\n{knowledge}\n"
+
+_TASK_TEMPLATE = (
+    "# Task: {title}\n"
+    "\n"
+    "**Type:** {issue_type}\n"
+    "\n"
+    "## Objective\n"
+    "\n"
+    "{objective}"
+    "{requirements}"
+    "{packages}"
+)
+
+_TASK_REQUIREMENTS_TEMPLATE = "\n## Requirements\n\n{items}\n"
+
+_TASK_PACKAGES_TEMPLATE = "\n## Affected Packages\n\n{items}\n"
+
 
 async def generate_context_file(
     workspace_path: Path,
@@ -194,57 +247,50 @@ def _build_context_markdown(
     Returns:
         Complete Markdown string for context.md.
     """
-    sections: list[str] = []
-
-    sections.append(f"# Context: {issue_title}\n")
-    sections.append(_format_issue_section(issue_title, issue_body))
-    sections.append(_format_classification_section(classification))
-
-    if knowledge_context:
-        sections.append(_format_knowledge_section(knowledge_context))
-
-    return "\n".join(sections)
+    return _CONTEXT_TEMPLATE.format(
+        title=issue_title,
+        description=_format_description(issue_body),
+        classification=_format_classification_section(classification),
+        knowledge=_format_knowledge_section(knowledge_context),
+    )
 
 
-def _format_issue_section(issue_title: str, issue_body: str) -> str:
-    """Format the issue details section of context.md."""
-    lines = [
-        "## Issue Details\n",
-        f"**Title:** {issue_title}\n",
-    ]
+def _format_description(issue_body: str) -> str:
+    """Format the description block of the issue details section."""
     if issue_body:
-        lines.append(f"**Description:**\n\n{issue_body}\n")
-    else:
-        lines.append("**Description:** _No description provided._\n")
-    return "\n".join(lines)
+        return _DESCRIPTION_TEMPLATE.format(body=issue_body)
+    return _NO_DESCRIPTION
 
 
 def _format_classification_section(
     classification: IssueClassification,
 ) -> str:
     """Format the classification results section of context.md."""
-    lines = [
-        "## Classification\n",
-        f"- **Type:** {classification.issue_type.value}",
-        f"- **Completeness:** {classification.completeness_score}/5",
-    ]
-
+    packages = ""
     if classification.affected_packages:
-        packages = ", ".join(classification.affected_packages)
-        lines.append(f"- **Affected Packages:** {packages}")
+        packages = _PACKAGES_LINE_TEMPLATE.format(
+            packages=", ".join(classification.affected_packages)
+        )
 
+    requirements = ""
     if classification.requirements:
-        lines.append("\n### Requirements\n")
-        for req in classification.requirements:
-            lines.append(f"- {req}")
-
-    lines.append("")
-    return "\n".join(lines)
+        requirements = _REQUIREMENTS_HEADER + "".join(
+            f"\n- {req}" for req in classification.requirements
+        )
+
+    return _CLASSIFICATION_TEMPLATE.format(
+        issue_type=classification.issue_type.value,
+        completeness=classification.completeness_score,
+        packages=packages,
+        requirements=requirements,
+    )
 
 
 def _format_knowledge_section(knowledge_context: str) -> str:
     """Format the knowledge context section of context.md."""
-    return f"## Knowledge Context\n\n{knowledge_context}\n"
+    if not knowledge_context:
+        return ""
+    return _KNOWLEDGE_TEMPLATE.format(knowledge=knowledge_context)
 
 
 def _build_task_markdown(
@@ -262,26 +308,30 @@ def _build_task_markdown(
     Returns:
         Complete Markdown string for task.md.
     """
-    sections: list[str] = []
-
-    sections.append(f"# Task: {issue_title}\n")
-    sections.append(f"**Type:** {classification.issue_type.value}\n")
-    sections.append("## Objective\n")
-    sections.append(_build_objective(issue_title, issue_body))
-
+    requirements = ""
     if classification.requirements:
-        sections.append("## Requirements\n")
-        for i, req in enumerate(classification.requirements, 1):
-            sections.append(f"{i}. {req}")
-        sections.append("")
-
+        requirements = _TASK_REQUIREMENTS_TEMPLATE.format(
+            items="\n".join(
+                f"{i}. {req}"
+                for i, req in enumerate(classification.requirements, 1)
+            )
+        )
+
+    packages = ""
     if classification.affected_packages:
-        sections.append("## Affected Packages\n")
-        for pkg in classification.affected_packages:
-            sections.append(f"- {pkg}")
-        sections.append("")
-
-    return "\n".join(sections)
+        packages = _TASK_PACKAGES_TEMPLATE.format(
+            items="\n".join(
+                f"- {pkg}" for pkg in classification.affected_packages
+            )
+        )
+
+    return _TASK_TEMPLATE.format(
+        title=issue_title,
+        issue_type=classification.issue_type.value,
+        objective=_build_objective(issue_title, issue_body),
+        requirements=requirements,
+        packages=packages,
+    )
 
 
 def _build_objective(issue_title: str, issue_body: str) -> str:
@@ -12,12 +12,17 @@ Requirements:
 """
 
 import asyncio
+import contextlib
 import logging
+import os
+import re
 import shutil
-import stat
 import time
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator, Mapping, Optional
+from urllib.parse import urlparse
 
 from src.pipeline.classifier.models import IssueClassification
 
@@ -25,36 +30,71 @@ logger = logging.getLogger(__name__)
 
 WORKSPACE_DIR_PERMISSIONS = 0o755
 WORKSPACE_CLONE_TIMEOUT_SECONDS = 300
-
-
-@dataclass
+DEFAULT_MAX_PARALLEL_CLONES = 8
+DEFAULT_BLOB_FILTER = "blob:none"
+MIRROR_DIR_NAME = ".mirrors"
+MIRROR_FETCH_REFSPEC = "+refs/heads/*:refs/heads/*"
+# Fetches into a mirror each add a pack; consolidate them past this many
+MIRROR_REPACK_PACK_LIMIT = 32
+GITHUB_BASE_URL = "https://github.com"
+
+# Transport settings applied to every git invocation: protocol v2 sends a
+# filtered ref advertisement, and HTTP/2 lets curl multiplex the requests
+# of one fetch over a single TLS session
+GIT_TRANSPORT_CONFIG = (
+    ("protocol.version", "2"),
+    ("http.version", "HTTP/2"),
+)
+
+# Workspace directories end in the Unix timestamp of their creation
+# (see _build_workspace_path); ten digits covers 2001 through 2286
+_WORKSPACE_TIMESTAMP_PATTERN = re.compile(r"_(\d{10})$")
+
+
+@dataclass(slots=True, frozen=True)
 class WorkspaceConfig:
     """Configuration for workspace provisioning.
 
     Attributes:
         base_path: Root directory where workspaces are created.
         retention_days: Days to retain workspaces before cleanup eligibility.
+        max_parallel_clones: Upper bound on concurrent git clone processes
+            per provisioner, to avoid fd exhaustion and server throttling.
+        blob_filter: Partial-clone filter passed to ``git clone --filter``.
+            ``blob:none`` fetches file contents on demand; ``tree:0`` suits
+            pure reference checkouts. Empty or None disables filtering.
+        mirror_dir: Directory holding persistent bare mirrors that workspace
+            clones share objects with. Defaults to ``<base_path>/.mirrors``.
     """
 
     base_path: Path
     retention_days: int = 7
+    max_parallel_clones: int = DEFAULT_MAX_PARALLEL_CLONES
+    blob_filter: Optional[str] = DEFAULT_BLOB_FILTER
+    mirror_dir: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        if self.retention_days < 1:
+            raise ValueError("retention_days must be at least 1")
+        if self.max_parallel_clones < 1:
+            raise ValueError("max_parallel_clones must be at least 1")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProvisionedWorkspace:
     """Result of a successful workspace provisioning.
 
     Attributes:
         path: Absolute path to the provisioned workspace directory.
         packages: List of package names cloned into the workspace.
-        context_file: Path to the generated context.md file.
-        task_file: Path to the generated task.md file.
+        context_file: Path to the generated context.md file, if any.
+        task_file: Path to the generated task.md file, if any.
     """
 
     path: Path
     packages: list[str] = field(default_factory=list)
-    context_file: Path = field(default_factory=lambda: Path())
-    task_file: Path = field(default_factory=lambda: Path())
+    context_file: Optional[Path] = None
+    task_file: Optional[Path] = None
 
 
 class WorkspaceProvisionError(Exception):
@@ -71,6 +111,31 @@ class GitCloneError(WorkspaceProvisionError):
         super().__init__(f"Failed to clone {package_url}: {message}")
 
 
+def _build_git_env(base_env: Mapping[str, str]) -> dict[str, str]:
+    """Build a git environment carrying ``GIT_TRANSPORT_CONFIG``.
+
+    Uses git's ``GIT_CONFIG_COUNT``/``GIT_CONFIG_KEY_n``/
+    ``GIT_CONFIG_VALUE_n`` variables (git >= 2.31), appending after any
+    entries already present in the inherited environment.
+
+    Args:
+        base_env: Environment to extend, usually ``os.environ``.
+
+    Returns:
+        A new environment mapping for git subprocesses.
+    """
+    env = dict(base_env)
+    try:
+        offset = int(env.get("GIT_CONFIG_COUNT", "0"))
+    except ValueError:
+        offset = 0
+    for index, (key, value) in enumerate(GIT_TRANSPORT_CONFIG, start=offset):
+        env[f"GIT_CONFIG_KEY_{index}"] = key
+        env[f"GIT_CONFIG_VALUE_{index}"] = value
+    env["GIT_CONFIG_COUNT"] = str(offset + len(GIT_TRANSPORT_CONFIG))
+    return env
+
+
 class WorkspaceProvisioner:
     """Creates and manages workspaces for Kiro CLI execution.
 
@@ -84,6 +149,13 @@ class WorkspaceProvisioner:
 
     def __init__(self, config: WorkspaceConfig):
         self.config = config
+        self._clone_semaphore = asyncio.Semaphore(config.max_parallel_clones)
+        self._mirror_root = config.mirror_dir or (
+            config.base_path / MIRROR_DIR_NAME
+        )
+        self._mirror_locks: dict[Path, asyncio.Lock] = {}
+        self._mirror_refreshed_at: dict[Path, float] = {}
+        self._git_env = _build_git_env(os.environ)
 
     async def provision(
         self,
@@ -111,7 +183,6 @@ class WorkspaceProvisioner:
         """
         workspace_path = self._build_workspace_path(issue_id)
         self._create_workspace_directory(workspace_path)
-        self._set_directory_permissions(workspace_path)
 
         cloned_packages = await self._clone_required_packages(
             workspace_path,
@@ -133,7 +204,8 @@ class WorkspaceProvisioner:
         """Remove workspaces older than the configured retention period.
 
         Scans the base path for workspace directories and removes any
-        whose modification time exceeds the retention threshold.
+        whose modification time exceeds the retention threshold. Removals
+        run concurrently in the default thread pool.
 
         Returns:
             Number of workspaces removed.
@@ -142,12 +214,17 @@ class WorkspaceProvisioner:
             return 0
 
         retention_threshold = self._calculate_retention_threshold()
-        removed_count = 0
-
-        for workspace_dir in self._list_workspace_directories():
-            if self._is_expired(workspace_dir, retention_threshold):
-                self._remove_workspace(workspace_dir)
-                removed_count += 1
+        expired = list(self._iter_expired(retention_threshold))
+
+        # rmtree issues one unlink per file; run removals in worker threads
+        # so large checkouts do not block the event loop
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._remove_workspace, workspace_dir)
+                for workspace_dir in expired
+            )
+        )
+        removed_count = len(expired)
 
         logger.info(
             "Workspace cleanup complete",
@@ -159,7 +236,9 @@ class WorkspaceProvisioner:
         """Build the filesystem path for a workspace from an issue ID.
 
         Converts the issue ID format "owner/repo#123" into a safe
-        directory name under the base path.
+        directory name under the base path. A random token keeps names
+        unique when the same issue is provisioned twice within a second;
+        the creation timestamp stays last so cleanup can read it.
 
         Args:
             issue_id: Canonical issue identifier.
@@ -168,40 +247,35 @@ class WorkspaceProvisioner:
             Absolute path for the workspace directory.
         """
         safe_name = issue_id.replace("/", "_").replace("#", "_")
+        unique_token = uuid.uuid4().hex[:12]
         timestamp_suffix = str(int(time.time()))
-        directory_name = f"{safe_name}_{timestamp_suffix}"
+        directory_name = f"{safe_name}_{unique_token}_{timestamp_suffix}"
         return self.config.base_path / directory_name
 
     def _create_workspace_directory(self, workspace_path: Path) -> None:
-        """Create the workspace directory and any missing parents.
+        """Create the workspace directory with its permissions.
 
-        Args:
-            workspace_path: Path to create.
-
-        Raises:
-            WorkspaceProvisionError: If directory creation fails.
-        """
-        try:
-            workspace_path.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            raise WorkspaceProvisionError(
-                f"Failed to create workspace at {workspace_path}: {exc}"
-            ) from exc
-
-    def _set_directory_permissions(self, workspace_path: Path) -> None:
-        """Set appropriate permissions on the workspace directory.
+        The leaf is created with ``WORKSPACE_DIR_PERMISSIONS`` and then
+        chmod-ed to the same mode, since mkdir applies the process umask
+        (which cannot be read without setting it process-wide). The leaf
+        must not already exist, so a workspace is never silently
+        provisioned into a directory holding stale content.
 
         Args:
-            workspace_path: Path to set permissions on.
+            workspace_path: Path to create.
 
         Raises:
-            WorkspaceProvisionError: If permission setting fails.
+            WorkspaceProvisionError: If directory creation fails or the
+                directory already exists.
         """
         try:
+            workspace_path.mkdir(
+                mode=WORKSPACE_DIR_PERMISSIONS, parents=True, exist_ok=False
+            )
             workspace_path.chmod(WORKSPACE_DIR_PERMISSIONS)
         except OSError as exc:
             raise WorkspaceProvisionError(
-                f"Failed to set permissions on {workspace_path}: {exc}"
+                f"Failed to create workspace at {workspace_path}: {exc}"
             ) from exc
 
     async def _clone_required_packages(
@@ -213,7 +287,9 @@ class WorkspaceProvisioner:
         """Clone all required packages into the workspace.
 
         Determines which packages to clone from the classification and
-        issue details, then clones each one.
+        issue details, then clones them concurrently. Concurrency is bounded
+        by ``config.max_parallel_clones``. The first failed clone cancels the
+        others, which kills their git processes.
 
         Args:
             workspace_path: Workspace directory to clone into.
@@ -230,14 +306,40 @@ class WorkspaceProvisioner:
             affected_packages, issue_details
         )
 
-        cloned_packages: list[str] = []
-        for package_name, clone_url in package_urls.items():
+        try:
+            async with asyncio.TaskGroup() as clones:
+                for package_name, clone_url in package_urls.items():
+                    clones.create_task(
+                        self._clone_with_limit(
+                            workspace_path, package_name, clone_url
+                        )
+                    )
+        except ExceptionGroup as failures:
+            # Report the clone that failed first, not the group
+            raise failures.exceptions[0]
+
+        return list(package_urls)
+
+    async def _clone_with_limit(
+        self,
+        workspace_path: Path,
+        package_name: str,
+        clone_url: str,
+    ) -> None:
+        """Clone a package while holding the provisioner's clone semaphore.
+
+        Args:
+            workspace_path: Parent directory for the clone.
+            package_name: Name for the cloned directory.
+            clone_url: Git URL to clone from.
+
+        Raises:
+            GitCloneError: If the clone operation fails or times out.
+        """
+        async with self._clone_semaphore:
             await self._clone_single_package(
                 workspace_path, package_name, clone_url
             )
-            cloned_packages.append(package_name)
-
-        return cloned_packages
 
     def _resolve_package_urls(
         self,
@@ -257,18 +359,21 @@ class WorkspaceProvisioner:
         Returns:
             Mapping of package name to clone URL.
         """
-        package_urls: dict[str, str] = {}
-
         repository = issue_details.get("repository", "")
         owner = issue_details.get("owner", "")
-        if repository and owner:
-            primary_url = f"https://github.com/{owner}/{repository}.git"
-            package_urls[repository] = primary_url
+        if not owner:
+            return {}
+
+        base_url = f"{GITHUB_BASE_URL}/{owner}/"
+        package_urls: dict[str, str] = {}
+        if repository:
+            package_urls[repository] = f"{base_url}{repository}.git"
 
-        for package_name in affected_packages:
-            if package_name not in package_urls and owner:
-                url = f"https://github.com/{owner}/{package_name}.git"
-                package_urls[package_name] = url
+        package_urls.update(
+            (package_name, f"{base_url}{package_name}.git")
+            for package_name in affected_packages
+            if package_name != repository
+        )
 
         return package_urls
 
@@ -281,7 +386,12 @@ class WorkspaceProvisioner:
         """Clone a single Git repository into the workspace.
 
         Uses asyncio subprocess to run git clone without blocking
-        the event loop.
+        the event loop. When a local mirror of the repository is available,
+        the workspace is a ``--local --shared`` clone of it: objects are
+        referenced through ``objects/info/alternates`` rather than fetched
+        or copied, and pushes still go to the upstream URL. Otherwise, or if
+        the local clone fails, the package is cloned directly over the
+        network (see ``_build_clone_command``).
 
         Args:
             workspace_path: Parent directory for the clone.
@@ -292,45 +402,362 @@ class WorkspaceProvisioner:
             GitCloneError: If the clone operation fails or times out.
         """
         target_path = workspace_path / package_name
+        mirror_path = await self._ensure_mirror(clone_url)
+
+        cloned_from_mirror = False
+        if mirror_path is not None:
+            try:
+                await self._run_git(
+                    self._build_local_clone_command(
+                        clone_url, target_path, mirror_path
+                    ),
+                    clone_url,
+                )
+                cloned_from_mirror = True
+            except GitCloneError:
+                logger.warning(
+                    "Local clone from mirror failed, cloning directly",
+                    exc_info=True,
+                    extra={"mirror": str(mirror_path)},
+                )
+
+        if not cloned_from_mirror:
+            await self._run_git(
+                self._build_clone_command(clone_url, target_path),
+                clone_url,
+            )
+
+        logger.info(
+            "Cloned package",
+            extra={
+                "package": package_name,
+                "target": str(target_path),
+                "from_mirror": cloned_from_mirror,
+            },
+        )
+
+    async def _ensure_mirror(self, clone_url: str) -> Optional[Path]:
+        """Create or refresh the local bare mirror for a repository.
+
+        Mirror operations for the same repository are serialized with a
+        per-path lock while different repositories proceed in parallel.
+        A caller that waited on the lock skips its own fetch when another
+        refresh started after it asked, since that refresh already covers
+        everything it would have fetched. A failed mirror operation is not
+        fatal: the caller falls back to a direct clone.
+
+        Args:
+            clone_url: Git URL of the repository to mirror.
+
+        Returns:
+            Path to the mirror, or None if it could not be prepared.
+        """
+        mirror_path = self._mirror_path(clone_url)
+        requested_at = time.monotonic()
+        lock = self._mirror_locks.setdefault(mirror_path, asyncio.Lock())
+
+        async with lock:
+            last_refresh = self._mirror_refreshed_at.get(mirror_path)
+            if last_refresh is not None and last_refresh >= requested_at:
+                return mirror_path
+
+            refresh_started = time.monotonic()
+            try:
+                await self._update_or_clone_mirror(mirror_path, clone_url)
+            except (GitCloneError, OSError):
+                logger.warning(
+                    "Mirror unavailable, cloning directly",
+                    exc_info=True,
+                    extra={"mirror": str(mirror_path)},
+                )
+                return None
+            self._mirror_refreshed_at[mirror_path] = refresh_started
+
+        return mirror_path
+
+    async def _update_or_clone_mirror(
+        self, mirror_path: Path, clone_url: str
+    ) -> None:
+        """Fetch into an existing mirror, or create it.
+
+        The first request for a repository creates a bare mirror of its
+        branches; later requests fetch only new objects. Automatic gc is
+        disabled on the mirror because workspaces share its object store,
+        so fetched packs are consolidated by ``_repack_mirror`` instead.
+
+        Args:
+            mirror_path: Location of the bare mirror.
+            clone_url: Git URL of the repository to mirror.
 
+        Raises:
+            GitCloneError: If a git command fails.
+            OSError: If the mirror cannot be moved into place.
+        """
+        if mirror_path.is_dir():
+            await self._run_git(
+                self._build_mirror_fetch_command(mirror_path), clone_url
+            )
+            await self._repack_mirror(mirror_path, clone_url)
+            return
+
+        await self._clone_mirror(mirror_path, clone_url)
+
+    async def _clone_mirror(self, mirror_path: Path, clone_url: str) -> None:
+        """Create a bare mirror of a repository's branches.
+
+        The mirror is cloned and configured in a temporary sibling directory
+        and renamed into place only once complete, so an interrupted or
+        failed clone never leaves a half-configured mirror behind.
+
+        Args:
+            mirror_path: Location of the bare mirror.
+            clone_url: Git URL of the repository to mirror.
+
+        Raises:
+            GitCloneError: If a git command fails.
+            OSError: If the mirror cannot be moved into place.
+        """
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = mirror_path.with_name(
+            f"{mirror_path.name}.{uuid.uuid4().hex[:12]}.tmp"
+        )
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "clone",
-                "--depth",
-                "1",
+            await self._run_git(
+                [
+                    "git",
+                    "clone",
+                    "--bare",
+                    "--config",
+                    "gc.auto=0",
+                    clone_url,
+                    str(staging_path),
+                ],
                 clone_url,
-                str(target_path),
+            )
+            # A bare clone records no fetch refspec, and git rejects one
+            # passed to the clone itself since it duplicates the clone's
+            # own branch mapping. Track branches only so later updates
+            # skip pull-request refs
+            await self._run_git(
+                [
+                    "git",
+                    "-C",
+                    str(staging_path),
+                    "config",
+                    "remote.origin.fetch",
+                    MIRROR_FETCH_REFSPEC,
+                ],
+                clone_url,
+            )
+            staging_path.rename(mirror_path)
+        except BaseException:
+            await asyncio.to_thread(
+                shutil.rmtree, staging_path, ignore_errors=True
+            )
+            raise
+
+    async def _repack_mirror(self, mirror_path: Path, clone_url: str) -> None:
+        """Consolidate a mirror's packs once enough fetches have piled up.
+
+        Every fetch keeps its objects as a pack (``fetch.unpackLimit=1``),
+        so packs accumulate with gc disabled. Unreachable objects are kept,
+        since workspace clones may still reference them. A failed repack
+        leaves the mirror usable and is only logged.
+
+        Args:
+            mirror_path: Location of the bare mirror.
+            clone_url: Git URL of the repository, used for error reporting.
+        """
+        pack_dir = mirror_path / "objects" / "pack"
+        try:
+            with os.scandir(pack_dir) as entries:
+                pack_count = sum(entry.name.endswith(".pack") for entry in entries)
+        except OSError:
+            return
+        if pack_count < MIRROR_REPACK_PACK_LIMIT:
+            return
+
+        try:
+            await self._run_git(
+                [
+                    "git",
+                    "-C",
+                    str(mirror_path),
+                    "repack",
+                    "-a",
+                    "-d",
+                    "--keep-unreachable",
+                    "--quiet",
+                ],
+                clone_url,
+            )
+        except GitCloneError:
+            logger.warning(
+                "Mirror repack failed",
+                exc_info=True,
+                extra={"mirror": str(mirror_path)},
+            )
+
+    def _build_mirror_fetch_command(self, mirror_path: Path) -> list[str]:
+        """Build the git argv that refreshes a mirror's branches.
+
+        The refspec is passed explicitly rather than read from the mirror's
+        config, so a mirror missing its configured refspec still advances.
+        Fetched objects are always kept as a pack instead of being exploded
+        into loose objects that automatic gc would never collect.
+
+        Args:
+            mirror_path: Location of the bare mirror.
+
+        Returns:
+            Command and arguments for create_subprocess_exec.
+        """
+        return [
+            "git",
+            "-C",
+            str(mirror_path),
+            "-c",
+            "fetch.unpackLimit=1",
+            "fetch",
+            "--prune",
+            "origin",
+            MIRROR_FETCH_REFSPEC,
+        ]
+
+    def _mirror_path(self, clone_url: str) -> Path:
+        """Map a clone URL to its mirror location.
+
+        ``https://github.com/owner/repo.git`` maps to
+        ``<mirror_dir>/owner/repo.git``.
+
+        Args:
+            clone_url: Git URL of the repository.
+
+        Returns:
+            Path of the bare mirror for the repository.
+        """
+        repo_path = urlparse(clone_url).path.strip("/")
+        if not repo_path.endswith(".git"):
+            repo_path = f"{repo_path}.git"
+        return self._mirror_root / repo_path
+
+    async def _run_git(self, command: list[str], clone_url: str) -> None:
+        """Run a git command, raising GitCloneError on any failure.
+
+        A command that outlives ``WORKSPACE_CLONE_TIMEOUT_SECONDS``, or whose
+        caller is cancelled, is killed.
+
+        Args:
+            command: Command and arguments for create_subprocess_exec.
+            clone_url: Repository URL, used for error reporting.
+
+        Raises:
+            GitCloneError: If git fails, times out, or cannot be executed.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                env=self._git_env,
             )
+        except OSError as exc:
+            raise GitCloneError(
+                clone_url, f"Failed to execute git: {exc}"
+            ) from exc
 
+        try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
                 timeout=WORKSPACE_CLONE_TIMEOUT_SECONDS,
             )
-
-            if process.returncode != 0:
-                error_output = stderr.decode().strip()
-                raise GitCloneError(clone_url, error_output)
-
-            logger.info(
-                "Cloned package",
-                extra={
-                    "package": package_name,
-                    "target": str(target_path),
-                },
-            )
-
         except asyncio.TimeoutError as exc:
+            # wait_for only abandons communicate(); stop git itself so it
+            # cannot finish writing after the caller has moved on
+            await self._kill_git(process)
             raise GitCloneError(
                 clone_url,
                 f"Clone timed out after {WORKSPACE_CLONE_TIMEOUT_SECONDS}s",
             ) from exc
-        except OSError as exc:
-            raise GitCloneError(
-                clone_url, f"Failed to execute git: {exc}"
-            ) from exc
+        except asyncio.CancelledError:
+            await self._kill_git(process)
+            raise
+
+        if process.returncode != 0:
+            error_output = stderr.decode().strip()
+            raise GitCloneError(clone_url, error_output)
+
+    @staticmethod
+    async def _kill_git(process: asyncio.subprocess.Process) -> None:
+        """Kill a git subprocess that is still running and reap it.
+
+        Args:
+            process: The git subprocess.
+        """
+        if process.returncode is not None:
+            return
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
+    def _build_local_clone_command(
+        self,
+        clone_url: str,
+        target_path: Path,
+        mirror_path: Path,
+    ) -> list[str]:
+        """Build the git argv for a shared local clone of a mirror.
+
+        Args:
+            clone_url: Upstream Git URL, configured as the push URL.
+            target_path: Directory to clone into.
+            mirror_path: Local mirror to clone from.
+
+        Returns:
+            Command and arguments for create_subprocess_exec.
+        """
+        return [
+            "git",
+            "clone",
+            "--local",
+            "--shared",
+            "--single-branch",
+            "--no-tags",
+            "--config",
+            f"remote.origin.pushurl={clone_url}",
+            str(mirror_path),
+            str(target_path),
+        ]
+
+    def _build_clone_command(
+        self, clone_url: str, target_path: Path
+    ) -> list[str]:
+        """Build the git argv for a shallow, partial network clone.
+
+        The clone is shallow, single-branch, tag-free, and (by default)
+        blob-filtered; with the protocol v2 setting from
+        ``GIT_TRANSPORT_CONFIG`` only the refs and objects needed for HEAD
+        are transferred up front.
+
+        Args:
+            clone_url: Git URL to clone from.
+            target_path: Directory to clone into.
+
+        Returns:
+            Command and arguments for create_subprocess_exec.
+        """
+        command = [
+            "git",
+            "clone",
+            "--depth",
+            "1",
+            "--no-tags",
+            "--single-branch",
+        ]
+        if self.config.blob_filter:
+            command.append(f"--filter={self.config.blob_filter}")
+        command.extend([clone_url, str(target_path)])
+        return command
 
     def _calculate_retention_threshold(self) -> float:
         """Calculate the timestamp threshold for workspace expiration.
@@ -341,31 +768,66 @@ class WorkspaceProvisioner:
         retention_seconds = self.config.retention_days * 86400
         return time.time() - retention_seconds
 
-    def _list_workspace_directories(self) -> list[Path]:
-        """List all workspace directories under the base path.
+    def _iter_expired(self, retention_threshold: float) -> Iterator[Path]:
+        """Yield workspace directories older than the retention threshold.
+
+        A single ``os.scandir`` pass both lists the base path and supplies
+        each entry's type, so no extra syscalls are issued per workspace.
+        Age is read from the creation timestamp embedded in the directory
+        name; only directories without one fall back to ``stat``. Files,
+        symlinks, and the mirror cache are skipped.
+
+        Args:
+            retention_threshold: Unix timestamp threshold.
+
+        Yields:
+            Paths of expired workspace directories.
+        """
+        mirror_root = str(self._mirror_root)
+        with os.scandir(self.config.base_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.path == mirror_root:
+                    continue
+                created_at = self._parse_workspace_timestamp(entry.name)
+                if created_at is not None:
+                    expired = created_at < retention_threshold
+                else:
+                    expired = self._is_expired(entry, retention_threshold)
+                if expired:
+                    yield Path(entry.path)
+
+    @staticmethod
+    def _parse_workspace_timestamp(directory_name: str) -> Optional[int]:
+        """Extract the creation timestamp from a workspace directory name.
+
+        Args:
+            directory_name: Name of the workspace directory.
 
         Returns:
-            List of directory paths (excludes files).
+            Unix timestamp, or None if the name carries no timestamp.
         """
-        return [
-            entry
-            for entry in self.config.base_path.iterdir()
-            if entry.is_dir()
-        ]
+        match = _WORKSPACE_TIMESTAMP_PATTERN.search(directory_name)
+        if match is None:
+            return None
+        return int(match.group(1))
 
     def _is_expired(
-        self, workspace_dir: Path, retention_threshold: float
+        self, entry: os.DirEntry, retention_threshold: float
     ) -> bool:
-        """Check if a workspace directory has exceeded its retention period.
+        """Check a workspace's age from its modification time.
+
+        Fallback for directories whose name carries no creation timestamp.
 
         Args:
-            workspace_dir: Path to the workspace directory.
+            entry: Directory entry for the workspace.
             retention_threshold: Unix timestamp threshold.
 
         Returns:
             True if the workspace is older than the threshold.
         """
-        modification_time = workspace_dir.stat().st_mtime
+        modification_time = entry.stat(follow_symlinks=False).st_mtime
         return modification_time < retention_threshold
 
     def _remove_workspace(self, workspace_dir: Path) -> None:
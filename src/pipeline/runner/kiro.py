@@ -15,16 +15,29 @@ Requirements:
 """
 
 import asyncio
+import contextlib
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CAPTURED_BYTES = 1024 * 1024
+DEFAULT_TERMINATE_GRACE_SECONDS = 5.0
+STREAM_READ_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+# Exit code reported when kiro-cli could not be started or was stopped
+FAILED_EXIT_CODE = -1
+
+_TIMEOUT_MESSAGE = "Process timed out after {seconds}s"
+_START_FAILURE_MESSAGE = "Failed to start kiro-cli: {error}"
+
+
+@dataclass(slots=True, frozen=True)
 class KiroResult:
     """Result of a Kiro CLI execution.
 
@@ -43,6 +56,146 @@ class KiroResult:
     duration_seconds: float
 
 
+def _trim_line(line: bytearray, max_bytes: int) -> int:
+    """Cut a partial line to its last ``max_bytes`` bytes in place.
+
+    The cut is moved forward past UTF-8 continuation bytes so the kept
+    end starts on a character boundary.
+
+    Args:
+        line: Line bytes read so far.
+        max_bytes: Maximum number of bytes to keep.
+
+    Returns:
+        Number of bytes removed from the start of the line.
+    """
+    cut = len(line) - max_bytes
+    if cut <= 0:
+        return 0
+    while cut < len(line) and line[cut] & 0xC0 == 0x80:
+        cut += 1
+    del line[:cut]
+    return cut
+
+
+class _CapturedOutput:
+    """Bounded capture of one output stream.
+
+    Keeps the first half of the byte budget as a fixed head and the second
+    half as a rolling tail, so memory stays constant however long kiro-cli
+    runs while the start and the end of the output (where diagnostics
+    usually are) are both preserved. Sizes are measured on decoded text.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._head: list[str] = []
+        self._tail: deque[str] = deque()
+        self._head_budget = max_bytes // 2
+        self._tail_budget = max_bytes - self._head_budget
+        self._head_bytes = 0
+        self._tail_bytes = 0
+        self._dropped_bytes = 0
+
+    def append(self, line: str, dropped: int = 0) -> None:
+        """Record one line, evicting the oldest tail lines when over budget.
+
+        ``dropped`` is the number of bytes already cut from the start of
+        the line (see ``KiroRunner._read_stream``).
+        """
+        self._dropped_bytes += dropped
+        size = len(line) + 1
+        if (
+            not self._tail
+            and not dropped
+            and self._head_bytes + size <= self._head_budget
+        ):
+            self._head.append(line)
+            self._head_bytes += size
+            return
+
+        self._tail.append(line)
+        self._tail_bytes += size
+        while self._tail_bytes > self._tail_budget and len(self._tail) > 1:
+            evicted = len(self._tail.popleft()) + 1
+            self._tail_bytes -= evicted
+            self._dropped_bytes += evicted
+        if self._tail_bytes > self._tail_budget:
+            # A line longer than the tail budget is cut to its end
+            excess = self._tail_bytes - self._tail_budget
+            self._tail[0] = self._tail[0][excess:]
+            self._tail_bytes -= excess
+            self._dropped_bytes += excess
+
+    def render(self) -> str:
+        """Join the captured lines, marking where output was dropped."""
+        if not self._dropped_bytes:
+            return "\n".join(chain(self._head, self._tail))
+        marker = f"... <truncated {self._dropped_bytes} bytes> ..."
+        return "\n".join(chain(self._head, (marker,), self._tail))
+
+
+class _CapturedBytes:
+    """Bounded capture of one output stream kept as raw bytes.
+
+    Used when no consumer needs individual lines: chunks are appended to
+    a head and a rolling tail ``bytearray`` and decoded once in
+    ``render``. Truncation is aligned to line boundaries, so the rendered
+    text matches what ``_CapturedOutput`` produces for the same output;
+    only a last line longer than the tail budget is cut mid-line.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._head_budget = max_bytes // 2
+        self._tail_budget = max_bytes - self._head_budget
+        self._head_full = False
+        self._dropped_bytes = 0
+
+    def write(self, chunk: bytes) -> None:
+        """Record a chunk, trimming the tail to whole lines within budget."""
+        if not self._head_full:
+            space = self._head_budget - len(self._head)
+            if len(chunk) <= space:
+                self._head += chunk
+                return
+            self._head_full = True
+            self._head += chunk[:space]
+            chunk = chunk[space:]
+            # Hand a partial last head line over to the tail
+            line_end = self._head.rfind(b"\n") + 1
+            chunk = bytes(self._head[line_end:]) + chunk
+            del self._head[line_end:]
+
+        self._tail += chunk
+        excess = len(self._tail) - self._tail_budget
+        if excess <= 0:
+            return
+        line_end = self._tail.find(b"\n", excess - 1)
+        if line_end == -1 or line_end + 1 == len(self._tail):
+            # Keep the last line whole when it fits the budget
+            line_end = self._tail.rfind(b"\n", 0, len(self._tail) - 1)
+        cut = line_end + 1
+        if cut < excess:
+            # A longer last line (newline-free output such as \r progress
+            # redraws) is cut to its end
+            self._dropped_bytes += _trim_line(self._tail, self._tail_budget)
+            return
+        del self._tail[:cut]
+        self._dropped_bytes += cut
+
+    def render(self) -> str:
+        """Decode the captured bytes, marking where output was dropped."""
+        if not self._dropped_bytes:
+            data = bytes(self._head + self._tail)
+        else:
+            # The head always ends on a line boundary once truncation starts
+            marker = f"... <truncated {self._dropped_bytes} bytes> ...\n"
+            data = b"".join((self._head, marker.encode(), self._tail))
+        text = data.decode("utf-8", errors="replace")
+        return text[:-1] if text.endswith("\n") else text
+
+
 class KiroRunner:
     """Manages Kiro CLI subprocess execution.
 
@@ -53,11 +206,26 @@ class KiroRunner:
     Attributes:
         kiro_path: Filesystem path to the kiro-cli executable.
         timeout_seconds: Maximum execution time before the process is killed.
+        max_captured_bytes: Upper bound on output retained per stream in the
+            result; the middle of longer output is dropped.
+        terminate_grace_seconds: Time allowed for kiro-cli to exit after
+            SIGTERM on timeout before it is sent SIGKILL.
     """
 
-    def __init__(self, kiro_path: str, timeout_seconds: int = 3600):
+    def __init__(
+        self,
+        kiro_path: str,
+        timeout_seconds: int = 3600,
+        max_captured_bytes: int = DEFAULT_MAX_CAPTURED_BYTES,
+        terminate_grace_seconds: float = DEFAULT_TERMINATE_GRACE_SECONDS,
+    ):
         self.kiro_path = kiro_path
         self.timeout_seconds = timeout_seconds
+        self.max_captured_bytes = max_captured_bytes
+        self.terminate_grace_seconds = terminate_grace_seconds
+        self._timeout_message = _TIMEOUT_MESSAGE.format(
+            seconds=timeout_seconds
+        )
 
     async def run(
         self,
@@ -79,20 +247,38 @@ class KiroRunner:
             KiroResult with exit code, captured output, and duration.
         """
         start_time = time.monotonic()
+        # Lines are only needed by the callback and debug logging; without
+        # either, output is kept as raw bytes and decoded once at the end
+        capture_type = (
+            _CapturedBytes
+            if log_callback is None and not logger.isEnabledFor(logging.DEBUG)
+            else _CapturedOutput
+        )
+        stdout_capture = capture_type(self.max_captured_bytes)
+        stderr_capture = capture_type(self.max_captured_bytes)
 
         try:
             process = await self._start_process(workspace_path, task_file)
-            stdout, stderr = await self._collect_output_with_timeout(
-                process, log_callback
-            )
+            try:
+                async with asyncio.timeout(self.timeout_seconds):
+                    await self._collect_output(
+                        process, log_callback, stdout_capture, stderr_capture
+                    )
+            except TimeoutError:
+                return await self._handle_timeout(
+                    process,
+                    start_time,
+                    stdout_capture.render(),
+                    stderr_capture.render(),
+                )
             exit_code = process.returncode or 0
-        except asyncio.TimeoutError:
-            return self._handle_timeout(process, start_time)
         except OSError as exc:
             return self._handle_os_error(exc, start_time)
 
         duration = time.monotonic() - start_time
-        return self._build_result(exit_code, stdout, stderr, duration)
+        return self._build_result(
+            exit_code, stdout_capture.render(), stderr_capture.render(), duration
+        )
 
     async def _start_process(
         self, workspace_path: Path, task_file: Path
@@ -128,46 +314,47 @@ class KiroRunner:
             stderr=asyncio.subprocess.PIPE,
         )
 
-    async def _collect_output_with_timeout(
+    async def _collect_output(
         self,
         process: asyncio.subprocess.Process,
         log_callback: Optional[Callable[[str], None]],
-    ) -> tuple:
-        """Stream and collect process output within the timeout window.
+        stdout_capture: "_CapturedOutput | _CapturedBytes",
+        stderr_capture: "_CapturedOutput | _CapturedBytes",
+    ) -> None:
+        """Stream and collect process output until the process exits.
 
         Reads stdout and stderr concurrently, streaming each line to
-        the logger and optional callback. Raises TimeoutError if the
-        process exceeds the configured timeout.
+        the logger and optional callback. Only a bounded head and tail of
+        each stream is retained (see ``max_captured_bytes``). Output lands
+        in the captures as it arrives, so output read before a timeout
+        cancels this coroutine is kept. Byte captures receive raw chunks
+        without any line splitting.
 
         Args:
             process: Running subprocess.
             log_callback: Optional per-line callback.
-
-        Returns:
-            Tuple of (stdout_text, stderr_text).
-
-        Raises:
-            asyncio.TimeoutError: If the process exceeds the timeout.
+            stdout_capture: Capture receiving stdout.
+            stderr_capture: Capture receiving stderr.
         """
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
+        if isinstance(stdout_capture, _CapturedBytes):
+            await self._gather_streams(
+                lambda: self._drain_stream(process.stdout, stdout_capture),
+                lambda: self._drain_stream(process.stderr, stderr_capture),
+                process,
+            )
+            return
 
         async def stream_stdout():
-            async for line in self._read_stream(process.stdout):
-                stdout_lines.append(line)
+            async for line, dropped in self._read_stream(process.stdout):
+                stdout_capture.append(line, dropped)
                 self._emit_line("stdout", line, log_callback)
 
         async def stream_stderr():
-            async for line in self._read_stream(process.stderr):
-                stderr_lines.append(line)
+            async for line, dropped in self._read_stream(process.stderr):
+                stderr_capture.append(line, dropped)
                 self._emit_line("stderr", line, log_callback)
 
-        await asyncio.wait_for(
-            self._gather_streams(stream_stdout, stream_stderr, process),
-            timeout=self.timeout_seconds,
-        )
-
-        return "\n".join(stdout_lines), "\n".join(stderr_lines)
+        await self._gather_streams(stream_stdout, stream_stderr, process)
 
     async def _gather_streams(
         self,
@@ -175,35 +362,75 @@ class KiroRunner:
         stderr_reader: Callable,
         process: asyncio.subprocess.Process,
     ) -> None:
-        """Run stdout/stderr readers and wait for process exit.
+        """Run stdout/stderr readers and wait for process exit concurrently.
+
+        All three complete together, so ``process.returncode`` is set once
+        the gather returns.
 
         Args:
             stdout_reader: Coroutine reading stdout.
             stderr_reader: Coroutine reading stderr.
             process: The subprocess to wait on.
         """
-        await asyncio.gather(stdout_reader(), stderr_reader())
-        await process.wait()
+        await asyncio.gather(stdout_reader(), stderr_reader(), process.wait())
+
+    async def _drain_stream(
+        self,
+        stream: Optional[asyncio.StreamReader],
+        capture: _CapturedBytes,
+    ) -> None:
+        """Copy raw chunks from an async stream into a byte capture.
+
+        Args:
+            stream: Subprocess stdout or stderr stream.
+            capture: Capture receiving the chunks.
+        """
+        if stream is None:
+            return
+
+        while chunk := await stream.read(STREAM_READ_CHUNK_SIZE):
+            capture.write(chunk)
 
     async def _read_stream(
         self, stream: Optional[asyncio.StreamReader]
     ):
         """Yield decoded lines from an async stream.
 
+        Reads in large chunks and splits lines in memory, so verbose output
+        costs one await per chunk rather than one per line. Only each new
+        chunk is searched for newlines, and a trailing partial line is held
+        until more data arrives or the stream ends. Lines longer than
+        ``max_captured_bytes`` are cut to their last ``max_captured_bytes``
+        bytes as they are read, so a line without a newline cannot grow
+        without bound.
+
         Args:
             stream: Subprocess stdout or stderr stream.
 
         Yields:
-            Each line as a stripped string.
+            Each line without its trailing newline, and the number of bytes
+            cut from its start.
         """
         if stream is None:
             return
 
-        while True:
-            raw_line = await stream.readline()
-            if not raw_line:
-                break
-            yield raw_line.decode("utf-8", errors="replace").rstrip("\n")
+        pending = bytearray()
+        dropped = 0
+        while chunk := await stream.read(STREAM_READ_CHUNK_SIZE):
+            view = memoryview(chunk)
+            start = 0
+            while (line_end := chunk.find(b"\n", start)) != -1:
+                pending += view[start:line_end]
+                dropped += _trim_line(pending, self.max_captured_bytes)
+                yield pending.decode("utf-8", errors="replace"), dropped
+                pending.clear()
+                dropped = 0
+                start = line_end + 1
+            pending += view[start:]
+            dropped += _trim_line(pending, self.max_captured_bytes)
+
+        if pending:
+            yield pending.decode("utf-8", errors="replace"), dropped
 
     def _emit_line(
         self,
@@ -226,31 +453,48 @@ class KiroRunner:
         if log_callback is not None:
             log_callback(f"[{stream_name}] {line}")
 
-    def _handle_timeout(
+    async def _handle_timeout(
         self,
         process: asyncio.subprocess.Process,
         start_time: float,
+        stdout: str,
+        stderr: str,
     ) -> KiroResult:
-        """Kill the process and return a timeout failure result.
+        """Stop the process and return a timeout failure result.
+
+        Sends SIGTERM so kiro-cli can flush its output, escalates to
+        SIGKILL if it has not exited within the grace period, and reaps the
+        process so no zombie is left behind. Output captured before the
+        timeout is kept in the result.
 
         Args:
             process: The timed-out subprocess.
             start_time: Monotonic timestamp when execution started.
+            stdout: Standard output captured before the timeout.
+            stderr: Standard error captured before the timeout.
 
         Returns:
             KiroResult indicating timeout failure.
         """
-        process.kill()
+        with contextlib.suppress(ProcessLookupError):
+            process.terminate()
+        try:
+            await asyncio.wait_for(
+                process.wait(), timeout=self.terminate_grace_seconds
+            )
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+
         duration = time.monotonic() - start_time
-        logger.error(
-            "kiro-cli timed out after %ds",
-            self.timeout_seconds,
-        )
+        timeout_message = self._timeout_message
+        logger.error("kiro-cli: %s", timeout_message)
         return KiroResult(
             success=False,
-            exit_code=-1,
-            stdout="",
-            stderr=f"Process timed out after {self.timeout_seconds}s",
+            exit_code=FAILED_EXIT_CODE,
+            stdout=stdout,
+            stderr=f"{stderr}\n{timeout_message}" if stderr else timeout_message,
             duration_seconds=duration,
         )
 
@@ -269,12 +513,13 @@ class KiroRunner:
             KiroResult indicating OS error failure.
         """
         duration = time.monotonic() - start_time
-        logger.error("Failed to start kiro-cli: %s", exc)
+        message = _START_FAILURE_MESSAGE.format(error=exc)
+        logger.error(message)
         return KiroResult(
             success=False,
-            exit_code=-1,
+            exit_code=FAILED_EXIT_CODE,
             stdout="",
-            stderr=f"Failed to start kiro-cli: {exc}",
+            stderr=message,
             duration_seconds=duration,
         )
 
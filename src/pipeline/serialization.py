@@ -0,0 +1,88 @@
+"""JSON serialization helpers for the pipeline.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise. The standard library, with NaN and infinity
+disallowed, defines which values and documents are accepted, so what is
+stored does not depend on whether orjson is installed. Both paths produce
+and accept plain ``str`` JSON documents, which is what asyncpg binds to
+``::jsonb`` query parameters.
+
+Example:
+    >>> from src.pipeline.serialization import json_dumps, json_loads
+    >>> json_loads(json_dumps({"error": "timeout"}))
+    {'error': 'timeout'}
+"""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# orjson decodes integers outside the 64-bit range as floats; documents with
+# a run of 19 or more digits may hold one and are decoded with the standard
+# library, which keeps them exact
+_WIDE_NUMBER = re.compile(r"\d{19}")
+_WIDE_NUMBER_BYTES = re.compile(rb"\d{19}")
+
+
+def _reject_constant(name: str) -> Any:
+    """Refuse the NaN and Infinity tokens the standard library would accept."""
+    raise ValueError(f"Out of range float value {name} is not valid JSON")
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON document.
+
+    orjson's document is used only when it decodes back to the value.
+    Otherwise the value is serialized with the standard library, which
+    rejects what orjson would silently convert: non-finite floats (written
+    as ``null``) and types JSON has no form for, such as datetimes, UUIDs
+    and enums. Values orjson cannot encode at all, such as integers wider
+    than 64 bits, also go through the standard library.
+
+    Args:
+        value: JSON-compatible value to serialize.
+
+    Returns:
+        The JSON document as a string.
+
+    Raises:
+        TypeError: If the value is not JSON serializable.
+        ValueError: If the value holds a NaN or infinite float.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value)
+        except TypeError:
+            pass
+        else:
+            if orjson.loads(encoded) == value:
+                return encoded.decode()
+    return json.dumps(value, allow_nan=False)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+
+    Documents that may hold integers wider than 64 bits are decoded with
+    the standard library, so both paths return the same values. Neither
+    path accepts the non-standard ``NaN`` and ``Infinity`` tokens.
+
+    Args:
+        data: The JSON document as text or UTF-8 bytes.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        pattern = _WIDE_NUMBER_BYTES if isinstance(data, bytes) else _WIDE_NUMBER
+        if pattern.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data, parse_constant=_reject_constant)
@@ -6,32 +6,70 @@ This module manages issue progression through pipeline stages:
 
 State is persisted to PostgreSQL with optimistic locking for
 concurrent update protection.
+
+Exports are resolved lazily (PEP 562) so that importing a model such as
+``PipelineStage`` does not also load asyncpg through the repository.
 """
 
-from src.pipeline.state.models import (
-    PipelineStage,
-    PipelineState,
-    StateTransition,
-    VALID_TRANSITIONS,
-    is_terminal_stage,
-    is_valid_transition,
-)
-from src.pipeline.state.machine import (
-    InvalidTransitionError,
-    PipelineStateMachine,
-    StateNotFoundError,
-    StateRepository,
-    VersionConflictError,
-)
-from src.pipeline.state.repository import (
-    DatabaseError,
-    PostgresStateRepository,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.pipeline.state.models import (
+        PipelineStage,
+        PipelineState,
+        STAGE_BY_VALUE,
+        STAGE_VALUE,
+        StateTransition,
+        VALID_TRANSITIONS,
+        is_terminal_stage,
+        is_valid_transition,
+    )
+    from src.pipeline.state.machine import (
+        InvalidTransitionError,
+        PipelineStateMachine,
+        RetryPolicy,
+        StateNotFoundError,
+        StateRepository,
+        VersionConflictError,
+    )
+    from src.pipeline.state.repository import (
+        DatabaseError,
+        PostgresStateRepository,
+    )
+    from src.pipeline.state.memory import InMemoryStateRepository
+
+_MODELS = "src.pipeline.state.models"
+_MACHINE = "src.pipeline.state.machine"
+_REPOSITORY = "src.pipeline.state.repository"
+_MEMORY = "src.pipeline.state.memory"
+
+_LAZY_EXPORTS = {
+    "PipelineStage": _MODELS,
+    "PipelineState": _MODELS,
+    "STAGE_BY_VALUE": _MODELS,
+    "STAGE_VALUE": _MODELS,
+    "StateTransition": _MODELS,
+    "VALID_TRANSITIONS": _MODELS,
+    "is_terminal_stage": _MODELS,
+    "is_valid_transition": _MODELS,
+    "InvalidTransitionError": _MACHINE,
+    "PipelineStateMachine": _MACHINE,
+    "RetryPolicy": _MACHINE,
+    "StateNotFoundError": _MACHINE,
+    "StateRepository": _MACHINE,
+    "VersionConflictError": _MACHINE,
+    "DatabaseError": _REPOSITORY,
+    "PostgresStateRepository": _REPOSITORY,
+    "InMemoryStateRepository": _MEMORY,
+}
 
 __all__ = [
     # Models
     "PipelineStage",
     "PipelineState",
+    "STAGE_BY_VALUE",
+    "STAGE_VALUE",
     "StateTransition",
     "VALID_TRANSITIONS",
     "is_terminal_stage",
@@ -39,10 +77,26 @@ __all__ = [
     # State machine
     "InvalidTransitionError",
     "PipelineStateMachine",
+    "RetryPolicy",
     "StateNotFoundError",
     "StateRepository",
     "VersionConflictError",
     # Repository
     "DatabaseError",
     "PostgresStateRepository",
+    # In-memory repository
+    "InMemoryStateRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
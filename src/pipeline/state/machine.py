@@ -14,14 +14,35 @@ The state machine depends on a StateRepository interface for persistence,
 which is implemented separately in repository.py (task 4.2).
 """
 
+import asyncio
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    runtime_checkable,
+)
 
 from src.pipeline.state.models import (
     PipelineStage,
     PipelineState,
+    STAGE_VALUE,
     StateTransition,
     is_valid_transition,
 )
@@ -29,6 +50,19 @@ from src.pipeline.state.models import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Shared read-only stand-in for omitted transition details; StateTransition
+# copies details into its own dict, so no per-call empty dict is needed
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# Error stored when a transition to FAILED carries no error details
+_DEFAULT_FAILED_ERROR = "Unknown error (no details provided)"
+
+# Defaults for the per-process cache of states read for writes
+DEFAULT_STATE_CACHE_TTL_SECONDS = 2.0
+DEFAULT_STATE_CACHE_SIZE = 4096
+
 
 class InvalidTransitionError(Exception):
     """Raised when an invalid state transition is attempted.
@@ -77,10 +111,17 @@ class VersionConflictError(Exception):
     This exception is raised when attempting to update a state that has
     been modified by another process since it was read.
 
+    The conflict is transient: retrying the operation against the current
+    state may succeed, so ``retryable`` is always True. When the state was
+    re-read while diagnosing the conflict it is attached as
+    ``current_state`` so a retry can start from it without reading again.
+
     Attributes:
         issue_id: The issue ID with the conflict.
         expected_version: The version that was expected.
         actual_version: The actual version in the database.
+        current_state: The state as read after the conflict, if known.
+        retryable: Whether retrying the operation may succeed.
     """
 
     def __init__(
@@ -88,16 +129,50 @@ class VersionConflictError(Exception):
         issue_id: str,
         expected_version: int,
         actual_version: Optional[int] = None,
+        current_state: Optional[PipelineState] = None,
     ):
         self.issue_id = issue_id
         self.expected_version = expected_version
         self.actual_version = actual_version
+        self.current_state = current_state
+        self.retryable = True
         message = f"Version conflict for issue {issue_id}: expected {expected_version}"
         if actual_version is not None:
             message += f", found {actual_version}"
         super().__init__(message)
 
 
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """Retry settings for optimistic-locking conflicts.
+
+    Attributes:
+        max_attempts: Total attempts per operation, including the first.
+            A value of 1 disables retries.
+        base_delay: Base delay in seconds for exponential backoff.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.01
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0:
+            raise ValueError("base_delay must not be negative")
+
+    def backoff(self, attempt: int) -> float:
+        """Calculate backoff delay with full jitter.
+
+        Args:
+            attempt: The attempt that just failed (0-indexed).
+
+        Returns:
+            Delay in seconds before the next attempt.
+        """
+        return random.uniform(0, self.base_delay * (2 ** attempt))
+
+
 @runtime_checkable
 class StateRepository(Protocol):
     """Protocol defining the interface for pipeline state persistence.
@@ -133,6 +208,20 @@ class StateRepository(Protocol):
         """
         ...
 
+    async def get_many(
+        self, issue_ids: Sequence[str]
+    ) -> List[Optional[PipelineState]]:
+        """Get several pipeline states in one round trip.
+
+        Args:
+            issue_ids: The canonical issue identifiers.
+
+        Returns:
+            The states in the order of issue_ids, with None for each
+            issue that does not exist.
+        """
+        ...
+
     async def list_by_stage(self, stage: PipelineStage) -> List[PipelineState]:
         """List all pipeline states in a given stage.
 
@@ -144,6 +233,28 @@ class StateRepository(Protocol):
         """
         ...
 
+    def iter_by_stage(self, stage: PipelineStage) -> AsyncIterator[PipelineState]:
+        """Stream pipeline states in a given stage.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            Async iterator over the pipeline states in the stage.
+        """
+        ...
+
+    async def count_by_stage(self, stage: PipelineStage) -> int:
+        """Count pipeline states in a given stage.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            Number of pipeline states in the stage.
+        """
+        ...
+
     async def update_with_version(self, state: PipelineState) -> bool:
         """Update state with optimistic locking.
 
@@ -162,6 +273,122 @@ class StateRepository(Protocol):
         """
         ...
 
+    async def append_transition(
+        self,
+        issue_id: str,
+        expected_version: int,
+        transition: StateTransition,
+        error: Optional[str],
+    ) -> Optional[int]:
+        """Apply a stage transition atomically.
+
+        Moves the state from transition.from_stage to transition.to_stage,
+        records the transition in the history, sets the error, and
+        increments the version, all only if the stored version equals
+        expected_version, the stored stage equals transition.from_stage,
+        and the transition is valid.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            expected_version: The version the caller last read.
+            transition: The transition to apply.
+            error: The error value after the transition.
+
+        Returns:
+            The new version if the transition was applied, None otherwise.
+
+        Raises:
+            Exception: If the operation fails for reasons other than a
+                       failed condition.
+        """
+        ...
+
+    async def append_transitions(
+        self,
+        items: Sequence[Tuple[str, int, StateTransition, Optional[str]]],
+    ) -> List[Optional[int]]:
+        """Apply stage transitions to several distinct issues at once.
+
+        Each item is (issue_id, expected_version, transition, error) and
+        is applied under the same conditions as append_transition(), but
+        the whole batch may be sent to storage in one round trip. Items
+        are applied independently; one failed condition does not affect
+        the others.
+
+        Args:
+            items: Transitions to apply; issue IDs must be unique.
+
+        Returns:
+            For each item in order, the new version if it was applied,
+            None otherwise.
+
+        Raises:
+            Exception: If the operation fails for reasons other than a
+                       failed condition.
+        """
+        ...
+
+    async def apply_transition(
+        self,
+        issue_id: str,
+        to_stage: PipelineStage,
+        timestamp: datetime,
+        details: Mapping[str, Any],
+        failed_error: str,
+    ) -> Optional[Tuple[PipelineStage, Optional[int]]]:
+        """Apply a stage transition from whatever stage is stored.
+
+        Unlike append_transition(), the caller does not read the state
+        first: the repository reads the current stage, validates the
+        transition, updates the state and records the transition in one
+        atomic operation. A transition to FAILED stores failed_error,
+        recovery from FAILED to PENDING clears the error, and any other
+        transition keeps it.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            to_stage: The target pipeline stage.
+            timestamp: When the transition occurs.
+            details: Metadata about the transition.
+            failed_error: The error to store if to_stage is FAILED.
+
+        Returns:
+            None if the state does not exist. Otherwise the stage the
+            state was in and the new version, or None as the version if
+            that stage does not allow the transition.
+
+        Raises:
+            Exception: If the operation fails.
+        """
+        ...
+
+    async def patch_fields(
+        self,
+        issue_id: str,
+        expected_version: int,
+        fields: Dict[str, Any],
+    ) -> Optional[int]:
+        """Update individual columns with optimistic locking.
+
+        Writes only the given fields and increments the version, without
+        touching the stage or state history. The update applies only if
+        the stored version equals expected_version.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            expected_version: The version the caller last read.
+            fields: Column names mapped to their new values.
+
+        Returns:
+            The new version if the update succeeded, None if the state
+            does not exist or the version did not match.
+
+        Raises:
+            Exception: If the update operation fails for reasons other
+                       than version conflict.
+        """
+        ...
+
 
 class PipelineStateMachine:
     """State machine for managing pipeline issue progression.
@@ -177,8 +404,17 @@ class PipelineStateMachine:
     - The FAILED state can transition to PENDING for manual recovery
     - Each state update increments the version for optimistic locking
 
+    Stage transitions and field updates that lose an optimistic-locking
+    race are re-read and retried with jittered exponential backoff, as
+    configured by the retry policy, before VersionConflictError is raised.
+    States written by the machine are cached briefly so that a burst of
+    writes to one issue does not re-read the state before each write.
+
     Attributes:
         repository: The state repository for persistence.
+        retry_policy: Retry settings for version conflicts.
+        cache_ttl: Seconds a written state is reused for the next write.
+        cache_size: Maximum number of cached states.
 
     Example:
         >>> repository = PostgresStateRepository(connection_string)
@@ -191,13 +427,169 @@ class PipelineStateMachine:
         ... )
     """
 
-    def __init__(self, repository: StateRepository):
+    def __init__(
+        self,
+        repository: StateRepository,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache_ttl: float = DEFAULT_STATE_CACHE_TTL_SECONDS,
+        cache_size: int = DEFAULT_STATE_CACHE_SIZE,
+    ):
         """Initialize the state machine with a repository.
 
         Args:
             repository: The state repository for persistence.
+            retry_policy: Retry settings for version conflicts. Defaults
+                to RetryPolicy(); pass RetryPolicy(max_attempts=1) to
+                surface every conflict to the caller.
+            cache_ttl: Seconds a state written by this machine is reused
+                as the starting point of the next write to the same
+                issue instead of being read again. 0 disables the cache.
+            cache_size: Maximum number of cached states.
+
+        Raises:
+            ValueError: If cache_ttl is negative or cache_size is less
+                than 1.
         """
+        if cache_ttl < 0:
+            raise ValueError("cache_ttl must not be negative")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
         self.repository = repository
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # issue_id -> (expires_at, state), oldest entry first
+        self._cache: Dict[str, Tuple[float, PipelineState]] = {}
+
+    def _cache_put(self, state: PipelineState) -> None:
+        """Remember a state this machine just wrote.
+
+        Args:
+            state: The state as persisted.
+        """
+        if not self.cache_ttl:
+            return
+        self._cache.pop(state.issue_id, None)
+        if len(self._cache) >= self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[state.issue_id] = (time.monotonic() + self.cache_ttl, state)
+
+    def _cache_drop(self, issue_id: str) -> None:
+        """Forget the cached state for an issue, if any.
+
+        Args:
+            issue_id: The canonical issue identifier.
+        """
+        self._cache.pop(issue_id, None)
+
+    async def _get_for_update(self, issue_id: str) -> Tuple[PipelineState, bool]:
+        """Get the state a write should start from.
+
+        A state this machine wrote within the cache TTL is reused without
+        a repository read. It may be stale if another process wrote since;
+        the version check on the write then fails and the retry re-reads.
+
+        Args:
+            issue_id: The canonical issue identifier.
+
+        Returns:
+            The state, and whether it came from the cache.
+
+        Raises:
+            StateNotFoundError: If the issue doesn't exist.
+        """
+        entry = self._cache.get(issue_id)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                return cached, True
+            self._cache_drop(issue_id)
+
+        state = await self.repository.get(issue_id)
+        if state is None:
+            raise StateNotFoundError(issue_id)
+        return state, False
+
+    async def _get_many_for_update(
+        self, issue_ids: Sequence[str]
+    ) -> List[Tuple[PipelineState, bool]]:
+        """Get the states a batch of writes should start from.
+
+        Like _get_for_update(), but every issue missing from the cache is
+        read through a single get_many() call.
+
+        Args:
+            issue_ids: The canonical issue identifiers.
+
+        Returns:
+            The state and whether it came from the cache, for each issue
+            in order.
+
+        Raises:
+            StateNotFoundError: If an issue doesn't exist.
+        """
+        now = time.monotonic()
+        found: Dict[str, Tuple[PipelineState, bool]] = {}
+        missing = []
+        for issue_id in issue_ids:
+            entry = self._cache.get(issue_id)
+            if entry is not None and now < entry[0]:
+                found[issue_id] = entry[1], True
+            else:
+                missing.append(issue_id)
+
+        if missing:
+            for issue_id in missing:
+                self._cache_drop(issue_id)
+            for issue_id, state in zip(
+                missing, await self.repository.get_many(missing)
+            ):
+                if state is None:
+                    raise StateNotFoundError(issue_id)
+                found[issue_id] = state, False
+
+        return [found[issue_id] for issue_id in issue_ids]
+
+    async def _retry_optimistic(
+        self,
+        operation: Callable[[Optional[PipelineState]], Awaitable[T]],
+    ) -> T:
+        """Run a read-modify-write operation, retrying version conflicts.
+
+        Each attempt calls the operation afresh. A retry is handed the
+        current state carried by the previous VersionConflictError, or
+        None, in which case the operation reads the state itself.
+
+        Args:
+            operation: Coroutine function taking the state to start from.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            VersionConflictError: If the final attempt also conflicts.
+        """
+        max_attempts = self.retry_policy.max_attempts
+        current: Optional[PipelineState] = None
+        for attempt in range(max_attempts):
+            try:
+                return await operation(current)
+            except VersionConflictError as e:
+                if not e.retryable or attempt == max_attempts - 1:
+                    raise
+                current = e.current_state
+                delay = self.retry_policy.backoff(attempt)
+                logger.info(
+                    "Retrying after version conflict",
+                    extra={
+                        "issue_id": e.issue_id,
+                        "attempt": attempt + 1,
+                        "max_attempts": max_attempts,
+                        "delay": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
 
     async def create(self, issue_id: str, repository: str) -> PipelineState:
         """Create a new pipeline state for an issue.
@@ -242,11 +634,12 @@ class PipelineStateMachine:
             extra={
                 "issue_id": issue_id,
                 "repository": repository,
-                "stage": PipelineStage.PENDING.value,
+                "stage": STAGE_VALUE[PipelineStage.PENDING],
             },
         )
 
         await self.repository.save(state)
+        self._cache_put(state)
 
         return state
 
@@ -275,7 +668,8 @@ class PipelineStateMachine:
         Raises:
             StateNotFoundError: If the issue doesn't exist.
             InvalidTransitionError: If the transition is not valid.
-            VersionConflictError: If a concurrent update occurred.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
 
         Example:
             >>> # Normal transition
@@ -298,12 +692,45 @@ class PipelineStateMachine:
             ...     details={"recovery_reason": "Manual retry requested"}
             ... )
         """
-        details = details or {}
+        details = details or _EMPTY_DETAILS
+        return await self._retry_optimistic(
+            lambda current: self._transition_once(
+                issue_id, to_stage, details, current
+            )
+        )
+
+    async def _transition_once(
+        self,
+        issue_id: str,
+        to_stage: PipelineStage,
+        details: Mapping[str, Any],
+        current: Optional[PipelineState] = None,
+    ) -> PipelineState:
+        """Apply one transition attempt.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            to_stage: The target pipeline stage.
+            details: Metadata about the transition.
+            current: Freshly read state to start from, or None to read it.
+
+        Returns:
+            The updated pipeline state.
 
+        Raises:
+            StateNotFoundError: If the issue doesn't exist.
+            InvalidTransitionError: If the transition is not valid.
+            VersionConflictError: If a concurrent update occurred.
+        """
         # Retrieve current state
-        state = await self.repository.get(issue_id)
-        if state is None:
-            raise StateNotFoundError(issue_id)
+        if current is not None:
+            state, cached = current, False
+        else:
+            state, cached = await self._get_for_update(issue_id)
+        if cached and not is_valid_transition(state.current_stage, to_stage):
+            # The cached stage may be out of date; judge against storage
+            self._cache_drop(issue_id)
+            state, cached = await self._get_for_update(issue_id)
 
         from_stage = state.current_stage
 
@@ -313,8 +740,8 @@ class PipelineStateMachine:
                 "Invalid state transition attempted",
                 extra={
                     "issue_id": issue_id,
-                    "from_stage": from_stage.value,
-                    "to_stage": to_stage.value,
+                    "from_stage": STAGE_VALUE[from_stage],
+                    "to_stage": STAGE_VALUE[to_stage],
                 },
             )
             raise InvalidTransitionError(from_stage, to_stage)
@@ -330,63 +757,308 @@ class PipelineStateMachine:
             details=details,
         )
 
-        # Handle FAILED state - store error details
-        error_message: Optional[str] = None
-        if to_stage == PipelineStage.FAILED:
-            error_message = details.get("error")
-            if not error_message:
-                # Require error message for FAILED transitions
-                error_message = "Unknown error (no details provided)"
-                logger.warning(
-                    "Transition to FAILED without error details",
-                    extra={"issue_id": issue_id},
-                )
+        new_error = self._error_after(state, to_stage, details)
 
-        # Handle recovery from FAILED - clear error
-        if from_stage == PipelineStage.FAILED and to_stage == PipelineStage.PENDING:
-            error_message = None
-            logger.info(
-                "Manual recovery initiated",
+        # Validate and persist in one conditional write, so a concurrent
+        # writer cannot slip in between the check above and the update
+        new_version = await self.repository.append_transition(
+            issue_id, state.version, transition, new_error
+        )
+        if new_version is None:
+            self._cache_drop(issue_id)
+            await self._raise_transition_rejected(issue_id, state, to_stage)
+
+        # The repository has already recorded the transition on its side.
+        # The history is copied rather than extended: the state read may be
+        # shared with the repository or the cache
+        updated_state = state.model_copy(
+            update={
+                "current_stage": to_stage,
+                "state_history": [*state.state_history, transition],
+                "error": new_error,
+                "updated_at": now,
+                "version": new_version,
+            }
+        )
+
+        self._cache_put(updated_state)
+
+        self._log_transition(issue_id, from_stage, to_stage, new_version, details)
+
+        return updated_state
+
+    @staticmethod
+    def _log_transition(
+        issue_id: str,
+        from_stage: PipelineStage,
+        to_stage: PipelineStage,
+        version: int,
+        details: Mapping[str, Any],
+    ) -> None:
+        """Log an applied transition as a single record.
+
+        The FAILED-without-details warning and the recovery reason ride
+        along as fields rather than as extra records.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            from_stage: The stage the issue left.
+            to_stage: The stage the issue entered.
+            version: The state version after the transition.
+            details: Metadata about the transition.
+        """
+        warning_reason = None
+        if to_stage is PipelineStage.FAILED and not details.get("error"):
+            warning_reason = "Transition to FAILED without error details"
+        level = logging.WARNING if warning_reason else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+
+        extra: Dict[str, Any] = {
+            "issue_id": issue_id,
+            "from_stage": STAGE_VALUE[from_stage],
+            "to_stage": STAGE_VALUE[to_stage],
+            "version": version,
+        }
+        if warning_reason:
+            extra["warning_reason"] = warning_reason
+        if from_stage is PipelineStage.FAILED and to_stage is PipelineStage.PENDING:
+            extra["recovery_reason"] = details.get(
+                "recovery_reason", "Not specified"
+            )
+        logger.log(level, "Transitioned pipeline state", extra=extra)
+
+    @staticmethod
+    def _error_after(
+        state: PipelineState,
+        to_stage: PipelineStage,
+        details: Mapping[str, Any],
+    ) -> Optional[str]:
+        """Compute the error field after a transition.
+
+        Transitions to FAILED store the error from details, falling back
+        to a placeholder when none is given; recovery from FAILED to
+        PENDING clears it; other transitions keep the current value.
+
+        Args:
+            state: The state being transitioned.
+            to_stage: The target pipeline stage.
+            details: Metadata about the transition.
+
+        Returns:
+            The error value after the transition.
+        """
+        if to_stage is PipelineStage.FAILED:
+            # Require error message for FAILED transitions
+            return details.get("error") or _DEFAULT_FAILED_ERROR
+        if (
+            state.current_stage is PipelineStage.FAILED
+            and to_stage is PipelineStage.PENDING
+        ):
+            return None
+        return state.error
+
+    async def _raise_transition_rejected(
+        self,
+        issue_id: str,
+        state: PipelineState,
+        to_stage: PipelineStage,
+    ) -> NoReturn:
+        """Raise the error explaining why a conditional transition failed.
+
+        Re-reads the state once to tell a deleted state, a transition made
+        invalid by a concurrent stage change, and a plain version conflict
+        apart. A version conflict carries the re-read state for the retry.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            state: The state the transition was based on.
+            to_stage: The target pipeline stage.
+
+        Raises:
+            StateNotFoundError: If the state no longer exists.
+            InvalidTransitionError: If the current stage does not allow
+                the transition.
+            VersionConflictError: Otherwise.
+        """
+        current = await self.repository.get(issue_id)
+        if current is None:
+            raise StateNotFoundError(issue_id)
+        if not is_valid_transition(current.current_stage, to_stage):
+            raise InvalidTransitionError(current.current_stage, to_stage)
+        raise VersionConflictError(
+            issue_id, state.version, current.version, current_state=current
+        )
+
+    async def advance(
+        self,
+        issue_id: str,
+        to_stage: PipelineStage,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> StateTransition:
+        """Move an issue to a new stage without reading its state first.
+
+        The repository validates and applies the transition against the
+        stage it has stored, in a single call, so this costs one round
+        trip where transition() needs a read and a write. Use it when
+        only the transition itself is needed, not the updated state.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            to_stage: The target pipeline stage.
+            details: Optional metadata about the transition. For FAILED
+                     transitions, should include an "error" key with the
+                     error message.
+
+        Returns:
+            The transition that was applied.
+
+        Raises:
+            StateNotFoundError: If the issue doesn't exist.
+            InvalidTransitionError: If the stored stage does not allow
+                the transition.
+
+        Example:
+            >>> transition = await machine.advance(
+            ...     "owner/repo#123",
+            ...     PipelineStage.FAILED,
+            ...     details={"error": "LLM timeout after 30s"}
+            ... )
+            >>> transition.from_stage
+            <PipelineStage.INTAKE: 'intake'>
+        """
+        details = details or _EMPTY_DETAILS
+        now = datetime.now(timezone.utc)
+        result = await self.repository.apply_transition(
+            issue_id,
+            to_stage,
+            now,
+            details,
+            details.get("error") or _DEFAULT_FAILED_ERROR,
+        )
+        # The stored state changed (or was found to differ) behind the cache
+        self._cache_drop(issue_id)
+        if result is None:
+            raise StateNotFoundError(issue_id)
+
+        from_stage, new_version = result
+        if new_version is None:
+            logger.warning(
+                "Invalid state transition attempted",
                 extra={
                     "issue_id": issue_id,
-                    "recovery_reason": details.get("recovery_reason", "Not specified"),
+                    "from_stage": STAGE_VALUE[from_stage],
+                    "to_stage": STAGE_VALUE[to_stage],
                 },
             )
+            raise InvalidTransitionError(from_stage, to_stage)
 
-        # Update state
-        # Create a new state with updated fields
-        updated_state = PipelineState(
-            issue_id=state.issue_id,
-            repository=state.repository,
-            current_stage=to_stage,
-            state_history=state.state_history + [transition],
-            classification=state.classification,
-            workspace_path=state.workspace_path,
-            pr_number=state.pr_number,
-            error=error_message if to_stage == PipelineStage.FAILED else state.error
-            if to_stage != PipelineStage.PENDING
-            else None,
-            created_at=state.created_at,
-            updated_at=now,
-            version=state.version + 1,
-        )
+        self._log_transition(issue_id, from_stage, to_stage, new_version, details)
 
-        logger.info(
-            "Transitioning pipeline state",
-            extra={
-                "issue_id": issue_id,
-                "from_stage": from_stage.value,
-                "to_stage": to_stage.value,
-                "version": updated_state.version,
-            },
+        return StateTransition(
+            from_stage=from_stage,
+            to_stage=to_stage,
+            timestamp=now,
+            details=details,
         )
 
-        # Persist with optimistic locking
-        success = await self.repository.update_with_version(updated_state)
-        if not success:
-            raise VersionConflictError(issue_id, state.version)
+    async def transition_many(
+        self,
+        updates: Sequence[
+            Tuple[str, PipelineStage, Optional[Dict[str, Any]]]
+        ],
+    ) -> List[PipelineState]:
+        """Transition several issues, writing the transitions in one batch.
 
-        return updated_state
+        Every update is validated before anything is written, and the
+        valid ones are applied through a single append_transitions() call
+        instead of one write per issue. Updates that lose an optimistic
+        locking race are then retried one by one through transition().
+
+        The batch is not atomic: a retried update that still fails raises
+        after the others have been applied.
+
+        Args:
+            updates: (issue_id, to_stage, details) tuples; each issue may
+                appear at most once.
+
+        Returns:
+            The updated pipeline states, in the order of updates.
+
+        Raises:
+            ValueError: If an issue appears more than once.
+            StateNotFoundError: If an issue doesn't exist.
+            InvalidTransitionError: If a transition is not valid.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
+
+        Example:
+            >>> states = await machine.transition_many([
+            ...     ("owner/repo#1", PipelineStage.COMPLETED, None),
+            ...     ("owner/repo#2", PipelineStage.COMPLETED, None),
+            ... ])
+        """
+        issue_ids = [issue_id for issue_id, _, _ in updates]
+        if len(set(issue_ids)) != len(issue_ids):
+            raise ValueError("transition_many() requires distinct issue IDs")
+        if not updates:
+            return []
+
+        states = await self._get_many_for_update(issue_ids)
+
+        # One timestamp for the whole batch, as they are written together
+        now = datetime.now(timezone.utc)
+        items = []
+        for (issue_id, to_stage, details), (state, cached) in zip(updates, states):
+            if not is_valid_transition(state.current_stage, to_stage):
+                if cached:
+                    # Judged against a possibly stale stage; let the
+                    # single-issue path re-read it
+                    items.append(None)
+                    continue
+                raise InvalidTransitionError(state.current_stage, to_stage)
+            details = details or _EMPTY_DETAILS
+            new_error = self._error_after(state, to_stage, details)
+            transition = StateTransition(
+                from_stage=state.current_stage,
+                to_stage=to_stage,
+                timestamp=now,
+                details=details,
+            )
+            items.append((issue_id, state.version, transition, new_error))
+
+        batch = [item for item in items if item is not None]
+        versions = iter(await self.repository.append_transitions(batch))
+
+        results: List[PipelineState] = []
+        for (issue_id, to_stage, details), (state, _), item in zip(
+            updates, states, items
+        ):
+            new_version = next(versions) if item is not None else None
+            if new_version is None:
+                self._cache_drop(issue_id)
+                results.append(await self.transition(issue_id, to_stage, details))
+                continue
+            _, _, transition, new_error = item
+            updated_state = state.model_copy(
+                update={
+                    "current_stage": to_stage,
+                    "state_history": [*state.state_history, transition],
+                    "error": new_error,
+                    "updated_at": transition.timestamp,
+                    "version": new_version,
+                }
+            )
+            self._cache_put(updated_state)
+            results.append(updated_state)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transitioned pipeline states in batch",
+                extra={"count": len(updates), "batched": len(batch)},
+            )
+
+        return results
 
     async def get(self, issue_id: str) -> Optional[PipelineState]:
         """Get the current state for an issue.
@@ -422,6 +1094,39 @@ class PipelineStateMachine:
         """
         return await self.repository.list_by_stage(stage)
 
+    def iter_by_stage(self, stage: PipelineStage) -> AsyncIterator[PipelineState]:
+        """Stream issues in a given pipeline stage.
+
+        Unlike list_by_stage(), states are produced one at a time, so
+        large stages can be processed without holding them all in memory.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            Async iterator over the pipeline states in the stage.
+
+        Example:
+            >>> async for state in machine.iter_by_stage(PipelineStage.PENDING):
+            ...     await process(state)
+        """
+        return self.repository.iter_by_stage(stage)
+
+    async def count_by_stage(self, stage: PipelineStage) -> int:
+        """Count issues in a given pipeline stage without loading them.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            Number of issues in the stage.
+
+        Example:
+            >>> pending = await machine.count_by_stage(PipelineStage.PENDING)
+            >>> print(f"Found {pending} pending issues")
+        """
+        return await self.repository.count_by_stage(stage)
+
     async def set_classification(
         self,
         issue_id: str,
@@ -441,34 +1146,13 @@ class PipelineStateMachine:
 
         Raises:
             StateNotFoundError: If the issue doesn't exist.
-            VersionConflictError: If a concurrent update occurred.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
         """
-        state = await self.repository.get(issue_id)
-        if state is None:
-            raise StateNotFoundError(issue_id)
-
-        now = datetime.now(timezone.utc)
-
-        updated_state = PipelineState(
-            issue_id=state.issue_id,
-            repository=state.repository,
-            current_stage=state.current_stage,
-            state_history=state.state_history,
-            classification=classification,
-            workspace_path=state.workspace_path,
-            pr_number=state.pr_number,
-            error=state.error,
-            created_at=state.created_at,
-            updated_at=now,
-            version=state.version + 1,
+        return await self._patch_fields(
+            issue_id, {"classification": classification}
         )
 
-        success = await self.repository.update_with_version(updated_state)
-        if not success:
-            raise VersionConflictError(issue_id, state.version)
-
-        return updated_state
-
     async def set_workspace_path(
         self,
         issue_id: str,
@@ -488,34 +1172,13 @@ class PipelineStateMachine:
 
         Raises:
             StateNotFoundError: If the issue doesn't exist.
-            VersionConflictError: If a concurrent update occurred.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
         """
-        state = await self.repository.get(issue_id)
-        if state is None:
-            raise StateNotFoundError(issue_id)
-
-        now = datetime.now(timezone.utc)
-
-        updated_state = PipelineState(
-            issue_id=state.issue_id,
-            repository=state.repository,
-            current_stage=state.current_stage,
-            state_history=state.state_history,
-            classification=state.classification,
-            workspace_path=workspace_path,
-            pr_number=state.pr_number,
-            error=state.error,
-            created_at=state.created_at,
-            updated_at=now,
-            version=state.version + 1,
+        return await self._patch_fields(
+            issue_id, {"workspace_path": workspace_path}
         )
 
-        success = await self.repository.update_with_version(updated_state)
-        if not success:
-            raise VersionConflictError(issue_id, state.version)
-
-        return updated_state
-
     async def set_pr_number(
         self,
         issue_id: str,
@@ -535,34 +1198,75 @@ class PipelineStateMachine:
 
         Raises:
             StateNotFoundError: If the issue doesn't exist.
-            VersionConflictError: If a concurrent update occurred.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
             ValueError: If pr_number is not positive.
         """
         if pr_number <= 0:
             raise ValueError("pr_number must be positive")
 
-        state = await self.repository.get(issue_id)
-        if state is None:
-            raise StateNotFoundError(issue_id)
+        return await self._patch_fields(
+            issue_id, {"pr_number": pr_number}
+        )
 
-        now = datetime.now(timezone.utc)
+    async def _patch_fields(
+        self,
+        issue_id: str,
+        fields: Dict[str, Any],
+    ) -> PipelineState:
+        """Write individual fields of a state without changing its stage.
 
-        updated_state = PipelineState(
-            issue_id=state.issue_id,
-            repository=state.repository,
-            current_stage=state.current_stage,
-            state_history=state.state_history,
-            classification=state.classification,
-            workspace_path=state.workspace_path,
-            pr_number=pr_number,
-            error=state.error,
-            created_at=state.created_at,
-            updated_at=now,
-            version=state.version + 1,
+        Only the given fields and ``updated_at`` are sent to the
+        repository; the stage and state history are left untouched.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            fields: Field names mapped to their new values.
+
+        Returns:
+            The updated pipeline state.
+
+        Raises:
+            StateNotFoundError: If the issue doesn't exist.
+            VersionConflictError: If concurrent updates outlasted the
+                retry policy.
+        """
+        return await self._retry_optimistic(
+            lambda current: self._patch_fields_once(issue_id, fields, current)
         )
 
-        success = await self.repository.update_with_version(updated_state)
-        if not success:
+    async def _patch_fields_once(
+        self,
+        issue_id: str,
+        fields: Dict[str, Any],
+        current: Optional[PipelineState] = None,
+    ) -> PipelineState:
+        """Apply one field update attempt.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            fields: Field names mapped to their new values.
+            current: Freshly read state to start from, or None to read it.
+
+        Returns:
+            The updated pipeline state.
+
+        Raises:
+            StateNotFoundError: If the issue doesn't exist.
+            VersionConflictError: If a concurrent update occurred.
+        """
+        state = current
+        if state is None:
+            state, _ = await self._get_for_update(issue_id)
+
+        fields = {**fields, "updated_at": datetime.now(timezone.utc)}
+        new_version = await self.repository.patch_fields(
+            issue_id, state.version, fields
+        )
+        if new_version is None:
+            self._cache_drop(issue_id)
             raise VersionConflictError(issue_id, state.version)
 
+        updated_state = state.model_copy(update={**fields, "version": new_version})
+        self._cache_put(updated_state)
         return updated_state
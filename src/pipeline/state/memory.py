@@ -0,0 +1,243 @@
+"""In-memory pipeline state repository.
+
+Implements the StateRepository protocol with a dictionary, for local
+development without a database and for tests that exercise the state
+machine. The stage and error rules are the state machine's own, so they
+match what PostgresStateRepository enforces through migration 004.
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.pipeline.state.machine import PipelineStateMachine
+from src.pipeline.state.models import (
+    PipelineStage,
+    PipelineState,
+    StateTransition,
+    is_valid_transition,
+)
+
+
+class InMemoryStateRepository:
+    """Dictionary-backed implementation of StateRepository.
+
+    States are stored and returned as-is; like every repository, this one
+    relies on states never being modified in place.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty in-memory repository."""
+        self._states: Dict[str, PipelineState] = {}
+
+    async def save(self, state: PipelineState) -> None:
+        """Save or create a new pipeline state.
+
+        Args:
+            state: The pipeline state to save.
+        """
+        self._states[state.issue_id] = state
+
+    async def get(self, issue_id: str) -> Optional[PipelineState]:
+        """Get pipeline state by issue ID.
+
+        Args:
+            issue_id: The canonical issue identifier.
+
+        Returns:
+            The pipeline state if found, None otherwise.
+        """
+        return self._states.get(issue_id)
+
+    async def get_many(
+        self, issue_ids: Sequence[str]
+    ) -> List[Optional[PipelineState]]:
+        """Get several pipeline states.
+
+        Args:
+            issue_ids: The canonical issue identifiers.
+
+        Returns:
+            The states in order, None for missing issues.
+        """
+        return [self._states.get(issue_id) for issue_id in issue_ids]
+
+    async def list_by_stage(self, stage: PipelineStage) -> List[PipelineState]:
+        """List all pipeline states in a given stage.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            List of pipeline states in the specified stage.
+        """
+        return [
+            state for state in self._states.values()
+            if state.current_stage is stage
+        ]
+
+    async def iter_by_stage(self, stage: PipelineStage) -> AsyncIterator[PipelineState]:
+        """Stream pipeline states in a given stage.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Yields:
+            Pipeline states in the specified stage.
+        """
+        for state in await self.list_by_stage(stage):
+            yield state
+
+    async def count_by_stage(self, stage: PipelineStage) -> int:
+        """Count pipeline states in a given stage.
+
+        Args:
+            stage: The pipeline stage to filter by.
+
+        Returns:
+            Number of pipeline states in the specified stage.
+        """
+        return sum(
+            1 for state in self._states.values()
+            if state.current_stage is stage
+        )
+
+    async def update_with_version(self, state: PipelineState) -> bool:
+        """Update state with optimistic locking.
+
+        Args:
+            state: The pipeline state to update (with incremented version).
+
+        Returns:
+            True if update succeeded, False if version conflict.
+        """
+        existing = self._states.get(state.issue_id)
+        if existing is None or existing.version != state.version - 1:
+            return False
+        self._states[state.issue_id] = state
+        return True
+
+    async def append_transition(
+        self,
+        issue_id: str,
+        expected_version: int,
+        transition: StateTransition,
+        error: Optional[str],
+    ) -> Optional[int]:
+        """Apply a stage transition if version, stage, and matrix allow it.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            expected_version: The version the caller last read.
+            transition: The transition to apply.
+            error: The error value after the transition.
+
+        Returns:
+            The new version, or None if the transition was not applied.
+        """
+        existing = self._states.get(issue_id)
+        if (
+            existing is None
+            or existing.version != expected_version
+            or existing.current_stage is not transition.from_stage
+            or not is_valid_transition(transition.from_stage, transition.to_stage)
+        ):
+            return None
+
+        new_version = expected_version + 1
+        self._states[issue_id] = existing.model_copy(
+            update={
+                "current_stage": transition.to_stage,
+                "state_history": [*existing.state_history, transition],
+                "error": error,
+                "updated_at": transition.timestamp,
+                "version": new_version,
+            }
+        )
+        return new_version
+
+    async def append_transitions(
+        self,
+        items: Sequence[Tuple[str, int, StateTransition, Optional[str]]],
+    ) -> List[Optional[int]]:
+        """Apply each transition in turn.
+
+        Args:
+            items: (issue_id, expected_version, transition, error) tuples.
+
+        Returns:
+            For each item in order, the new version or None.
+        """
+        return [await self.append_transition(*item) for item in items]
+
+    async def apply_transition(
+        self,
+        issue_id: str,
+        to_stage: PipelineStage,
+        timestamp: datetime,
+        details: Mapping[str, Any],
+        failed_error: str,
+    ) -> Optional[Tuple[PipelineStage, Optional[int]]]:
+        """Validate against the stored stage, then append the transition.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            to_stage: The target pipeline stage.
+            timestamp: When the transition occurs.
+            details: Metadata about the transition.
+            failed_error: The error to store if to_stage is FAILED.
+
+        Returns:
+            None if the state does not exist; otherwise the stored stage
+            and the new version, or None as the version if that stage does
+            not allow the transition.
+        """
+        existing = self._states.get(issue_id)
+        if existing is None:
+            return None
+        from_stage = existing.current_stage
+        if not is_valid_transition(from_stage, to_stage):
+            return from_stage, None
+
+        transition = StateTransition(
+            from_stage=from_stage,
+            to_stage=to_stage,
+            timestamp=timestamp,
+            details=details,
+        )
+        error = PipelineStateMachine._error_after(
+            existing, to_stage, {"error": failed_error}
+        )
+        new_version = await self.append_transition(
+            issue_id, existing.version, transition, error
+        )
+        return from_stage, new_version
+
+    async def patch_fields(
+        self,
+        issue_id: str,
+        expected_version: int,
+        fields: Dict[str, Any],
+    ) -> Optional[int]:
+        """Update individual fields with optimistic locking.
+
+        Args:
+            issue_id: The canonical issue identifier.
+            expected_version: The version the caller last read.
+            fields: Field names mapped to their new values.
+
+        Returns:
+            The new version, or None on a missing state or version conflict.
+        """
+        existing = self._states.get(issue_id)
+        if existing is None or existing.version != expected_version:
+            return None
+
+        new_version = expected_version + 1
+        self._states[issue_id] = existing.model_copy(
+            update={**fields, "version": new_version}
+        )
+        return new_version
+
+    def clear(self) -> None:
+        """Clear all states from the repository."""
+        self._states.clear()
@@ -17,9 +17,9 @@ approach in webhook/models.py and config.py.
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class PipelineStage(str, Enum):
@@ -70,8 +70,13 @@ class StateTransition(BaseModel):
         timestamp: When the transition occurred (UTC).
         details: Optional metadata about the transition (e.g., error info,
                  classification results, PR number).
+
+    Instances are frozen: a transition is an audit record and is never
+    edited once appended to a state's history.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     from_stage: PipelineStage = Field(
         ...,
         description="The pipeline stage before this transition",
@@ -108,7 +113,8 @@ class PipelineState(BaseModel):
         issue_id: Canonical identifier in format "{owner}/{repo}#{number}".
         repository: Full repository path in format "{owner}/{repo}".
         current_stage: The current pipeline stage.
-        state_history: Ordered list of all state transitions.
+        state_history: Ordered list of state transitions. Repositories may
+            load only the most recent ones; see history_offset.
         classification: LLM classification results (issue type, requirements, etc.).
         workspace_path: Filesystem path to the provisioned workspace.
         pr_number: Pull request number if PR was created.
@@ -116,8 +122,15 @@ class PipelineState(BaseModel):
         created_at: When the pipeline state was created (UTC).
         updated_at: When the pipeline state was last updated (UTC).
         version: Optimistic locking version for concurrent update protection.
+
+    Instances are frozen: updates produce a new state via ``model_copy``
+    rather than assigning fields, so no assignment-time bookkeeping is
+    needed. States may be shared between callers, so the history list is
+    never modified in place either.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     issue_id: str = Field(
         ...,
         min_length=1,
@@ -177,6 +190,20 @@ class PipelineState(BaseModel):
         description="Optimistic locking version for concurrent update protection",
     )
 
+    # Number of older transitions that precede state_history but were not
+    # loaded; set by repositories that bound the history they read
+    _history_offset: int = PrivateAttr(default=0)
+
+    # (version, length) of state_history as last read or written by a
+    # repository, letting it tell new transitions apart without asking the
+    # database; only trusted for an update from exactly that version
+    _stored_history: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+
+    @property
+    def history_offset(self) -> int:
+        """Number of earlier transitions omitted from state_history."""
+        return self._history_offset
+
 
 # Valid state transitions map
 #
@@ -236,6 +263,31 @@ VALID_TRANSITIONS: Dict[PipelineStage, List[PipelineStage]] = {
     ],
 }
 
+# Lookup tables derived from VALID_TRANSITIONS so that the checks below are
+# hash probes instead of list scans. Each stage gets one bit and maps to the
+# mask of the stages it may move to, so a transition check is two dict
+# probes and an AND, without building and hashing a (from, to) tuple.
+_STAGE_BIT: Dict[PipelineStage, int] = {
+    stage: 1 << index for index, stage in enumerate(PipelineStage)
+}
+_VALID_MASK: Dict[PipelineStage, int] = {
+    stage: sum(_STAGE_BIT[target] for target in VALID_TRANSITIONS.get(stage, ()))
+    for stage in PipelineStage
+}
+_TERMINAL_STAGES: FrozenSet[PipelineStage] = frozenset(
+    stage for stage in PipelineStage if not VALID_TRANSITIONS.get(stage)
+)
+
+# Stage string values keyed by member; a dict probe is cheaper than the
+# enum's ``.value`` descriptor on the logging and query-binding hot paths
+STAGE_VALUE: Dict[PipelineStage, str] = {stage: stage.value for stage in PipelineStage}
+
+# Members keyed by string value; rebuilding stages from database rows with a
+# dict probe skips the validation in the enum's ``__call__``
+STAGE_BY_VALUE: Dict[str, PipelineStage] = {
+    stage.value: stage for stage in PipelineStage
+}
+
 
 def is_valid_transition(from_stage: PipelineStage, to_stage: PipelineStage) -> bool:
     """Check if a state transition is valid.
@@ -248,7 +300,8 @@ def is_valid_transition(from_stage: PipelineStage, to_stage: PipelineStage) -> b
         to_stage: The target pipeline stage.
 
     Returns:
-        bool: True if the transition is valid, False otherwise.
+        bool: True if the transition is valid, False otherwise (including
+        when either argument is not a pipeline stage).
 
     Example:
         >>> is_valid_transition(PipelineStage.PENDING, PipelineStage.INTAKE)
@@ -256,8 +309,7 @@ def is_valid_transition(from_stage: PipelineStage, to_stage: PipelineStage) -> b
         >>> is_valid_transition(PipelineStage.COMPLETED, PipelineStage.PENDING)
         False
     """
-    valid_targets = VALID_TRANSITIONS.get(from_stage, [])
-    return to_stage in valid_targets
+    return _VALID_MASK.get(from_stage, 0) & _STAGE_BIT.get(to_stage, 0) != 0
 
 
 def is_terminal_stage(stage: PipelineStage) -> bool:
@@ -279,4 +331,4 @@ def is_terminal_stage(stage: PipelineStage) -> bool:
         >>> is_terminal_stage(PipelineStage.INTAKE)
         False
     """
-    return len(VALID_TRANSITIONS.get(stage, [])) == 0
+    return stage in _TERMINAL_STAGES
@@ -32,10 +32,18 @@ GitHub Webhook Payload Structure (issues event):
 import logging
 from typing import Any, Dict, List, Optional
 
+from src.pipeline.serialization import json_loads
+
 from .models import GitHubIssueEvent, IssueAction
 
 logger = logging.getLogger(__name__)
 
+# Actions keyed by string value; most deliveries carry actions the pipeline
+# ignores, and a dict miss avoids raising and catching a ValueError for each
+_ACTION_BY_VALUE: Dict[str, IssueAction] = {
+    action.value: action for action in IssueAction
+}
+
 
 class WebhookHandler:
     """Handler for parsing GitHub webhook events.
@@ -52,6 +60,8 @@ class WebhookHandler:
                 but signature validation is handled by EventListener).
     """
 
+    __slots__ = ("secret",)
+
     def __init__(self, secret: str) -> None:
         """Initialize the webhook handler.
 
@@ -62,6 +72,28 @@ class WebhookHandler:
         """
         self.secret = secret
 
+    def parse_issue_event_bytes(self, raw: bytes) -> Optional[GitHubIssueEvent]:
+        """Parse a GitHub issue event from a raw webhook request body.
+
+        Decodes the UTF-8 JSON body directly from bytes, with orjson when it
+        is installed, and then parses it like parse_issue_event().
+
+        Args:
+            raw: The raw webhook request body.
+
+        Returns:
+            GitHubIssueEvent if parsing succeeds, None otherwise. Returns
+            None for bodies that are not valid UTF-8 JSON, in addition to
+            the cases listed in parse_issue_event().
+        """
+        try:
+            payload = json_loads(raw)
+        except ValueError as e:
+            logger.warning("Invalid JSON in webhook payload: %s", e)
+            return None
+
+        return self.parse_issue_event(payload)
+
     def parse_issue_event(self, payload: Dict[str, Any]) -> Optional[GitHubIssueEvent]:
         """Parse a GitHub issue event from a webhook payload.
 
@@ -121,7 +153,8 @@ class WebhookHandler:
 
             # Extract required fields from issue
             issue_number = issue_data.get("number")
-            if not isinstance(issue_number, int) or issue_number <= 0:
+            # An exact type check, since bool is a subclass of int
+            if type(issue_number) is not int or issue_number <= 0:
                 logger.warning(
                     "Invalid issue number: %s (type: %s)",
                     issue_number,
@@ -130,7 +163,9 @@ class WebhookHandler:
                 return None
 
             title = issue_data.get("title")
-            if not isinstance(title, str) or not title.strip():
+            if isinstance(title, str):
+                title = title.strip()
+            if not isinstance(title, str) or not title:
                 logger.warning("Invalid or empty issue title: %s", title)
                 return None
 
@@ -153,7 +188,9 @@ class WebhookHandler:
 
             # Extract repository name
             repo_name = repo_data.get("name")
-            if not isinstance(repo_name, str) or not repo_name.strip():
+            if isinstance(repo_name, str):
+                repo_name = repo_name.strip()
+            if not isinstance(repo_name, str) or not repo_name:
                 logger.warning("Invalid or empty repository name: %s", repo_name)
                 return None
 
@@ -163,14 +200,15 @@ class WebhookHandler:
             if owner is None:
                 return None
 
-            # Create and return the event
-            event = GitHubIssueEvent(
+            # Every field has been validated above, so build the event
+            # without running the model's validators a second time
+            event = GitHubIssueEvent.model_construct(
                 action=action,
                 issue_number=issue_number,
-                title=title.strip(),
+                title=title,
                 body=body,
-                labels=labels,
-                repository=repo_name.strip(),
+                labels=tuple(sorted(labels)),
+                repository=repo_name,
                 owner=owner,
                 author=author,
             )
@@ -199,10 +237,7 @@ class WebhookHandler:
         if not isinstance(action_str, str):
             return None
 
-        try:
-            return IssueAction(action_str)
-        except ValueError:
-            return None
+        return _ACTION_BY_VALUE.get(action_str)
 
     def _extract_labels(self, labels_data: Any) -> List[str]:
         """Extract label names from the labels array.
@@ -220,15 +255,16 @@ class WebhookHandler:
             logger.debug("Labels is not a list: %s", type(labels_data))
             return []
 
-        labels = []
+        labels: List[str] = []
+        append = labels.append
         for label in labels_data:
             if isinstance(label, dict):
-                name = label.get("name")
-                if isinstance(name, str) and name.strip():
-                    labels.append(name.strip())
-            elif isinstance(label, str) and label.strip():
-                # Handle case where labels might be plain strings
-                labels.append(label.strip())
+                label = label.get("name")
+            # Labels might also be plain strings
+            if isinstance(label, str):
+                name = label.strip()
+                if name:
+                    append(name)
 
         return labels
 
@@ -253,11 +289,13 @@ class WebhookHandler:
             return None
 
         login = user_data.get("login")
-        if not isinstance(login, str) or not login.strip():
+        if isinstance(login, str):
+            login = login.strip()
+        if not isinstance(login, str) or not login:
             logger.warning("Invalid or empty %s login: %s", context, login)
             return None
 
-        return login.strip()
+        return login
 
 
 def create_webhook_handler(secret: str) -> WebhookHandler:
@@ -14,8 +14,10 @@ configuration approach in config.py.
 """
 
 from enum import Enum
+from functools import cached_property
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class IssueAction(str, Enum):
@@ -42,19 +44,23 @@ class GitHubIssueEvent(BaseModel):
 
     This model represents the essential data extracted from a GitHub
     issue webhook payload. The Tekton EventListener validates the webhook
-    signature before forwarding to this service.
+    signature before forwarding to this service. Events are immutable, so
+    the derived identifiers are computed once and cached.
 
     Attributes:
         action: The type of issue event (opened, edited, labeled).
         issue_number: The issue number within the repository.
         title: The issue title text.
         body: The issue body/description text. May be empty.
-        labels: List of label names attached to the issue.
+        labels: Label names attached to the issue, sorted and stored as a
+                tuple so the value is stable and hashable.
         repository: The repository name (without owner prefix).
         owner: The repository owner (user or organization).
         author: The GitHub username who created the issue.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: IssueAction = Field(
         ...,
         description="The type of issue event that triggered the webhook",
@@ -77,9 +83,9 @@ class GitHubIssueEvent(BaseModel):
         description="The issue body/description text (may be empty)",
     )
 
-    labels: list[str] = Field(
-        default_factory=list,
-        description="List of label names attached to the issue",
+    labels: tuple[str, ...] = Field(
+        default=(),
+        description="Sorted label names attached to the issue",
     )
 
     repository: str = Field(
@@ -100,7 +106,27 @@ class GitHubIssueEvent(BaseModel):
         description="The GitHub username who created the issue",
     )
 
-    @property
+    @field_validator("labels", mode="before")
+    @classmethod
+    def sort_labels(cls, value: Any) -> Any:
+        """Normalize labels to a sorted tuple at construction time.
+
+        GitHub returns labels in an arbitrary order. Sorting once here gives
+        a canonical representation that downstream consumers can hash or
+        compare without re-sorting on every call.
+
+        Args:
+            value: The raw labels value (any iterable of label names).
+
+        Returns:
+            The labels as a sorted tuple, or the value unchanged if it is
+            not an iterable so Pydantic reports the type error.
+        """
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return tuple(sorted(value))
+        return value
+
+    @cached_property
     def issue_id(self) -> str:
         """Generate the canonical issue identifier.
 
@@ -109,7 +135,7 @@ class GitHubIssueEvent(BaseModel):
         """
         return f"{self.owner}/{self.repository}#{self.issue_number}"
 
-    @property
+    @cached_property
     def full_repository(self) -> str:
         """Generate the full repository path.
 
@@ -118,6 +144,31 @@ class GitHubIssueEvent(BaseModel):
         """
         return f"{self.owner}/{self.repository}"
 
+    @cached_property
+    def labels_set(self) -> frozenset[str]:
+        """The label names as a set, for constant-time membership checks.
+
+        Returns:
+            frozenset[str]: The issue's label names.
+        """
+        return frozenset(self.labels)
+
+    def model_copy(
+        self,
+        *,
+        update: Optional[dict[str, Any]] = None,
+        deep: bool = False,
+    ) -> "GitHubIssueEvent":
+        """Copy the model, dropping the cached derived values.
+
+        Pydantic copies the instance ``__dict__`` verbatim, which would carry
+        stale identifiers and labels into a copy with updated fields.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_PROPERTIES:
+            copied.__dict__.pop(name, None)
+        return copied
+
     def has_label(self, label_name: str) -> bool:
         """Check if the issue has a specific label.
 
@@ -127,4 +178,8 @@ class GitHubIssueEvent(BaseModel):
         Returns:
             bool: True if the issue has the specified label.
         """
-        return label_name in self.labels
+        return label_name in self.labels_set
+
+
+# cached_property values stored in GitHubIssueEvent.__dict__
+_CACHED_PROPERTIES = ("issue_id", "full_repository", "labels_set")
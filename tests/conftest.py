@@ -0,0 +1,22 @@
+"""Shared pytest configuration.
+
+Registers Hypothesis profiles for property tests that do not pin their own
+settings. Select one with the HYPOTHESIS_PROFILE environment variable:
+
+- default: Hypothesis' defaults (100 examples per property)
+- dev: 25 examples and no deadline, for quick local iteration
+- ci: 200 examples with a 5 second deadline per example
+
+Failing examples are saved to the default ``.hypothesis/examples``
+database under every profile and replayed first on the next run, so a
+shrunk failure is not shrunk again.
+"""
+
+import os
+
+from hypothesis import settings
+
+settings.register_profile("dev", max_examples=25, deadline=None)
+settings.register_profile("ci", max_examples=200, deadline=5000)
+
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
@@ -17,7 +17,7 @@ import re
 from typing import List
 
 import pytest
-from hypothesis import given, settings, strategies as st, assume
+from hypothesis import example, given, settings, strategies as st, assume
 
 from src.pipeline.classifier.models import IssueClassification, IssueType
 from src.pipeline.classifier.formatting import (
@@ -31,6 +31,29 @@ from src.pipeline.classifier.clarification import (
     NEEDS_CLARIFICATION_LABEL,
 )
 
+# Unchecked and checked markdown checklist items
+_CHECKLIST_ITEM_PATTERN = re.compile(r"^- \[ \] .+", re.MULTILINE)
+_CHECKED_ITEM_PATTERN = re.compile(r"^- \[x\] ", re.MULTILINE | re.IGNORECASE)
+
+
+def _count_checklist_items(comment: str) -> int:
+    """Count unchecked checklist lines with a plain substring scan.
+
+    The structure tests check the item format with _CHECKLIST_ITEM_PATTERN;
+    the edge cases only need the count.
+    """
+    return comment.count("\n- [ ] ") + comment.startswith("- [ ] ")
+
+
+# Managers shared by every example: the label decisions under test read only
+# the classification and label name, so no example can affect another
+_MANAGER = ClarificationManager(github_client=None)  # type: ignore
+_CUSTOM_LABEL = "custom-clarification-label"
+_CUSTOM_LABEL_MANAGER = ClarificationManager(
+    github_client=None,  # type: ignore
+    label_name=_CUSTOM_LABEL,
+)
+
 
 # =============================================================================
 # Hypothesis Strategies for Generating Clarification Data
@@ -38,11 +61,9 @@ from src.pipeline.classifier.clarification import (
 
 
 @st.composite
-def valid_issue_type(draw: st.DrawFn) -> str:
-    """Generate a valid issue type string."""
-    return draw(
-        st.sampled_from(["feature", "bug", "documentation", "infrastructure", "unknown"])
-    )
+def valid_issue_type(draw: st.DrawFn) -> IssueType:
+    """Generate a valid issue type."""
+    return draw(st.sampled_from(IssueType))
 
 
 @st.composite
@@ -68,19 +89,27 @@ def clarification_question(draw: st.DrawFn) -> str:
     """Generate a valid clarification question.
     
     Questions should be non-empty strings that don't contain newlines
-    (which would break the checklist format).
+    (which would break the checklist format). They are built around a
+    visible first and last character, so at least three characters remain
+    after stripping without filtering out drawn examples.
     """
-    question = draw(
-        st.text(
-            alphabet=st.characters(
-                whitelist_categories=("L", "N", "P", "S", "Zs"),
-                blacklist_characters="\n\r",
-            ),
-            min_size=5,
-            max_size=200,
-        ).filter(lambda x: x.strip() and len(x.strip()) >= 3)
+    visible = st.characters(whitelist_categories=("L", "N", "P", "S"))
+    padding = st.text(alphabet=st.characters(whitelist_categories=("Zs",)), max_size=3)
+    middle = st.text(
+        alphabet=st.characters(
+            whitelist_categories=("L", "N", "P", "S", "Zs"),
+            blacklist_characters="\n\r",
+        ),
+        min_size=1,
+        max_size=192,
+    )
+    return (
+        draw(padding)
+        + draw(visible)
+        + draw(middle)
+        + draw(visible)
+        + draw(padding)
     )
-    return question
 
 
 @st.composite
@@ -99,7 +128,7 @@ def classification_needing_clarification(draw: st.DrawFn) -> IssueClassification
     questions = draw(non_empty_question_list())
     
     return IssueClassification(
-        issue_type=IssueType(issue_type),
+        issue_type=issue_type,
         completeness_score=score,
         clarification_questions=questions,
     )
@@ -112,7 +141,7 @@ def classification_not_needing_clarification(draw: st.DrawFn) -> IssueClassifica
     score = draw(high_completeness_score())
     
     return IssueClassification(
-        issue_type=IssueType(issue_type),
+        issue_type=issue_type,
         completeness_score=score,
         clarification_questions=[],
     )
@@ -131,7 +160,7 @@ def any_valid_classification(draw: st.DrawFn) -> IssueClassification:
         questions = draw(st.lists(clarification_question(), max_size=3))
     
     return IssueClassification(
-        issue_type=IssueType(issue_type),
+        issue_type=issue_type,
         completeness_score=score,
         clarification_questions=questions,
     )
@@ -172,8 +201,7 @@ class TestClarificationCommentStructure:
         assert comment, "Comment should not be empty when questions exist"
         
         # Count checklist items in the comment
-        checklist_pattern = r"^- \[ \] .+"
-        checklist_items = re.findall(checklist_pattern, comment, re.MULTILINE)
+        checklist_items = _CHECKLIST_ITEM_PATTERN.findall(comment)
         
         assert len(checklist_items) >= 1, (
             f"Comment should contain at least one checklist item, "
@@ -196,8 +224,7 @@ class TestClarificationCommentStructure:
         comment = format_clarification_comment(classification)
         
         # Find all lines that should be checklist items
-        checklist_pattern = r"^- \[ \] .+"
-        checklist_items = re.findall(checklist_pattern, comment, re.MULTILINE)
+        checklist_items = _CHECKLIST_ITEM_PATTERN.findall(comment)
         
         # Each question should appear as a checklist item
         assert len(checklist_items) == len(classification.clarification_questions), (
@@ -230,13 +257,18 @@ class TestClarificationCommentStructure:
         )
         
         comment = format_clarification_comment(classification)
+        items = {
+            line[len("- [ ] "):]
+            for line in comment.splitlines()
+            if line.startswith("- [ ] ")
+        }
         
-        # Each question should appear in the comment (after sanitization)
+        # Each question should be a checklist item (after sanitization)
         for question in questions:
             sanitized = _sanitize_question(question)
             if sanitized:  # Only check non-empty sanitized questions
-                assert sanitized in comment, (
-                    f"Question '{sanitized[:50]}...' should appear in comment"
+                assert sanitized in items, (
+                    f"Question '{sanitized[:50]}...' should appear in checklist"
                 )
 
     @given(classification=classification_needing_clarification())
@@ -254,8 +286,7 @@ class TestClarificationCommentStructure:
         comment = format_clarification_comment(classification)
         
         # Should not contain checked items
-        checked_pattern = r"^- \[x\] "
-        checked_items = re.findall(checked_pattern, comment, re.MULTILINE | re.IGNORECASE)
+        checked_items = _CHECKED_ITEM_PATTERN.findall(comment)
         
         assert len(checked_items) == 0, (
             f"Comment should not contain checked items, found {len(checked_items)}"
@@ -300,8 +331,10 @@ class TestClarificationCommentStructure:
         **Validates: Requirements 3.2**
         """
         # Ensure no questions
-        classification.clarification_questions = []
-        
+        classification = classification.model_copy(
+            update={"clarification_questions": []}
+        )
+
         comment = format_clarification_comment(classification)
         
         assert comment == "", (
@@ -351,112 +384,36 @@ class TestLabelStateConsistency:
     **Validates: Requirements 3.4, 3.6**
     """
 
-    @given(classification=classification_needing_clarification())
-    @settings(max_examples=100)
-    def test_label_added_when_completeness_below_3(
-        self, classification: IssueClassification
-    ) -> None:
-        """Property 6: Label added when completeness below 3.
-
-        *For any* issue with completeness score below 3, the
-        `needs-clarification` label SHALL be added.
-
-        **Validates: Requirements 3.4**
-        """
-        # Verify the classification needs clarification
-        assert classification.completeness_score < 3
-        
-        # Test determine_label_action
-        action = determine_label_action(classification)
-        assert action == "add", (
-            f"Label action should be 'add' for score {classification.completeness_score}, "
-            f"got '{action}'"
-        )
-        
-        # Test ClarificationManager.should_add_label
-        manager = ClarificationManager(github_client=None)  # type: ignore
-        assert manager.should_add_label(classification) is True, (
-            f"should_add_label should return True for score {classification.completeness_score}"
-        )
-        assert manager.should_remove_label(classification) is False, (
-            f"should_remove_label should return False for score {classification.completeness_score}"
-        )
-
-    @given(classification=classification_not_needing_clarification())
-    @settings(max_examples=100)
-    def test_label_removed_when_completeness_3_or_above(
-        self, classification: IssueClassification
-    ) -> None:
-        """Property 6: Label removed when completeness 3 or above.
-
-        *For any* issue with completeness score of 3 or above, the
-        `needs-clarification` label SHALL be removed.
-
-        **Validates: Requirements 3.6**
-        """
-        # Verify the classification doesn't need clarification
-        assert classification.completeness_score >= 3
-        
-        # Test determine_label_action
-        action = determine_label_action(classification)
-        assert action == "remove", (
-            f"Label action should be 'remove' for score {classification.completeness_score}, "
-            f"got '{action}'"
-        )
-        
-        # Test ClarificationManager.should_remove_label
-        manager = ClarificationManager(github_client=None)  # type: ignore
-        assert manager.should_remove_label(classification) is True, (
-            f"should_remove_label should return True for score {classification.completeness_score}"
-        )
-        assert manager.should_add_label(classification) is False, (
-            f"should_add_label should return False for score {classification.completeness_score}"
-        )
-
-    @given(score=low_completeness_score())
-    @settings(max_examples=100)
-    def test_low_scores_consistently_add_label(
-        self, score: int
-    ) -> None:
-        """Property 6: All low scores (1-2) consistently add label.
+    @given(issue_type=valid_issue_type(), score=valid_completeness_score())
+    @example(issue_type=IssueType.FEATURE, score=2)
+    @example(issue_type=IssueType.FEATURE, score=3)
+    def test_label_action_matches_score(self, issue_type: IssueType, score: int) -> None:
+        """Property 6: Label added below completeness 3, removed from 3.
 
-        *For any* completeness score of 1 or 2, the label action SHALL
-        always be 'add'.
+        *For any* completeness score, the `needs-clarification` label SHALL
+        be added when the score is below 3 and removed when it is 3 or
+        above. The examples pin both sides of the boundary.
 
-        **Validates: Requirements 3.4**
+        **Validates: Requirements 3.4, 3.6**
         """
+        needs_clarification = score < 3
         classification = IssueClassification(
-            issue_type=IssueType.FEATURE,
+            issue_type=issue_type,
             completeness_score=score,
-            clarification_questions=["What is the expected behavior?"],
+            clarification_questions=(
+                ["What is the expected behavior?"] if needs_clarification else []
+            ),
         )
-        
-        action = determine_label_action(classification)
-        assert action == "add", f"Score {score} should result in 'add' action"
+        expected = "add" if needs_clarification else "remove"
 
-    @given(score=high_completeness_score())
-    @settings(max_examples=100)
-    def test_high_scores_consistently_remove_label(
-        self, score: int
-    ) -> None:
-        """Property 6: All high scores (3-5) consistently remove label.
-
-        *For any* completeness score of 3, 4, or 5, the label action SHALL
-        always be 'remove'.
-
-        **Validates: Requirements 3.6**
-        """
-        classification = IssueClassification(
-            issue_type=IssueType.FEATURE,
-            completeness_score=score,
-            clarification_questions=[],
-        )
-        
         action = determine_label_action(classification)
-        assert action == "remove", f"Score {score} should result in 'remove' action"
+        assert action == expected, (
+            f"Label action should be '{expected}' for score {score}, got '{action}'"
+        )
+        assert _MANAGER.should_add_label(classification) is needs_clarification
+        assert _MANAGER.should_remove_label(classification) is not needs_clarification
 
     @given(classification=any_valid_classification())
-    @settings(max_examples=100)
     def test_label_action_mutually_exclusive(
         self, classification: IssueClassification
     ) -> None:
@@ -467,10 +424,9 @@ class TestLabelStateConsistency:
 
         **Validates: Requirements 3.4, 3.6**
         """
-        manager = ClarificationManager(github_client=None)  # type: ignore
         
-        should_add = manager.should_add_label(classification)
-        should_remove = manager.should_remove_label(classification)
+        should_add = _MANAGER.should_add_label(classification)
+        should_remove = _MANAGER.should_remove_label(classification)
         
         # Exactly one should be True
         assert should_add != should_remove, (
@@ -480,7 +436,6 @@ class TestLabelStateConsistency:
         )
 
     @given(classification=any_valid_classification())
-    @settings(max_examples=100)
     def test_determine_label_action_consistent_with_manager(
         self, classification: IssueClassification
     ) -> None:
@@ -491,70 +446,19 @@ class TestLabelStateConsistency:
 
         **Validates: Requirements 3.4, 3.6**
         """
-        manager = ClarificationManager(github_client=None)  # type: ignore
         action = determine_label_action(classification)
         
         if action == "add":
-            assert manager.should_add_label(classification) is True
-            assert manager.should_remove_label(classification) is False
+            assert _MANAGER.should_add_label(classification) is True
+            assert _MANAGER.should_remove_label(classification) is False
         elif action == "remove":
-            assert manager.should_remove_label(classification) is True
-            assert manager.should_add_label(classification) is False
+            assert _MANAGER.should_remove_label(classification) is True
+            assert _MANAGER.should_add_label(classification) is False
         else:
             # "none" case should not occur with valid classifications
             pytest.fail(f"Unexpected action '{action}' for valid classification")
 
-    @given(issue_type=valid_issue_type())
-    @settings(max_examples=100)
-    def test_boundary_score_3_removes_label(
-        self, issue_type: str
-    ) -> None:
-        """Property 6: Boundary score 3 removes label.
-
-        Score 3 is the boundary between needing clarification (1-2) and
-        being actionable (3-5). Score 3 SHALL result in label removal.
-
-        **Validates: Requirements 3.6**
-        """
-        classification = IssueClassification(
-            issue_type=IssueType(issue_type),
-            completeness_score=3,
-            clarification_questions=[],
-        )
-        
-        action = determine_label_action(classification)
-        assert action == "remove", "Score 3 should result in 'remove' action"
-        
-        manager = ClarificationManager(github_client=None)  # type: ignore
-        assert manager.should_remove_label(classification) is True
-        assert manager.should_add_label(classification) is False
-
-    @given(issue_type=valid_issue_type())
-    @settings(max_examples=100)
-    def test_boundary_score_2_adds_label(
-        self, issue_type: str
-    ) -> None:
-        """Property 6: Boundary score 2 adds label.
-
-        Score 2 is below the threshold and SHALL result in label addition.
-
-        **Validates: Requirements 3.4**
-        """
-        classification = IssueClassification(
-            issue_type=IssueType(issue_type),
-            completeness_score=2,
-            clarification_questions=["What is the expected behavior?"],
-        )
-        
-        action = determine_label_action(classification)
-        assert action == "add", "Score 2 should result in 'add' action"
-        
-        manager = ClarificationManager(github_client=None)  # type: ignore
-        assert manager.should_add_label(classification) is True
-        assert manager.should_remove_label(classification) is False
-
     @given(classification=any_valid_classification())
-    @settings(max_examples=100)
     def test_label_state_consistent_with_needs_clarification(
         self, classification: IssueClassification
     ) -> None:
@@ -565,14 +469,13 @@ class TestLabelStateConsistency:
 
         **Validates: Requirements 3.4, 3.6**
         """
-        manager = ClarificationManager(github_client=None)  # type: ignore
         
         if classification.needs_clarification:
-            assert manager.should_add_label(classification) is True, (
+            assert _MANAGER.should_add_label(classification) is True, (
                 "should_add_label should be True when needs_clarification is True"
             )
         else:
-            assert manager.should_remove_label(classification) is True, (
+            assert _MANAGER.should_remove_label(classification) is True, (
                 "should_remove_label should be True when needs_clarification is False"
             )
 
@@ -590,16 +493,15 @@ class TestClarificationWorkflowEdgeCases:
         issue_type=valid_issue_type(),
         questions=non_empty_question_list(),
     )
-    @settings(max_examples=100)
     def test_minimum_score_1_adds_label_and_has_comment(
-        self, issue_type: str, questions: List[str]
+        self, issue_type: IssueType, questions: List[str]
     ) -> None:
         """Edge case: Minimum score 1 adds label and generates comment.
 
         **Validates: Requirements 3.2, 3.4**
         """
         classification = IssueClassification(
-            issue_type=IssueType(issue_type),
+            issue_type=issue_type,
             completeness_score=1,
             clarification_questions=questions,
         )
@@ -613,17 +515,16 @@ class TestClarificationWorkflowEdgeCases:
         assert comment, "Comment should be generated for score 1"
         assert "- [ ]" in comment, "Comment should contain checklist items"
 
-    @given(issue_type=valid_issue_type())
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("issue_type", list(IssueType))
     def test_maximum_score_5_removes_label(
-        self, issue_type: str
+        self, issue_type: IssueType
     ) -> None:
         """Edge case: Maximum score 5 removes label.
 
         **Validates: Requirements 3.6**
         """
         classification = IssueClassification(
-            issue_type=IssueType(issue_type),
+            issue_type=issue_type,
             completeness_score=5,
             clarification_questions=[],
         )
@@ -632,7 +533,6 @@ class TestClarificationWorkflowEdgeCases:
         assert action == "remove"
 
     @given(questions=st.lists(clarification_question(), min_size=1, max_size=1))
-    @settings(max_examples=100)
     def test_single_question_produces_valid_checklist(
         self, questions: List[str]
     ) -> None:
@@ -649,12 +549,9 @@ class TestClarificationWorkflowEdgeCases:
         comment = format_clarification_comment(classification)
         
         # Should have exactly one checklist item
-        checklist_pattern = r"^- \[ \] .+"
-        checklist_items = re.findall(checklist_pattern, comment, re.MULTILINE)
-        assert len(checklist_items) == 1
+        assert _count_checklist_items(comment) == 1
 
     @given(questions=st.lists(clarification_question(), min_size=5, max_size=10))
-    @settings(max_examples=100)
     def test_many_questions_all_appear_in_checklist(
         self, questions: List[str]
     ) -> None:
@@ -671,12 +568,9 @@ class TestClarificationWorkflowEdgeCases:
         comment = format_clarification_comment(classification)
         
         # Should have all questions as checklist items
-        checklist_pattern = r"^- \[ \] .+"
-        checklist_items = re.findall(checklist_pattern, comment, re.MULTILINE)
-        assert len(checklist_items) == len(questions)
+        assert _count_checklist_items(comment) == len(questions)
 
     @given(classification=any_valid_classification())
-    @settings(max_examples=100)
     def test_custom_label_name_supported(
         self, classification: IssueClassification
     ) -> None:
@@ -684,25 +578,15 @@ class TestClarificationWorkflowEdgeCases:
 
         **Validates: Requirements 3.4, 3.6**
         """
-        custom_label = "custom-clarification-label"
-        manager = ClarificationManager(
-            github_client=None,  # type: ignore
-            label_name=custom_label,
-        )
-        
-        assert manager.label_name == custom_label
+        assert _CUSTOM_LABEL_MANAGER.label_name == _CUSTOM_LABEL
         
         # Methods should still work correctly
         if classification.completeness_score < 3:
-            assert manager.should_add_label(classification) is True
+            assert _CUSTOM_LABEL_MANAGER.should_add_label(classification) is True
         else:
-            assert manager.should_remove_label(classification) is True
+            assert _CUSTOM_LABEL_MANAGER.should_remove_label(classification) is True
 
-    @given(issue_type=valid_issue_type())
-    @settings(max_examples=100)
-    def test_default_label_name_is_needs_clarification(
-        self, issue_type: str
-    ) -> None:
+    def test_default_label_name_is_needs_clarification(self) -> None:
         """Edge case: Default label name is 'needs-clarification'.
 
         **Validates: Requirements 3.4**
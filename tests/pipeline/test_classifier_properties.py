@@ -14,7 +14,7 @@ Testing Configuration:
 - Tag format: Feature: agent-orchestration, Property N: <property_text>
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 import pytest
 from hypothesis import given, settings, strategies as st, assume
@@ -29,83 +29,75 @@ from src.pipeline.classifier.agent import _validate_and_normalize_response
 # =============================================================================
 
 
-@st.composite
-def valid_issue_type(draw: st.DrawFn) -> str:
-    """Generate a valid issue type string.
+# Strategies that need no dependent draws are built once as plain strategy
+# objects rather than @st.composite functions.
 
-    Returns one of the valid IssueType enum values.
-    """
-    return draw(
-        st.sampled_from(["feature", "bug", "documentation", "infrastructure", "unknown"])
-    )
+# A valid issue type string: one of the IssueType enum values
+valid_issue_type = st.sampled_from(
+    ["feature", "bug", "documentation", "infrastructure", "unknown"]
+)
 
 
-@st.composite
-def valid_completeness_score(draw: st.DrawFn) -> int:
-    """Generate a valid completeness score (1-5)."""
-    return draw(st.integers(min_value=1, max_value=5))
+# A valid completeness score (1-5)
+valid_completeness_score = st.integers(min_value=1, max_value=5)
 
 
-@st.composite
-def invalid_completeness_score(draw: st.DrawFn) -> int:
-    """Generate an invalid completeness score (outside 1-5 range)."""
-    return draw(
-        st.one_of(
-            st.integers(max_value=0),
-            st.integers(min_value=6),
-        )
-    )
+# An invalid completeness score (outside 1-5 range)
+invalid_completeness_score = st.one_of(
+    st.integers(max_value=0),
+    st.integers(min_value=6),
+)
 
 
-@st.composite
-def low_completeness_score(draw: st.DrawFn) -> int:
-    """Generate a low completeness score (1-2) that requires clarification."""
-    return draw(st.integers(min_value=1, max_value=2))
+# A low completeness score (1-2) that requires clarification
+low_completeness_score = st.integers(min_value=1, max_value=2)
 
 
-@st.composite
-def high_completeness_score(draw: st.DrawFn) -> int:
-    """Generate a high completeness score (3-5) that doesn't require clarification."""
-    return draw(st.integers(min_value=3, max_value=5))
+# A high completeness score (3-5) that doesn't require clarification
+high_completeness_score = st.integers(min_value=3, max_value=5)
+
+
+# Characters str.strip() never removes: every whitespace character is in a
+# separator category or is a control character
+_VISIBLE_CHARACTER = st.characters(blacklist_categories=("Zs", "Zl", "Zp", "Cc"))
+
+
+def _text_with_visible_character(draw: st.DrawFn, max_size: int) -> str:
+    """Draw arbitrary text that is not blank, without filtering draws.
+
+    The text is built around one character that survives stripping, with
+    arbitrary text on either side.
+    """
+    before = draw(st.text(max_size=(max_size - 1) // 2))
+    after = draw(st.text(max_size=max_size - 1 - len(before)))
+    return before + draw(_VISIBLE_CHARACTER) + after
 
 
 @st.composite
 def requirement_string(draw: st.DrawFn) -> str:
     """Generate a valid requirement string."""
-    return draw(
-        st.text(min_size=1, max_size=200).filter(lambda x: x.strip())
-    )
+    return _text_with_visible_character(draw, max_size=200)
 
 
-@st.composite
-def package_name(draw: st.DrawFn) -> str:
-    """Generate a valid package name."""
-    return draw(
-        st.text(
-            alphabet=st.sampled_from(
-                "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
-            ),
-            min_size=1,
-            max_size=50,
-        ).filter(lambda x: x.strip())
-    )
+# A valid package name
+package_name = st.text(
+    alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.",
+    min_size=1,
+    max_size=50,
+)
 
 
 @st.composite
 def clarification_question(draw: st.DrawFn) -> str:
     """Generate a valid clarification question."""
-    return draw(
-        st.text(min_size=1, max_size=300).filter(lambda x: x.strip())
-    )
+    return _text_with_visible_character(draw, max_size=300)
 
 
-@st.composite
-def valid_confidence(draw: st.DrawFn) -> Optional[float]:
-    """Generate a valid confidence score (0.0-1.0) or None."""
-    include_confidence = draw(st.booleans())
-    if not include_confidence:
-        return None
-    return draw(st.floats(min_value=0.0, max_value=1.0, allow_nan=False))
+# A valid confidence score (0.0-1.0) or None
+valid_confidence = st.one_of(
+    st.none(),
+    st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+)
 
 
 @st.composite
@@ -115,11 +107,11 @@ def valid_classification_data(draw: st.DrawFn) -> Dict[str, Any]:
     This strategy generates data that should successfully create an
     IssueClassification object.
     """
-    issue_type = draw(valid_issue_type())
-    completeness_score = draw(valid_completeness_score())
+    issue_type = draw(valid_issue_type)
+    completeness_score = draw(valid_completeness_score)
     requirements = draw(st.lists(requirement_string(), max_size=10))
-    affected_packages = draw(st.lists(package_name(), max_size=5))
-    confidence = draw(valid_confidence())
+    affected_packages = draw(st.lists(package_name, max_size=5))
+    confidence = draw(valid_confidence)
     reasoning = draw(st.one_of(st.none(), st.text(min_size=1, max_size=200).filter(lambda x: x.strip())))
 
     # Generate clarification questions based on completeness score
@@ -155,7 +147,7 @@ def llm_response_data(draw: st.DrawFn) -> Dict[str, Any]:
     # Issue type might be invalid or have different casing
     issue_type = draw(
         st.one_of(
-            valid_issue_type(),
+            valid_issue_type,
             st.sampled_from(["FEATURE", "Bug", "DOCUMENTATION", "invalid_type"]),
         )
     )
@@ -170,7 +162,7 @@ def llm_response_data(draw: st.DrawFn) -> Dict[str, Any]:
     )
 
     requirements = draw(st.lists(requirement_string(), max_size=10))
-    affected_packages = draw(st.lists(package_name(), max_size=5))
+    affected_packages = draw(st.lists(package_name, max_size=5))
     clarification_questions = draw(st.lists(clarification_question(), max_size=5))
 
     # Confidence might be out of range
@@ -239,7 +231,7 @@ class TestClassificationOutputValidation:
         assert classification.completeness_score == data["completeness_score"]
         assert 1 <= classification.completeness_score <= 5
 
-    @given(issue_type=valid_issue_type())
+    @given(issue_type=valid_issue_type)
     @settings(max_examples=100)
     def test_issue_type_is_valid_enum_value(self, issue_type: str) -> None:
         """Property 3: Issue type is always a valid enum value.
@@ -256,7 +248,7 @@ class TestClassificationOutputValidation:
         issue_type_enum = IssueType(issue_type)
         assert issue_type_enum.value == issue_type
 
-    @given(score=valid_completeness_score())
+    @given(score=valid_completeness_score)
     @settings(max_examples=100)
     def test_completeness_score_in_valid_range(self, score: int) -> None:
         """Property 3: Completeness score is always in range 1-5.
@@ -274,7 +266,7 @@ class TestClassificationOutputValidation:
         assert isinstance(classification.completeness_score, int)
         assert 1 <= classification.completeness_score <= 5
 
-    @given(score=invalid_completeness_score())
+    @given(score=invalid_completeness_score)
     @settings(max_examples=100)
     def test_invalid_completeness_score_rejected(self, score: int) -> None:
         """Property 3: Invalid completeness scores are rejected.
@@ -347,6 +339,26 @@ class TestClassificationOutputValidation:
         assert restored.affected_packages == classification.affected_packages
         assert restored.clarification_questions == classification.clarification_questions
 
+    @given(data=valid_classification_data())
+    @settings(max_examples=100)
+    def test_cached_dict_matches_to_dict(
+        self, data: Dict[str, Any]
+    ) -> None:
+        """Property 3: Cached as_dict matches a fresh to_dict.
+
+        *For any* valid classification, the memoized ``as_dict`` SHALL equal
+        ``to_dict()`` and SHALL NOT leak into copies with updated fields.
+
+        **Validates: Requirements 2.1, 2.4**
+        """
+        classification = IssueClassification(**data)
+
+        assert classification.as_dict == classification.to_dict()
+        assert classification.as_dict is classification.as_dict
+
+        copied = classification.model_copy(update={"completeness_score": 5})
+        assert copied.as_dict["completeness_score"] == 5
+
 
 class TestClarificationQuestionGeneration:
     """Property tests for clarification question generation.
@@ -360,7 +372,7 @@ class TestClarificationQuestionGeneration:
     """
 
     @given(
-        score=low_completeness_score(),
+        score=low_completeness_score,
         questions=st.lists(clarification_question(), min_size=1, max_size=5),
     )
     @settings(max_examples=100)
@@ -387,7 +399,7 @@ class TestClarificationQuestionGeneration:
         # Verify questions are present
         assert len(classification.clarification_questions) > 0
 
-    @given(score=high_completeness_score())
+    @given(score=high_completeness_score)
     @settings(max_examples=100)
     def test_high_score_does_not_need_clarification(self, score: int) -> None:
         """Property 4: High completeness score does not need clarification.
@@ -432,8 +444,8 @@ class TestClarificationQuestionGeneration:
             assert isinstance(question, str)
 
     @given(
-        score=low_completeness_score(),
-        issue_type=valid_issue_type(),
+        score=low_completeness_score,
+        issue_type=valid_issue_type,
     )
     @settings(max_examples=100)
     def test_create_unknown_has_clarification_questions(
@@ -459,7 +471,7 @@ class TestClarificationQuestionGeneration:
         assert len(classification.clarification_questions) > 0
 
     @given(
-        score=low_completeness_score(),
+        score=low_completeness_score,
         questions=st.lists(clarification_question(), min_size=1, max_size=5),
     )
     @settings(max_examples=100)
@@ -494,9 +506,9 @@ class TestClassificationEdgeCases:
     """
 
     @given(
-        issue_type=valid_issue_type(),
+        issue_type=valid_issue_type,
         requirements=st.lists(requirement_string(), max_size=20),
-        packages=st.lists(package_name(), max_size=10),
+        packages=st.lists(package_name, max_size=10),
     )
     @settings(max_examples=100)
     def test_boundary_completeness_score_3(
@@ -525,9 +537,9 @@ class TestClassificationEdgeCases:
         assert classification.is_actionable is True
 
     @given(
-        issue_type=valid_issue_type(),
+        issue_type=valid_issue_type,
         requirements=st.lists(requirement_string(), max_size=20),
-        packages=st.lists(package_name(), max_size=10),
+        packages=st.lists(package_name, max_size=10),
         questions=st.lists(clarification_question(), min_size=1, max_size=5),
     )
     @settings(max_examples=100)
@@ -556,7 +568,7 @@ class TestClassificationEdgeCases:
         assert classification.needs_clarification is True
         assert classification.is_actionable is False
 
-    @given(issue_type=valid_issue_type())
+    @given(issue_type=valid_issue_type)
     @settings(max_examples=100)
     def test_minimum_completeness_score(self, issue_type: str) -> None:
         """Edge case: Minimum completeness score (1) is valid.
@@ -572,7 +584,7 @@ class TestClassificationEdgeCases:
         assert classification.completeness_score == 1
         assert classification.needs_clarification is True
 
-    @given(issue_type=valid_issue_type())
+    @given(issue_type=valid_issue_type)
     @settings(max_examples=100)
     def test_maximum_completeness_score(self, issue_type: str) -> None:
         """Edge case: Maximum completeness score (5) is valid.
@@ -588,8 +600,8 @@ class TestClassificationEdgeCases:
         assert classification.is_actionable is True
 
     @given(
-        issue_type=valid_issue_type(),
-        score=valid_completeness_score(),
+        issue_type=valid_issue_type,
+        score=valid_completeness_score,
     )
     @settings(max_examples=100)
     def test_empty_requirements_list_valid(
@@ -608,8 +620,8 @@ class TestClassificationEdgeCases:
         assert classification.requirements == []
 
     @given(
-        issue_type=valid_issue_type(),
-        score=valid_completeness_score(),
+        issue_type=valid_issue_type,
+        score=valid_completeness_score,
     )
     @settings(max_examples=100)
     def test_empty_affected_packages_valid(
@@ -628,8 +640,8 @@ class TestClassificationEdgeCases:
         assert classification.affected_packages == []
 
     @given(
-        issue_type=valid_issue_type(),
-        score=high_completeness_score(),
+        issue_type=valid_issue_type,
+        score=high_completeness_score,
     )
     @settings(max_examples=100)
     def test_high_score_with_questions_still_actionable(
@@ -41,11 +41,11 @@ def _make_mock_process(
     process.kill = MagicMock()
 
     stdout_reader = AsyncMock()
-    stdout_reader.readline = AsyncMock(
+    stdout_reader.read = AsyncMock(
         side_effect=list(stdout_lines) + [b""]
     )
     stderr_reader = AsyncMock()
-    stderr_reader.readline = AsyncMock(
+    stderr_reader.read = AsyncMock(
         side_effect=list(stderr_lines) + [b""]
     )
 
@@ -261,22 +261,33 @@ class TestTimeoutProperty:
             task = Path(tmpdir) / "task.md"
             task.write_text("task")
 
-            runner = KiroRunner(kiro_path="/bin/kiro", timeout_seconds=timeout)
+            runner = KiroRunner(
+                kiro_path="/bin/kiro",
+                timeout_seconds=timeout,
+                terminate_grace_seconds=0.01,
+            )
             process = AsyncMock()
-            process.kill = MagicMock()
+            exited = asyncio.Event()
+            process.kill = MagicMock(side_effect=lambda: exited.set())
+            process.terminate = MagicMock()
 
             stdout_reader = AsyncMock()
             stderr_reader = AsyncMock()
 
-            async def hang():
+            async def hang(*args):
                 await asyncio.sleep(1000)
                 return b""
 
-            stdout_reader.readline = hang
-            stderr_reader.readline = hang
+            stdout_reader.read = hang
+            stderr_reader.read = hang
             process.stdout = stdout_reader
             process.stderr = stderr_reader
-            process.wait = AsyncMock(side_effect=asyncio.sleep(1000))
+
+            async def wait():
+                await exited.wait()
+                return -9
+
+            process.wait = wait
 
             with patch(
                 "asyncio.create_subprocess_exec", return_value=process
@@ -54,11 +54,11 @@ def _make_mock_process(
     stderr_data = b"".join(stderr_lines) if stderr_lines else b""
 
     stdout_reader = AsyncMock()
-    stdout_reader.readline = AsyncMock(
+    stdout_reader.read = AsyncMock(
         side_effect=list(stdout_lines or []) + [b""]
     )
     stderr_reader = AsyncMock()
-    stderr_reader.readline = AsyncMock(
+    stderr_reader.read = AsyncMock(
         side_effect=list(stderr_lines or []) + [b""]
     )
 
@@ -69,6 +69,46 @@ def _make_mock_process(
     return process
 
 
+def _make_hanging_process(
+    exits_on_terminate: bool,
+    stdout_data: bytes = b"",
+    stderr_data: bytes = b"",
+):
+    """Build a mock subprocess that never finishes on its own.
+
+    Each stream yields its data once and then blocks. wait() only returns
+    after kill(), or after terminate() when exits_on_terminate is set.
+    """
+    process = AsyncMock()
+    exited = asyncio.Event()
+    process.kill = MagicMock(side_effect=lambda: exited.set())
+    process.terminate = MagicMock(
+        side_effect=lambda: exited.set() if exits_on_terminate else None
+    )
+
+    def hanging_reader(data: bytes):
+        chunks = [data] if data else []
+
+        async def read(*args):
+            if chunks:
+                return chunks.pop()
+            await asyncio.sleep(100)
+            return b""
+
+        reader = AsyncMock()
+        reader.read = read
+        return reader
+
+    async def wait():
+        await exited.wait()
+        return -15
+
+    process.stdout = hanging_reader(stdout_data)
+    process.stderr = hanging_reader(stderr_data)
+    process.wait = wait
+    return process
+
+
 class TestSuccessfulExecution:
     """Validates Requirement 5.5: exit code 0 → success."""
 
@@ -155,23 +195,11 @@ class TestTimeoutEnforcement:
         self, workspace_path, task_file
     ):
         short_timeout_runner = KiroRunner(
-            kiro_path="/usr/local/bin/kiro-cli", timeout_seconds=1
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=1,
+            terminate_grace_seconds=0.05,
         )
-        process = AsyncMock()
-        process.kill = MagicMock()
-
-        stdout_reader = AsyncMock()
-        stderr_reader = AsyncMock()
-
-        async def hang_forever():
-            await asyncio.sleep(100)
-            return b""
-
-        stdout_reader.readline = hang_forever
-        stderr_reader.readline = hang_forever
-        process.stdout = stdout_reader
-        process.stderr = stderr_reader
-        process.wait = AsyncMock(side_effect=asyncio.sleep(100))
+        process = _make_hanging_process(exits_on_terminate=False)
 
         with patch(
             "asyncio.create_subprocess_exec", return_value=process
@@ -183,27 +211,60 @@ class TestTimeoutEnforcement:
         assert result.success is False
         assert result.exit_code == -1
         assert "timed out" in result.stderr
+        process.terminate.assert_called_once()
         process.kill.assert_called_once()
 
-    def test_timeout_duration_is_recorded(self, workspace_path, task_file):
+    def test_timeout_terminates_gracefully_when_process_exits(
+        self, workspace_path, task_file
+    ):
         short_timeout_runner = KiroRunner(
-            kiro_path="/usr/local/bin/kiro-cli", timeout_seconds=1
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=1,
+            terminate_grace_seconds=0.05,
         )
-        process = AsyncMock()
-        process.kill = MagicMock()
+        process = _make_hanging_process(exits_on_terminate=True)
 
-        stdout_reader = AsyncMock()
-        stderr_reader = AsyncMock()
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(
+                short_timeout_runner.run(workspace_path, task_file)
+            )
 
-        async def hang():
-            await asyncio.sleep(100)
-            return b""
+        assert result.success is False
+        process.terminate.assert_called_once()
+        process.kill.assert_not_called()
+
+    def test_timeout_keeps_partial_output(self, workspace_path, task_file):
+        short_timeout_runner = KiroRunner(
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=1,
+            terminate_grace_seconds=0.05,
+        )
+        process = _make_hanging_process(
+            exits_on_terminate=True,
+            stdout_data=b"step 1 done\n",
+            stderr_data=b"warning: slow\n",
+        )
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(
+                short_timeout_runner.run(workspace_path, task_file)
+            )
+
+        assert result.stdout == "step 1 done"
+        assert result.stderr.startswith("warning: slow\n")
+        assert "timed out" in result.stderr
 
-        stdout_reader.readline = hang
-        stderr_reader.readline = hang
-        process.stdout = stdout_reader
-        process.stderr = stderr_reader
-        process.wait = AsyncMock(side_effect=asyncio.sleep(100))
+    def test_timeout_duration_is_recorded(self, workspace_path, task_file):
+        short_timeout_runner = KiroRunner(
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=1,
+            terminate_grace_seconds=0.05,
+        )
+        process = _make_hanging_process(exits_on_terminate=False)
 
         with patch(
             "asyncio.create_subprocess_exec", return_value=process
@@ -359,6 +420,99 @@ class TestOutputCapture:
         assert "out" in result.stdout
         assert "warn" in result.stderr
 
+    def test_lines_split_across_chunks_are_reassembled(
+        self, runner, workspace_path, task_file
+    ):
+        process = _make_mock_process(
+            returncode=0,
+            stdout_lines=[b"al", b"pha\nbe", b"ta\ngam", b"ma"],
+        )
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(runner.run(workspace_path, task_file))
+
+        assert result.stdout == "alpha\nbeta\ngamma"
+
+    def test_multibyte_character_split_across_chunks(
+        self, runner, workspace_path, task_file
+    ):
+        process = _make_mock_process(
+            returncode=0,
+            stdout_lines=[b"caf\xc3", b"\xa9\n"],
+        )
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(runner.run(workspace_path, task_file))
+
+        assert result.stdout == "caf\u00e9"
+
+    def test_long_output_keeps_head_and_tail(
+        self, workspace_path, task_file
+    ):
+        bounded_runner = KiroRunner(
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=60,
+            max_captured_bytes=42,
+        )
+        lines = [f"line{i:02d}\n".encode() for i in range(20)]
+        process = _make_mock_process(returncode=0, stdout_lines=lines)
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(bounded_runner.run(workspace_path, task_file))
+
+        captured = result.stdout.split("\n")
+        assert captured[:3] == ["line00", "line01", "line02"]
+        assert captured[-3:] == ["line17", "line18", "line19"]
+        assert "truncated" in result.stdout
+        assert "line10" not in result.stdout
+
+    def test_output_without_newlines_stays_bounded(
+        self, workspace_path, task_file
+    ):
+        bounded_runner = KiroRunner(
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=60,
+            max_captured_bytes=1024,
+        )
+        chunks = [b"\rprogress " + b"#" * 990 for _ in range(100)]
+        process = _make_mock_process(returncode=0, stdout_lines=chunks)
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(bounded_runner.run(workspace_path, task_file))
+
+        dropped = sum(map(len, chunks)) - 512
+        assert result.stdout == (
+            f"... <truncated {dropped} bytes> ...\n"
+            + b"".join(chunks)[-512:].decode()
+        )
+
+
+    def test_long_line_is_cut_while_streaming(
+        self, workspace_path, task_file
+    ):
+        bounded_runner = KiroRunner(
+            kiro_path="/usr/local/bin/kiro-cli",
+            timeout_seconds=60,
+            max_captured_bytes=1024,
+        )
+        chunks = [b"#" * 1000 for _ in range(100)] + [b"\nend\n"]
+        process = _make_mock_process(returncode=0, stdout_lines=chunks)
+        received = []
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ):
+            result = run_async(
+                bounded_runner.run(workspace_path, task_file, received.append)
+            )
+
+        assert received == ["[stdout] " + "#" * 1024, "[stdout] end"]
+        assert result.stdout.endswith("\nend")
+        assert len(result.stdout) < 1024 + 64
+        assert "truncated" in result.stdout
 
 class TestSubprocessArguments:
     """Validates Requirements 5.1, 5.2: workspace path and task file args."""
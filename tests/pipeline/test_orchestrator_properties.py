@@ -23,6 +23,7 @@ from src.pipeline.orchestrator import PipelineOrchestrator
 from src.pipeline.provisioner.workspace import ProvisionedWorkspace
 from src.pipeline.runner.kiro import KiroResult
 from src.pipeline.state.machine import PipelineStateMachine
+from src.pipeline.state.memory import InMemoryStateRepository
 from src.pipeline.state.models import (
     VALID_TRANSITIONS,
     PipelineStage,
@@ -88,37 +89,33 @@ def issue_classifications(draw):
 # ---------------------------------------------------------------------------
 
 
-class TransitionRecorder:
+class TransitionRecorder(InMemoryStateRepository):
     """In-memory state repository that records all transitions."""
 
     def __init__(self):
-        self._states = {}
+        super().__init__()
         self.recorded_transitions: List[tuple] = []
 
-    async def save(self, state: PipelineState) -> None:
-        self._states[state.issue_id] = state
-
-    async def get(self, issue_id: str):
-        return self._states.get(issue_id)
-
-    async def list_by_stage(self, stage: PipelineStage):
-        return [
-            s for s in self._states.values() if s.current_stage == stage
-        ]
-
     async def update_with_version(self, state: PipelineState) -> bool:
-        existing = self._states.get(state.issue_id)
-        if existing is None:
-            return False
-        if existing.version != state.version - 1:
-            return False
-        if state.state_history:
+        updated = await super().update_with_version(state)
+        if updated and state.state_history:
             last = state.state_history[-1]
             self.recorded_transitions.append(
                 (last.from_stage, last.to_stage)
             )
-        self._states[state.issue_id] = state
-        return True
+        return updated
+
+    async def append_transition(
+        self, issue_id, expected_version, transition, error
+    ):
+        new_version = await super().append_transition(
+            issue_id, expected_version, transition, error
+        )
+        if new_version is not None:
+            self.recorded_transitions.append(
+                (transition.from_stage, transition.to_stage)
+            )
+        return new_version
 
 
 def _build_orchestrator(
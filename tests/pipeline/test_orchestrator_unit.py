@@ -20,7 +20,7 @@ from src.pipeline.github.pr_creator import PRCreationResult
 from src.pipeline.orchestrator import PipelineOrchestrator
 from src.pipeline.provisioner.workspace import ProvisionedWorkspace
 from src.pipeline.runner.kiro import KiroResult
-from src.pipeline.state.models import PipelineStage, PipelineState
+from src.pipeline.state.models import PipelineStage, PipelineState, StateTransition
 from src.pipeline.webhook.models import GitHubIssueEvent, IssueAction
 
 
@@ -117,8 +117,8 @@ def deps():
     """Create a dict of mocked dependencies for the orchestrator."""
     state_machine = AsyncMock()
     state_machine.create.return_value = _make_pipeline_state()
-    state_machine.transition.return_value = _make_pipeline_state(
-        stage=PipelineStage.INTAKE, version=2
+    state_machine.advance.return_value = StateTransition(
+        from_stage=PipelineStage.PENDING, to_stage=PipelineStage.INTAKE
     )
     state_machine.set_classification.return_value = _make_pipeline_state(version=3)
     state_machine.set_workspace_path.return_value = _make_pipeline_state(version=4)
@@ -182,7 +182,7 @@ def test_happy_path_creates_state_and_completes(orchestrator, deps):
     deps["kiro_runner"].run.assert_called_once()
     deps["pr_creator"].create_pr_for_issue.assert_called_once()
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.INTAKE in stages
     assert PipelineStage.PROVISIONING in stages
@@ -223,7 +223,7 @@ def test_clarification_path_stops_at_clarification(deps):
     deps["kiro_runner"].run.assert_not_called()
     deps["pr_creator"].create_pr_for_issue.assert_not_called()
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.CLARIFICATION in stages
     assert PipelineStage.PROVISIONING not in stages
@@ -242,7 +242,7 @@ def test_classification_failure_transitions_to_failed(deps):
 
     run_async(orch.process_issue(event))
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.FAILED in stages
 
@@ -261,7 +261,7 @@ def test_provisioning_failure_transitions_to_failed(deps):
 
     run_async(orch.process_issue(event))
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.FAILED in stages
 
@@ -278,7 +278,7 @@ def test_kiro_failure_transitions_to_failed(deps):
     ):
         run_async(orch.process_issue(event))
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.FAILED in stages
     assert PipelineStage.COMPLETED not in stages
@@ -296,7 +296,7 @@ def test_pr_creation_failure_transitions_to_failed(deps):
     ):
         run_async(orch.process_issue(event))
 
-    transition_calls = deps["state_machine"].transition.call_args_list
+    transition_calls = deps["state_machine"].advance.call_args_list
     stages = [call.args[1] for call in transition_calls]
     assert PipelineStage.FAILED in stages
 
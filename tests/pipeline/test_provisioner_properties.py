@@ -218,7 +218,6 @@ class TestWorkspacePermissionProperties:
             provisioner = WorkspaceProvisioner(config=config)
             workspace_path = provisioner._build_workspace_path(issue_id)
             provisioner._create_workspace_directory(workspace_path)
-            provisioner._set_directory_permissions(workspace_path)
             actual_mode = workspace_path.stat().st_mode & 0o777
             assert actual_mode == WORKSPACE_DIR_PERMISSIONS
 
@@ -9,12 +9,13 @@ import asyncio
 import os
 import time
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from src.pipeline.classifier.models import IssueClassification, IssueType
 from src.pipeline.provisioner.workspace import (
-    GitCloneError, ProvisionedWorkspace, WorkspaceConfig,
-    WorkspaceProvisionError, WorkspaceProvisioner, WORKSPACE_DIR_PERMISSIONS,
+    GitCloneError, MIRROR_FETCH_REFSPEC, MIRROR_REPACK_PACK_LIMIT,
+    ProvisionedWorkspace, WorkspaceConfig, WorkspaceProvisionError,
+    WorkspaceProvisioner, WORKSPACE_DIR_PERMISSIONS, _build_git_env,
 )
 
 
@@ -22,6 +23,21 @@ def run_async(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
 
 
+def fake_git(*returncodes):
+    """Stand in for create_subprocess_exec; successful clones create their target."""
+    remaining = list(returncodes)
+
+    async def spawn(*args, **kwargs):
+        process = AsyncMock()
+        process.returncode = remaining.pop(0) if remaining else 0
+        process.communicate = AsyncMock(return_value=(b"", b"git failed"))
+        if process.returncode == 0 and "clone" in args:
+            Path(args[-1]).mkdir(parents=True)
+        return process
+
+    return spawn
+
+
 @pytest.fixture
 def workspace_base(tmp_path):
     base = tmp_path / "workspaces"
@@ -54,6 +70,21 @@ def sample_issue_details():
             "title": "Add auth", "body": "Implement OAuth2", "labels": ["feature"]}
 
 
+class TestWorkspaceConfig:
+    def test_rejects_non_positive_retention(self, workspace_base):
+        with pytest.raises(ValueError):
+            WorkspaceConfig(base_path=workspace_base, retention_days=0)
+
+    @pytest.mark.parametrize("max_parallel_clones", [-1, 0])
+    def test_rejects_non_positive_parallel_clones(self, workspace_base, max_parallel_clones):
+        with pytest.raises(ValueError):
+            WorkspaceConfig(base_path=workspace_base, max_parallel_clones=max_parallel_clones)
+
+    def test_is_immutable(self, workspace_config):
+        with pytest.raises(AttributeError):
+            workspace_config.retention_days = 1
+
+
 class TestWorkspaceDirectoryCreation:
 
     def test_build_workspace_path_creates_safe_name(self, provisioner):
@@ -66,6 +97,17 @@ class TestWorkspaceDirectoryCreation:
         parts = path.name.split("_")
         assert parts[-1].isdigit()
 
+    def test_build_workspace_path_is_unique(self, provisioner):
+        first = provisioner._build_workspace_path("owner/repo#1")
+        second = provisioner._build_workspace_path("owner/repo#1")
+        assert first != second
+
+    def test_create_workspace_directory_rejects_existing(self, provisioner, workspace_base):
+        target = workspace_base / "existing_workspace"
+        target.mkdir()
+        with pytest.raises(WorkspaceProvisionError, match="Failed to create"):
+            provisioner._create_workspace_directory(target)
+
     def test_create_workspace_directory_succeeds(self, provisioner, workspace_base):
         target = workspace_base / "test_workspace"
         provisioner._create_workspace_directory(target)
@@ -84,14 +126,24 @@ class TestWorkspaceDirectoryCreation:
 
 class TestWorkspacePermissions:
 
-    def test_set_directory_permissions(self, provisioner, workspace_base):
+    def test_create_sets_directory_permissions(self, provisioner, workspace_base):
         target = workspace_base / "perm_test"
-        target.mkdir()
-        provisioner._set_directory_permissions(target)
+        provisioner._create_workspace_directory(target)
         actual_mode = target.stat().st_mode & 0o777
         assert actual_mode == WORKSPACE_DIR_PERMISSIONS
 
 
+    def test_create_sets_permissions_under_restrictive_umask(self, workspace_base):
+        previous = os.umask(0o077)
+        try:
+            prov = WorkspaceProvisioner(config=WorkspaceConfig(base_path=workspace_base))
+            target = workspace_base / "umask_test"
+            prov._create_workspace_directory(target)
+        finally:
+            os.umask(previous)
+        assert target.stat().st_mode & 0o777 == WORKSPACE_DIR_PERMISSIONS
+
+
 class TestPackageUrlResolution:
 
     def test_resolve_primary_repository(self, provisioner):
@@ -154,6 +206,17 @@ class TestGitClone:
                 run_async(provisioner._clone_single_package(
                     workspace, "slow-pkg", "https://github.com/org/slow-pkg.git"))
 
+    def test_clone_timeout_kills_git(self, provisioner):
+        process = AsyncMock()
+        process.returncode = None
+        process.kill = MagicMock()
+        process.communicate = AsyncMock(side_effect=asyncio.TimeoutError())
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            with pytest.raises(GitCloneError, match="timed out"):
+                run_async(provisioner._run_git(["git", "clone"], "url"))
+        process.kill.assert_called_once_with()
+        process.wait.assert_awaited_once_with()
+
     def test_clone_os_error_raises(self, provisioner, workspace_base):
         workspace = workspace_base / "clone_oserr"
         workspace.mkdir()
@@ -163,6 +226,261 @@ class TestGitClone:
                     workspace, "pkg", "https://github.com/org/pkg.git"))
 
 
+class TestCloneCommand:
+
+    def test_clone_command_is_shallow_partial_clone(self, provisioner, workspace_base):
+        command = provisioner._build_clone_command(
+            "https://github.com/org/pkg.git", workspace_base / "pkg")
+        assert command[:2] == ["git", "clone"]
+        assert "--no-tags" in command
+        assert "--single-branch" in command
+        assert "--filter=blob:none" in command
+        assert command[-2:] == ["https://github.com/org/pkg.git", str(workspace_base / "pkg")]
+
+    def test_clone_command_without_filter(self, workspace_base):
+        config = WorkspaceConfig(base_path=workspace_base, blob_filter=None)
+        command = WorkspaceProvisioner(config=config)._build_clone_command(
+            "https://github.com/org/pkg.git", workspace_base / "pkg")
+        assert not any(arg.startswith("--filter") for arg in command)
+
+
+class TestGitEnvironment:
+
+    def test_transport_config_passed_through_env(self, provisioner, workspace_base):
+        process = AsyncMock()
+        process.communicate = AsyncMock(return_value=(b"", b""))
+        process.returncode = 0
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            run_async(provisioner._run_git(["git", "status"], "url"))
+        env = mock_exec.call_args.kwargs["env"]
+        configured = {
+            env[f"GIT_CONFIG_KEY_{i}"]: env[f"GIT_CONFIG_VALUE_{i}"]
+            for i in range(int(env["GIT_CONFIG_COUNT"]))
+        }
+        assert configured["protocol.version"] == "2"
+        assert configured["http.version"] == "HTTP/2"
+
+    def test_existing_env_config_preserved(self):
+        env = _build_git_env({
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "core.askPass",
+            "GIT_CONFIG_VALUE_0": "",
+        })
+        assert env["GIT_CONFIG_KEY_0"] == "core.askPass"
+        assert env["GIT_CONFIG_COUNT"] == "3"
+        assert env["GIT_CONFIG_KEY_1"] == "protocol.version"
+
+
+class TestMirrorCache:
+
+    def test_mirror_path_mirrors_owner_and_repo(self, provisioner, workspace_base):
+        path = provisioner._mirror_path("https://github.com/org/pkg.git")
+        assert path == workspace_base / ".mirrors" / "org" / "pkg.git"
+
+    def test_local_clone_shares_mirror_objects(self, provisioner, workspace_base):
+        mirror = workspace_base / ".mirrors" / "org" / "pkg.git"
+        command = provisioner._build_local_clone_command(
+            "https://github.com/org/pkg.git", workspace_base / "pkg", mirror)
+        assert command[:4] == ["git", "clone", "--local", "--shared"]
+        assert "remote.origin.pushurl=https://github.com/org/pkg.git" in command
+        assert command[-2:] == [str(mirror), str(workspace_base / "pkg")]
+
+    def test_clone_uses_mirror_when_available(self, provisioner, workspace_base):
+        workspace = workspace_base / "from_mirror"
+        workspace.mkdir()
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git()) as mock_exec:
+            run_async(provisioner._clone_single_package(
+                workspace, "pkg", "https://github.com/org/pkg.git"))
+        assert "--bare" in mock_exec.call_args_list[0].args
+        assert "--local" in mock_exec.call_args_list[-1].args
+
+    def test_mirror_is_moved_into_place_once_configured(self, provisioner, workspace_base):
+        url = "https://github.com/org/pkg.git"
+        mirror = provisioner._mirror_path(url)
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git()) as mock_exec:
+            assert run_async(provisioner._ensure_mirror(url)) == mirror
+        clone_args, config_args = (c.args for c in mock_exec.call_args_list)
+        staging = clone_args[-1]
+        assert staging != str(mirror)
+        assert config_args[:3] == ("git", "-C", staging)
+        assert config_args[-1] == MIRROR_FETCH_REFSPEC
+        assert mirror.is_dir()
+        assert [p.name for p in mirror.parent.iterdir()] == [mirror.name]
+
+    def test_failed_mirror_configuration_leaves_no_mirror(self, provisioner, workspace_base):
+        url = "https://github.com/org/pkg.git"
+        mirror = provisioner._mirror_path(url)
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git(0, 1)):
+            assert run_async(provisioner._ensure_mirror(url)) is None
+        assert list(mirror.parent.iterdir()) == []
+
+    def test_mirror_fetch_names_its_refspec(self, provisioner, workspace_base):
+        url = "https://github.com/org/pkg.git"
+        provisioner._mirror_path(url).mkdir(parents=True)
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git()) as mock_exec:
+            run_async(provisioner._ensure_mirror(url))
+        (fetch_args,) = (c.args for c in mock_exec.call_args_list)
+        assert "fetch" in fetch_args
+        assert "fetch.unpackLimit=1" in fetch_args
+        assert fetch_args[-1] == MIRROR_FETCH_REFSPEC
+
+    def test_mirror_repacks_accumulated_packs(self, provisioner, workspace_base):
+        url = "https://github.com/org/pkg.git"
+        pack_dir = provisioner._mirror_path(url) / "objects" / "pack"
+        pack_dir.mkdir(parents=True)
+        for index in range(MIRROR_REPACK_PACK_LIMIT - 1):
+            (pack_dir / f"pack-{index}.pack").touch()
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git()) as mock_exec:
+            run_async(provisioner._ensure_mirror(url))
+        assert mock_exec.call_count == 1
+
+        (pack_dir / "pack-last.pack").touch()
+        provisioner._mirror_refreshed_at.clear()
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=fake_git()) as mock_exec:
+            run_async(provisioner._ensure_mirror(url))
+        repack_args = mock_exec.call_args_list[-1].args
+        assert "repack" in repack_args
+        assert "--keep-unreachable" in repack_args
+
+    def test_mirror_failure_falls_back_to_direct_clone(self, provisioner, workspace_base):
+        workspace = workspace_base / "fallback"
+        workspace.mkdir()
+        failed = AsyncMock()
+        failed.returncode = 128
+        failed.communicate = AsyncMock(return_value=(b"", b"mirror failed"))
+        succeeded = AsyncMock()
+        succeeded.returncode = 0
+        succeeded.communicate = AsyncMock(return_value=(b"", b""))
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=[failed, succeeded]) as mock_exec:
+            run_async(provisioner._clone_single_package(
+                workspace, "pkg", "https://github.com/org/pkg.git"))
+        clone_args = mock_exec.call_args_list[1].args
+        assert "clone" in clone_args
+        assert "--local" not in clone_args
+
+    def test_concurrent_refreshes_are_coalesced(self, provisioner, workspace_base):
+        url = "https://github.com/org/pkg.git"
+        provisioner._mirror_path(url).mkdir(parents=True)
+
+        async def slow_fetch(*args, **kwargs):
+            process = AsyncMock()
+            process.returncode = 0
+
+            async def communicate():
+                await asyncio.sleep(0.01)
+                return b"", b""
+
+            process.communicate = communicate
+            return process
+
+        async def provision_many():
+            return await asyncio.gather(
+                *(provisioner._ensure_mirror(url) for _ in range(5)))
+
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=slow_fetch) as mock_exec:
+            results = run_async(provision_many())
+        assert all(path == provisioner._mirror_path(url) for path in results)
+        assert mock_exec.call_count <= 2
+
+        with patch("asyncio.create_subprocess_exec",
+                   side_effect=slow_fetch) as mock_exec:
+            run_async(provisioner._ensure_mirror(url))
+        assert mock_exec.call_count == 1
+
+    def test_cleanup_skips_mirror_directory(self, workspace_base):
+        config = WorkspaceConfig(base_path=workspace_base, retention_days=1)
+        prov = WorkspaceProvisioner(config=config)
+        mirrors = workspace_base / ".mirrors"
+        mirrors.mkdir()
+        old_mtime = time.time() - (5 * 86400)
+        os.utime(mirrors, (old_mtime, old_mtime))
+        removed = run_async(prov.cleanup_old_workspaces())
+        assert removed == 0
+        assert mirrors.exists()
+
+
+class TestParallelClone:
+
+    def test_clones_run_concurrently_within_limit(self, workspace_base):
+        config = WorkspaceConfig(base_path=workspace_base, max_parallel_clones=2)
+        prov = WorkspaceProvisioner(config=config)
+        active = 0
+        peak = 0
+
+        async def fake_clone(workspace_path, package_name, clone_url):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        with patch.object(prov, "_clone_single_package", side_effect=fake_clone):
+            cloned = run_async(prov._clone_required_packages(
+                workspace_base, ["a", "b", "c", "d"],
+                {"repository": "repo", "owner": "org"}))
+        assert cloned == ["repo", "a", "b", "c", "d"]
+        assert peak == 2
+
+    def test_clone_failure_propagates(self, provisioner, workspace_base):
+        async def fake_clone(workspace_path, package_name, clone_url):
+            if package_name == "bad":
+                raise GitCloneError(clone_url, "boom")
+
+        with patch.object(provisioner, "_clone_single_package", side_effect=fake_clone):
+            with pytest.raises(GitCloneError, match="boom"):
+                run_async(provisioner._clone_required_packages(
+                    workspace_base, ["good", "bad"], {"owner": "org"}))
+
+    def test_clone_failure_cancels_other_clones(self, provisioner, workspace_base):
+        cancelled = []
+
+        async def fake_clone(workspace_path, package_name, clone_url):
+            if package_name == "bad":
+                raise GitCloneError(clone_url, "boom")
+            try:
+                await asyncio.sleep(100)
+            except asyncio.CancelledError:
+                cancelled.append(package_name)
+                raise
+
+        with patch.object(provisioner, "_clone_single_package", side_effect=fake_clone):
+            with pytest.raises(GitCloneError, match="boom"):
+                run_async(provisioner._clone_required_packages(
+                    workspace_base, ["slow", "bad"], {"owner": "org"}))
+        assert cancelled == ["slow"]
+
+    def test_cancelled_clone_kills_git(self, provisioner):
+        process = AsyncMock()
+        process.returncode = None
+        process.kill = MagicMock()
+
+        async def communicate():
+            await asyncio.sleep(100)
+
+        process.communicate = communicate
+
+        async def cancel_clone():
+            task = asyncio.ensure_future(
+                provisioner._run_git(["git", "clone"], "url"))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            run_async(cancel_clone())
+        process.kill.assert_called_once_with()
+        process.wait.assert_awaited_once_with()
+
+
 class TestProvisionFlow:
 
     def test_provision_creates_workspace_and_clones(
@@ -229,6 +547,21 @@ class TestWorkspaceCleanup:
         assert not old_ws.exists()
         assert recent_ws.exists()
 
+    def test_cleanup_uses_name_timestamp_over_mtime(self, workspace_base):
+        config = WorkspaceConfig(base_path=workspace_base, retention_days=1)
+        prov = WorkspaceProvisioner(config=config)
+        old_ts = int(time.time() - (2 * 86400))
+        named_old = workspace_base / f"org_repo_1_{old_ts}"
+        named_old.mkdir()
+        named_recent = workspace_base / f"org_repo_2_{int(time.time())}"
+        named_recent.mkdir()
+        old_mtime = time.time() - (5 * 86400)
+        os.utime(named_recent, (old_mtime, old_mtime))
+        removed = run_async(prov.cleanup_old_workspaces())
+        assert removed == 1
+        assert not named_old.exists()
+        assert named_recent.exists()
+
     def test_cleanup_nonexistent_base_path(self, tmp_path):
         config = WorkspaceConfig(base_path=tmp_path / "nonexistent", retention_days=7)
         prov = WorkspaceProvisioner(config=config)
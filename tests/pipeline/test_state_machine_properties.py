@@ -16,97 +16,23 @@ Testing Configuration:
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 import pytest
 from hypothesis import given, settings, strategies as st, assume
 
 from src.pipeline.state import (
+    InMemoryStateRepository,
     InvalidTransitionError,
     PipelineStage,
     PipelineState,
     PipelineStateMachine,
-    StateRepository,
-    StateTransition,
+    RetryPolicy,
     VALID_TRANSITIONS,
+    is_valid_transition,
 )
 
 
-# =============================================================================
-# In-Memory State Repository for Testing
-# =============================================================================
-
-
-class InMemoryStateRepository(StateRepository):
-    """In-memory implementation of StateRepository for testing.
-    
-    This repository stores pipeline states in memory, allowing tests to
-    run without a database connection while still exercising the full
-    state machine logic.
-    """
-
-    def __init__(self) -> None:
-        """Initialize an empty in-memory repository."""
-        self._states: Dict[str, PipelineState] = {}
-
-    async def save(self, state: PipelineState) -> None:
-        """Save or create a new pipeline state.
-        
-        Args:
-            state: The pipeline state to save.
-        """
-        self._states[state.issue_id] = state
-
-    async def get(self, issue_id: str) -> Optional[PipelineState]:
-        """Get pipeline state by issue ID.
-        
-        Args:
-            issue_id: The canonical issue identifier.
-            
-        Returns:
-            The pipeline state if found, None otherwise.
-        """
-        return self._states.get(issue_id)
-
-    async def list_by_stage(self, stage: PipelineStage) -> List[PipelineState]:
-        """List all pipeline states in a given stage.
-        
-        Args:
-            stage: The pipeline stage to filter by.
-            
-        Returns:
-            List of pipeline states in the specified stage.
-        """
-        return [
-            state for state in self._states.values()
-            if state.current_stage == stage
-        ]
-
-    async def update_with_version(self, state: PipelineState) -> bool:
-        """Update state with optimistic locking.
-        
-        Args:
-            state: The pipeline state to update (with incremented version).
-            
-        Returns:
-            True if update succeeded, False if version conflict.
-        """
-        existing = self._states.get(state.issue_id)
-        if existing is None:
-            return False
-        
-        # Check version for optimistic locking
-        if existing.version != state.version - 1:
-            return False
-        
-        self._states[state.issue_id] = state
-        return True
-
-    def clear(self) -> None:
-        """Clear all states from the repository."""
-        self._states.clear()
-
-
 # =============================================================================
 # Hypothesis Strategies for Generating Test Data
 # =============================================================================
@@ -454,6 +380,30 @@ class TestStateTransitionValidation:
         
         run_async(test())
 
+    @given(
+        stage=st.sampled_from(list(PipelineStage)),
+        other=st.one_of(
+            st.none(),
+            st.integers(),
+            st.text().filter(lambda v: v not in {s.value for s in PipelineStage}),
+        ),
+    )
+    @settings(max_examples=100)
+    def test_non_stage_values_are_invalid_transitions(
+        self,
+        stage: PipelineStage,
+        other: Any,
+    ) -> None:
+        """Property 7 edge case: Values that are not stages never transition.
+
+        is_valid_transition() SHALL return False, rather than raise, when
+        either side is not a pipeline stage.
+
+        **Validates: Requirements 7.1, 7.2**
+        """
+        assert is_valid_transition(stage, other) is False
+        assert is_valid_transition(other, stage) is False
+
 
     @given(
         issue_id=valid_issue_id(),
@@ -776,6 +726,40 @@ class TestFailedStateErrorStorage:
         
         run_async(test())
 
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+        details=st.one_of(st.just({}), st.builds(lambda e: {"error": e}, error_message())),
+    )
+    @settings(max_examples=100)
+    def test_advance_stores_the_same_errors_as_transition(
+        self,
+        issue_id: str,
+        repository: str,
+        details: Dict[str, Any],
+    ) -> None:
+        """advance() and transition() store the same error on failure and recovery.
+
+        **Validates: Requirement 7.4**
+        """
+        async def test():
+            errors = []
+            for advance in (False, True):
+                machine = PipelineStateMachine(InMemoryStateRepository())
+                move = machine.advance if advance else machine.transition
+                await machine.create(issue_id, repository)
+                await move(issue_id, PipelineStage.INTAKE)
+                await move(issue_id, PipelineStage.FAILED, details=details)
+                failed = (await machine.get(issue_id)).error
+                await move(issue_id, PipelineStage.PENDING)
+                recovered = (await machine.get(issue_id)).error
+                errors.append((failed, recovered))
+
+            assert errors[0] == errors[1]
+            assert errors[0][0] and errors[0][1] is None
+
+        run_async(test())
+
     @given(
         issue_id=valid_issue_id(),
         repository=valid_repository(),
@@ -981,6 +965,49 @@ class TestEdgeCases:
         
         run_async(test())
 
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+        cache_ttl=st.sampled_from([0, 60]),
+    )
+    @settings(max_examples=50)
+    def test_transitions_leave_read_states_unchanged(
+        self,
+        issue_id: str,
+        repository: str,
+        cache_ttl: int,
+    ) -> None:
+        """Edge case: A transition does not modify states already read.
+
+        The repository and the cache may hand out the same state object,
+        so transition() and transition_many() SHALL build the new history
+        instead of extending the one that was read.
+
+        **Validates: Requirements 7.3**
+        """
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo, cache_ttl=cache_ttl)
+
+        async def test():
+            created = await machine.create(issue_id, repository)
+            await machine.transition(issue_id, PipelineStage.INTAKE)
+            read = await repo.get(issue_id)
+            await machine.transition_many(
+                [(issue_id, PipelineStage.PROVISIONING, None)]
+            )
+
+            assert created.state_history == []
+            assert [t.to_stage for t in read.state_history] == [
+                PipelineStage.INTAKE
+            ]
+            final_state = await machine.get(issue_id)
+            assert [t.to_stage for t in final_state.state_history] == [
+                PipelineStage.INTAKE,
+                PipelineStage.PROVISIONING,
+            ]
+
+        run_async(test())
+
     @given(
         issue_id=valid_issue_id(),
         repository=valid_repository(),
@@ -1169,3 +1196,288 @@ class TestEdgeCases:
             assert updated_at_2 >= updated_at_1
         
         run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+    )
+    @settings(max_examples=50)
+    def test_concurrent_stage_change_reported_as_invalid_transition(
+        self,
+        issue_id: str,
+        repository: str,
+    ) -> None:
+        """Edge case: A transition based on a stale read is rejected.
+
+        When another writer moves the state between the read and the
+        conditional write, the machine SHALL raise InvalidTransitionError
+        if the new stage forbids the transition, and VersionConflictError
+        otherwise.
+
+        **Validates: Requirements 7.2, 8.5**
+        """
+        from src.pipeline.state import VersionConflictError
+
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo, RetryPolicy(max_attempts=1))
+
+        async def test():
+            await machine.create(issue_id, repository)
+            stale = await repo.get(issue_id)
+            await machine.transition(issue_id, PipelineStage.INTAKE)
+            await machine.transition(issue_id, PipelineStage.PROVISIONING)
+
+            original_get = repo.get
+            reads = []
+
+            async def stale_first_get(requested_id):
+                reads.append(requested_id)
+                if len(reads) == 1:
+                    return stale
+                return await original_get(requested_id)
+
+            repo.get = stale_first_get
+            with pytest.raises(InvalidTransitionError):
+                await machine.transition(issue_id, PipelineStage.INTAKE)
+
+            reads.clear()
+            with pytest.raises(VersionConflictError):
+                await machine.transition(issue_id, PipelineStage.FAILED)
+
+            current = await original_get(issue_id)
+            assert current.current_stage == PipelineStage.PROVISIONING
+            assert len(current.state_history) == 2
+
+        run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+    )
+    @settings(max_examples=50)
+    def test_cached_state_reused_and_refreshed_when_stale(
+        self,
+        issue_id: str,
+        repository: str,
+    ) -> None:
+        """Edge case: Writes start from the machine's cached state.
+
+        Consecutive writes by one machine SHALL not re-read the state,
+        and a cached state made stale by another writer SHALL be re-read
+        instead of producing a spurious error.
+
+        **Validates: Requirements 7.2, 8.5**
+        """
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo)
+        other = PipelineStateMachine(repo)
+
+        async def test():
+            await machine.create(issue_id, repository)
+
+            original_get = repo.get
+            reads = []
+
+            async def counting_get(requested_id):
+                reads.append(requested_id)
+                return await original_get(requested_id)
+
+            repo.get = counting_get
+            await machine.transition(issue_id, PipelineStage.INTAKE)
+            await machine.set_pr_number(issue_id, 7)
+            await machine.transition(issue_id, PipelineStage.PROVISIONING)
+            assert reads == []
+
+            # Another writer moves the state on behind the cache
+            await other.transition(issue_id, PipelineStage.IMPLEMENTATION)
+            await other.transition(issue_id, PipelineStage.PR_CREATION)
+
+            # Cached stage forbids this transition, the stored one allows it
+            state = await machine.transition(issue_id, PipelineStage.COMPLETED)
+            assert state.current_stage == PipelineStage.COMPLETED
+            assert len(state.state_history) == 5
+
+            stored = await original_get(issue_id)
+            assert stored == state
+            assert stored.pr_number == 7
+
+        run_async(test())
+
+    def test_single_log_record_per_transition(self, caplog) -> None:
+        """Edge case: Each applied transition logs exactly one record.
+
+        A FAILED transition without details SHALL be logged once at
+        WARNING with the reason as a field, and a recovery SHALL carry
+        its recovery reason in the same record.
+
+        **Validates: Requirements 7.4, 7.6**
+        """
+        import logging
+
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo)
+        issue_id = "owner/repo#1"
+
+        async def test():
+            await machine.create(issue_id, "owner/repo")
+            await machine.transition(issue_id, PipelineStage.FAILED)
+            await machine.transition(
+                issue_id,
+                PipelineStage.PENDING,
+                details={"recovery_reason": "retry"},
+            )
+
+        with caplog.at_level(logging.INFO, logger="src.pipeline.state.machine"):
+            run_async(test())
+
+        records = [
+            r for r in caplog.records if r.msg == "Transitioned pipeline state"
+        ]
+        assert len(records) == 2
+        assert len(caplog.records) == 3  # plus the creation record
+
+        failed, recovered = records
+        assert failed.levelno == logging.WARNING
+        assert failed.warning_reason == "Transition to FAILED without error details"
+        assert recovered.levelno == logging.INFO
+        assert recovered.recovery_reason == "retry"
+        assert not hasattr(recovered, "warning_reason")
+
+    @given(
+        issue_ids=st.lists(valid_issue_id(), min_size=1, max_size=8, unique=True),
+        repository=valid_repository(),
+    )
+    @settings(max_examples=50)
+    def test_transition_many_writes_one_batch(
+        self,
+        issue_ids: List[str],
+        repository: str,
+    ) -> None:
+        """Edge case: Batched transitions are written in one call.
+
+        transition_many() SHALL validate every update before writing,
+        read the states through a single get_many() call, apply the valid
+        ones through a single append_transitions() call, and retry updates
+        that lost a race individually.
+
+        **Validates: Requirements 7.2, 7.3, 8.5**
+        """
+        class BatchRecordingRepo(InMemoryStateRepository):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+                self.reads = []
+                self.race = None
+
+            async def get_many(self, issue_ids):
+                self.reads.append(list(issue_ids))
+                return await super().get_many(issue_ids)
+
+            async def append_transitions(self, items):
+                self.batches.append([item[0] for item in items])
+                return await super().append_transitions(items)
+
+            async def append_transition(self, issue_id, *args):
+                if issue_id == self.race:
+                    self.race = None
+                    return None
+                return await super().append_transition(issue_id, *args)
+
+        repo = BatchRecordingRepo()
+        machine = PipelineStateMachine(repo, cache_ttl=0)
+
+        async def test():
+            for issue_id in issue_ids:
+                await machine.create(issue_id, repository)
+
+            with pytest.raises(InvalidTransitionError):
+                await machine.transition_many(
+                    [(issue_ids[0], PipelineStage.COMPLETED, None)]
+                    + [(i, PipelineStage.INTAKE, None) for i in issue_ids[1:]]
+                )
+            assert repo.batches == []
+
+            repo.race = issue_ids[-1]
+            states = await machine.transition_many(
+                [(i, PipelineStage.FAILED, {"error": i}) for i in issue_ids]
+            )
+            assert repo.batches == [issue_ids]
+            assert repo.reads == [issue_ids, issue_ids]
+            for issue_id, state in zip(issue_ids, states):
+                assert state.issue_id == issue_id
+                assert state.current_stage == PipelineStage.FAILED
+                assert state.error == issue_id
+                assert await repo.get(issue_id) == state
+
+            with pytest.raises(ValueError):
+                await machine.transition_many(
+                    [(issue_ids[0], PipelineStage.PENDING, None)] * 2
+                )
+
+        run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+        error_msg=st.text(min_size=1, max_size=100),
+    )
+    @settings(max_examples=50)
+    def test_advance_applies_without_reading(
+        self,
+        issue_id: str,
+        repository: str,
+        error_msg: str,
+    ) -> None:
+        """Edge case: advance() writes a transition without a prior read.
+
+        advance() SHALL validate against the stored stage, apply the same
+        error rules as transition(), and never call get().
+
+        **Validates: Requirements 7.2, 7.4, 7.6**
+        """
+        from src.pipeline.state import StateNotFoundError
+
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo)
+
+        async def test():
+            await machine.create(issue_id, repository)
+
+            original_get = repo.get
+
+            async def forbidden_get(requested_id):
+                raise AssertionError("advance() must not read the state")
+
+            repo.get = forbidden_get
+            transition = await machine.advance(issue_id, PipelineStage.INTAKE)
+            assert transition.from_stage == PipelineStage.PENDING
+            assert transition.to_stage == PipelineStage.INTAKE
+
+            with pytest.raises(InvalidTransitionError) as exc_info:
+                await machine.advance(issue_id, PipelineStage.COMPLETED)
+            assert exc_info.value.from_stage == PipelineStage.INTAKE
+
+            await machine.advance(
+                issue_id, PipelineStage.FAILED, details={"error": error_msg}
+            )
+            await machine.advance(issue_id, PipelineStage.PENDING)
+
+            with pytest.raises(StateNotFoundError):
+                await machine.advance("missing/repo#1", PipelineStage.INTAKE)
+
+            repo.get = original_get
+            state = await repo.get(issue_id)
+            assert state.current_stage == PipelineStage.PENDING
+            assert state.error is None
+            assert [t.to_stage for t in state.state_history] == [
+                PipelineStage.INTAKE,
+                PipelineStage.FAILED,
+                PipelineStage.PENDING,
+            ]
+
+            # The machine's cached state is stale now; transition() must
+            # not act on it
+            state = await machine.transition(issue_id, PipelineStage.INTAKE)
+            assert len(state.state_history) == 4
+
+        run_async(test())
@@ -18,95 +18,26 @@ contract. The PostgresStateRepository will be tested in integration tests.
 """
 
 import asyncio
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pytest
 from hypothesis import given, settings, strategies as st, assume, HealthCheck
 
 from src.pipeline.state import (
+    InMemoryStateRepository,
     PipelineStage,
     PipelineState,
     PipelineStateMachine,
-    StateRepository,
+    PostgresStateRepository,
+    RetryPolicy,
     StateTransition,
     VALID_TRANSITIONS,
 )
-
-
-# =============================================================================
-# In-Memory State Repository for Testing
-# =============================================================================
-
-
-class InMemoryStateRepository(StateRepository):
-    """In-memory implementation of StateRepository for testing.
-    
-    This repository stores pipeline states in memory, allowing tests to
-    run without a database connection while still exercising the full
-    repository interface contract.
-    """
-
-    def __init__(self) -> None:
-        """Initialize an empty in-memory repository."""
-        self._states: Dict[str, PipelineState] = {}
-
-    async def save(self, state: PipelineState) -> None:
-        """Save or create a new pipeline state.
-        
-        Args:
-            state: The pipeline state to save.
-        """
-        self._states[state.issue_id] = state
-
-    async def get(self, issue_id: str) -> Optional[PipelineState]:
-        """Get pipeline state by issue ID.
-        
-        Args:
-            issue_id: The canonical issue identifier.
-            
-        Returns:
-            The pipeline state if found, None otherwise.
-        """
-        return self._states.get(issue_id)
-
-    async def list_by_stage(self, stage: PipelineStage) -> List[PipelineState]:
-        """List all pipeline states in a given stage.
-        
-        Args:
-            stage: The pipeline stage to filter by.
-            
-        Returns:
-            List of pipeline states in the specified stage.
-        """
-        return [
-            state for state in self._states.values()
-            if state.current_stage == stage
-        ]
-
-    async def update_with_version(self, state: PipelineState) -> bool:
-        """Update state with optimistic locking.
-        
-        Args:
-            state: The pipeline state to update (with incremented version).
-            
-        Returns:
-            True if update succeeded, False if version conflict.
-        """
-        existing = self._states.get(state.issue_id)
-        if existing is None:
-            return False
-        
-        # Check version for optimistic locking
-        if existing.version != state.version - 1:
-            return False
-        
-        self._states[state.issue_id] = state
-        return True
-
-    def clear(self) -> None:
-        """Clear all states from the repository."""
-        self._states.clear()
+from src.pipeline.state import repository as repository_module
+from src.pipeline.state.repository import COPY_MIN_TRANSITIONS
 
 
 # =============================================================================
@@ -339,6 +270,131 @@ def states_are_equivalent(state1: PipelineState, state2: PipelineState) -> bool:
     return True
 
 
+def state_row(
+    state: PipelineState,
+    kept: Optional[List[StateTransition]] = None,
+) -> Dict[str, Any]:
+    """Build the pipeline_states row the repository's queries return.
+
+    Without ``kept`` the row carries no history columns; otherwise they
+    hold ``kept`` as the query renders them, with UTC timestamps.
+    """
+    row: Dict[str, Any] = {
+        "issue_id": state.issue_id,
+        "repository": state.repository,
+        "current_stage": state.current_stage.value,
+        "classification": state.classification or None,
+        "workspace_path": state.workspace_path,
+        "pr_number": state.pr_number,
+        "error": state.error,
+        "created_at": state.created_at,
+        "updated_at": state.updated_at,
+        "version": state.version,
+        "transitions": None,
+        "total": None,
+    }
+    if kept is not None:
+        row["transitions"] = [
+            {
+                "from_stage": t.from_stage.value,
+                "to_stage": t.to_stage.value,
+                "timestamp": t.timestamp.astimezone(timezone.utc).strftime(
+                    "%Y-%m-%dT%H:%M:%S.%f+00:00"
+                ),
+                "details": t.details or None,
+            }
+            for t in kept
+        ] or None
+        row["total"] = len(state.state_history) or None
+    return row
+
+
+class FakeConnection:
+    """asyncpg connection stand-in that records calls and returns canned rows.
+
+    ``fetchrow`` and ``fetch`` are called with the query and its arguments;
+    ``cursor_rows`` are yielded by every cursor.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetchrow: Optional[Callable[..., Any]] = None,
+        fetch: Optional[Callable[..., List[Any]]] = None,
+        cursor_rows: Sequence[Any] = (),
+    ) -> None:
+        self._fetchrow = fetchrow
+        self._fetch = fetch
+        self._cursor_rows = cursor_rows
+        self.calls: List[Tuple[str, str, Tuple[Any, ...]]] = []
+        self.batches: List[Tuple[str, List[Any]]] = []
+        self.transactions: List[Dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def transaction(self, **options: Any) -> AsyncIterator[None]:
+        self.transactions.append(options)
+        yield
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.calls.append(("execute", query, args))
+        return "INSERT 0 1"
+
+    async def executemany(self, query: str, rows: Sequence[Any]) -> None:
+        assert len(rows) < COPY_MIN_TRANSITIONS
+        self.batches.append(("executemany", list(rows)))
+
+    async def copy_records_to_table(
+        self, table: str, *, columns: Sequence[str], records: Sequence[Any]
+    ) -> None:
+        assert len(records) >= COPY_MIN_TRANSITIONS
+        self.batches.append((table, list(records)))
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        self.calls.append(("fetchrow", query, args))
+        return self._fetchrow(query, *args)
+
+    async def fetch(self, query: str, *args: Any) -> List[Any]:
+        self.calls.append(("fetch", query, args))
+        return self._fetch(query, *args)
+
+    def cursor(self, query: str, *args: Any, prefetch: Optional[int] = None):
+        self.calls.append(("cursor", query, args))
+
+        async def iterate():
+            for row in self._cursor_rows:
+                yield row
+
+        return iterate()
+
+
+class FakePool:
+    """asyncpg pool stand-in that always hands out the same connection."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[FakeConnection]:
+        yield self.connection
+
+
+def fake_repository(
+    connection: FakeConnection, **kwargs: Any
+) -> PostgresStateRepository:
+    """Create a repository whose pool serves ``connection``."""
+    repo = PostgresStateRepository("postgresql://localhost/db", **kwargs)
+    repo._pool = FakePool(connection)
+    return repo
+
+
+def bound_parameters(query: str, args: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Map the named parameters of a function call to their bound values."""
+    return {
+        name: args[int(index) - 1]
+        for name, index in re.findall(r"(p_\w+) => \$(\d+)", query)
+    }
+
+
 # =============================================================================
 # Property Tests
 # =============================================================================
@@ -515,6 +571,42 @@ class TestStateQueryCorrectness:
         
         run_async(test())
 
+    @given(
+        issue_ids=st.lists(valid_issue_id(), min_size=0, max_size=10, unique=True),
+        target_stage=st.sampled_from(list(PipelineStage)),
+    )
+    @settings(max_examples=50)
+    def test_iter_and_count_agree_with_list(
+        self,
+        issue_ids: List[str],
+        target_stage: PipelineStage,
+    ) -> None:
+        """Property 10: Streaming and counting match list_by_stage.
+
+        *For any* set of states, iter_by_stage SHALL yield the same states
+        as list_by_stage and count_by_stage SHALL return their number.
+
+        **Validates: Requirement 7.5**
+        """
+        repo = InMemoryStateRepository()
+        machine = PipelineStateMachine(repo)
+        stages = list(PipelineStage)
+
+        async def test():
+            for i, issue_id in enumerate(issue_ids):
+                await repo.save(PipelineState(
+                    issue_id=issue_id,
+                    repository=f"owner/repo{i}",
+                    current_stage=stages[i % len(stages)],
+                ))
+
+            listed = await machine.list_by_stage(target_stage)
+            streamed = [s async for s in machine.iter_by_stage(target_stage)]
+            assert [s.issue_id for s in streamed] == [s.issue_id for s in listed]
+            assert await machine.count_by_stage(target_stage) == len(listed)
+
+        run_async(test())
+
 
 class TestStatePersistenceRoundTrip:
     """Property tests for state persistence round-trip.
@@ -709,6 +801,78 @@ class TestStatePersistenceRoundTrip:
         
         run_async(test())
 
+    @given(
+        classification=valid_classification(),
+        details=st.dictionaries(
+            st.text(max_size=20),
+            st.one_of(
+                st.none(),
+                st.booleans(),
+                st.integers(),
+                st.floats(allow_nan=False, allow_infinity=False),
+                st.text(max_size=50),
+                st.lists(st.integers(), max_size=5),
+            ),
+            max_size=5,
+        ),
+    )
+    @settings(max_examples=100)
+    def test_jsonb_serialization_round_trips(
+        self,
+        classification: Optional[Dict[str, Any]],
+        details: Dict[str, Any],
+    ) -> None:
+        """Property 11: JSON columns survive serialization unchanged.
+
+        *For any* classification or transition details, the documents the
+        repository binds to jsonb columns SHALL decode to the original
+        value, with or without orjson installed.
+
+        **Validates: Requirements 8.1, 8.2**
+        """
+        import json
+        from unittest.mock import patch
+
+        from src.pipeline import serialization
+
+        for value in (classification, details):
+            encoded = serialization.json_dumps(value)
+            assert isinstance(encoded, str)
+            assert json.loads(encoded) == value
+            assert serialization.json_loads(encoded) == value
+
+            with patch.object(serialization, "orjson", None):
+                assert serialization.json_dumps(value) == json.dumps(value)
+                assert serialization.json_loads(encoded) == value
+
+    @given(
+        value=st.one_of(
+            st.sampled_from([float("nan"), float("inf"), float("-inf")]),
+            st.datetimes(),
+            st.dates(),
+            st.uuids(),
+        ),
+    )
+    @settings(max_examples=50)
+    def test_jsonb_serialization_rejects_the_same_values(self, value: Any) -> None:
+        """Property 11: Both JSON backends SHALL reject non-JSON values.
+
+        Non-finite floats and types JSON has no form for are refused with
+        or without orjson, rather than being stored differently by each.
+
+        **Validates: Requirements 8.1, 8.2**
+        """
+        from unittest.mock import patch
+
+        from src.pipeline import serialization
+
+        for orjson_module in (serialization.orjson, None):
+            with patch.object(serialization, "orjson", orjson_module):
+                with pytest.raises((TypeError, ValueError)):
+                    serialization.json_dumps({"details": [value]})
+                with pytest.raises(ValueError):
+                    serialization.json_loads('{"score": NaN}')
+
 
 class TestStateTransactionalAtomicity:
     """Property tests for state transactional atomicity.
@@ -1202,17 +1366,25 @@ class TestStateOptimisticLocking:
                 super().__init__()
                 self._update_count = 0
             
-            async def update_with_version(self, state: PipelineState) -> bool:
+            async def append_transition(
+                self,
+                issue_id: str,
+                expected_version: int,
+                transition: StateTransition,
+                error: Optional[str],
+            ) -> Optional[int]:
                 """Simulate concurrent modification by always failing."""
                 # First call succeeds to set up state, subsequent calls fail
                 self._update_count += 1
                 if self._update_count > 1:
                     # Simulate version conflict
-                    return False
-                return await super().update_with_version(state)
+                    return None
+                return await super().append_transition(
+                    issue_id, expected_version, transition, error
+                )
         
         repo = ConcurrentModificationRepo()
-        machine = PipelineStateMachine(repo)
+        machine = PipelineStateMachine(repo, RetryPolicy(max_attempts=1))
         
         async def test():
             # Create state
@@ -1228,3 +1400,566 @@ class TestStateOptimisticLocking:
             assert exc_info.value.issue_id == issue_id
         
         run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+        classification=valid_classification(),
+    )
+    @settings(max_examples=100)
+    def test_setters_patch_fields_without_rewriting_history(
+        self,
+        issue_id: str,
+        repository: str,
+        classification: Optional[Dict[str, Any]],
+    ) -> None:
+        """Property: Field setters write through patch_fields only.
+
+        *For any* field update, the state machine SHALL bump the version
+        and leave the stage and state history untouched, and a stale
+        version SHALL raise a VersionConflictError.
+
+        **Validates: Requirement 8.5**
+        """
+        from src.pipeline.state.machine import VersionConflictError
+
+        class PatchOnlyRepo(InMemoryStateRepository):
+            """Repository that rejects full-state rewrites."""
+
+            async def update_with_version(self, state: PipelineState) -> bool:
+                raise AssertionError("setters must not rewrite the full state")
+
+        repo = PatchOnlyRepo()
+        machine = PipelineStateMachine(repo, RetryPolicy(max_attempts=1))
+
+        async def test():
+            created = await machine.create(issue_id, repository)
+
+            state = await machine.set_classification(issue_id, classification)
+            assert state.version == created.version + 1
+            assert state.classification == classification
+            assert state.current_stage == created.current_stage
+            assert state.state_history == created.state_history
+            assert await repo.get(issue_id) == state
+
+            assert await repo.patch_fields(
+                issue_id, created.version, {"pr_number": 1}
+            ) is None
+
+            stored = await repo.get(issue_id)
+            await repo.patch_fields(issue_id, stored.version, {"pr_number": 7})
+            original_get = repo.get
+
+            async def stale_get(requested_id):
+                return stored if requested_id == issue_id else await original_get(requested_id)
+
+            repo.get = stale_get
+            with pytest.raises(VersionConflictError):
+                await machine.set_workspace_path(issue_id, "/tmp/ws")
+
+        run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+        conflicts=st.integers(min_value=1, max_value=3),
+    )
+    @settings(max_examples=20)
+    def test_transient_version_conflicts_are_retried(
+        self,
+        issue_id: str,
+        repository: str,
+        conflicts: int,
+    ) -> None:
+        """Property: Transient version conflicts are retried with backoff.
+
+        *For any* run of version conflicts shorter than the retry policy,
+        the state machine SHALL re-read the state and complete the
+        operation; once the policy is exhausted the conflict SHALL be
+        raised.
+
+        **Validates: Requirement 8.5**
+        """
+        from src.pipeline.state.machine import VersionConflictError
+
+        class FlakyRepo(InMemoryStateRepository):
+            """Repository that loses the first few optimistic-lock races."""
+
+            def __init__(self):
+                super().__init__()
+                self.failures_left = 0
+
+            async def append_transition(self, *args) -> Optional[int]:
+                if self.failures_left:
+                    self.failures_left -= 1
+                    return None
+                return await super().append_transition(*args)
+
+            async def patch_fields(self, *args) -> Optional[int]:
+                if self.failures_left:
+                    self.failures_left -= 1
+                    return None
+                return await super().patch_fields(*args)
+
+        repo = FlakyRepo()
+        machine = PipelineStateMachine(
+            repo, RetryPolicy(max_attempts=conflicts + 1, base_delay=0)
+        )
+
+        async def test():
+            await machine.create(issue_id, repository)
+
+            repo.failures_left = conflicts
+            state = await machine.transition(issue_id, PipelineStage.INTAKE)
+            assert state.current_stage == PipelineStage.INTAKE
+            assert len(state.state_history) == 1
+
+            repo.failures_left = conflicts
+            state = await machine.set_pr_number(issue_id, 42)
+            assert state.pr_number == 42
+            assert await repo.get(issue_id) == state
+
+            repo.failures_left = conflicts + 1
+            with pytest.raises(VersionConflictError):
+                await machine.transition(issue_id, PipelineStage.PROVISIONING)
+
+        run_async(test())
+
+    @given(
+        issue_id=valid_issue_id(),
+        repository=valid_repository(),
+    )
+    @settings(max_examples=50)
+    def test_version_conflict_carries_current_state(
+        self,
+        issue_id: str,
+        repository: str,
+    ) -> None:
+        """Property: A transition conflict carries the re-read state.
+
+        *For any* rejected transition, the VersionConflictError SHALL be
+        retryable and carry the current state, and the retry SHALL start
+        from that state without reading it again.
+
+        **Validates: Requirement 8.5**
+        """
+        from src.pipeline.state.machine import VersionConflictError
+
+        class RacedRepo(InMemoryStateRepository):
+            """Repository whose next transition write loses a race."""
+
+            def __init__(self):
+                super().__init__()
+                self.race = False
+                self.reads = 0
+
+            async def get(self, issue_id: str) -> Optional[PipelineState]:
+                self.reads += 1
+                return await super().get(issue_id)
+
+            async def append_transition(self, *args) -> Optional[int]:
+                if self.race:
+                    self.race = False
+                    stored = self._states[args[0]]
+                    self._states[args[0]] = stored.model_copy(
+                        update={"version": stored.version + 1}
+                    )
+                    return None
+                return await super().append_transition(*args)
+
+        repo = RacedRepo()
+        single = PipelineStateMachine(
+            repo, RetryPolicy(max_attempts=1), cache_ttl=0
+        )
+        retrying = PipelineStateMachine(
+            repo, RetryPolicy(base_delay=0), cache_ttl=0
+        )
+
+        async def test():
+            await single.create(issue_id, repository)
+
+            repo.race = True
+            with pytest.raises(VersionConflictError) as exc_info:
+                await single.transition(issue_id, PipelineStage.INTAKE)
+            error = exc_info.value
+            assert error.retryable
+            assert error.current_state == await repo.get(issue_id)
+            assert error.actual_version == error.current_state.version
+
+            repo.race = True
+            repo.reads = 0
+            state = await retrying.transition(issue_id, PipelineStage.INTAKE)
+            assert state.current_stage == PipelineStage.INTAKE
+            # One read for the first attempt, one to diagnose the conflict
+            assert repo.reads == 2
+            assert await repo.get(issue_id) == state
+
+        run_async(test())
+
+    def test_valid_transitions_migration_matches_model(self) -> None:
+        """The server-side transition matrix SHALL mirror VALID_TRANSITIONS.
+
+        **Validates: Requirement 7.2**
+        """
+        import re
+        from pathlib import Path
+
+        migration = (
+            Path(__file__).resolve().parents[2]
+            / "migrations"
+            / "002_valid_transitions.sql"
+        ).read_text()
+        seeded = set(re.findall(r"\('(\w+)', '(\w+)'\)", migration))
+        expected = {
+            (from_stage.value, to_stage.value)
+            for from_stage, targets in VALID_TRANSITIONS.items()
+            for to_stage in targets
+        }
+        assert seeded == expected
+
+    def test_stage_lookup_tables_are_inverse(self) -> None:
+        """Stage values read from rows SHALL map back to the same members."""
+        from src.pipeline.state import STAGE_BY_VALUE, STAGE_VALUE
+
+        assert len(STAGE_BY_VALUE) == len(PipelineStage)
+        for stage in PipelineStage:
+            assert STAGE_BY_VALUE[STAGE_VALUE[stage]] is stage
+
+
+class TestBoundedHistory:
+    """Tests for repositories that load only recent transitions."""
+
+    @given(state=valid_pipeline_state(), offset=st.integers(min_value=0, max_value=50))
+    @settings(max_examples=50)
+    def test_history_offset_survives_copies(
+        self,
+        state: PipelineState,
+        offset: int,
+    ) -> None:
+        """The omitted-transition count SHALL be kept by model copies."""
+        assert state.history_offset == 0
+        state._history_offset = offset
+        copied = state.model_copy(update={"version": state.version + 1})
+        assert copied.history_offset == offset
+
+    def test_statement_cache_size_passed_to_pool(self) -> None:
+        """The per-connection statement cache SHALL be configurable."""
+        from unittest.mock import AsyncMock, patch
+
+        with pytest.raises(ValueError):
+            PostgresStateRepository(
+                "postgresql://localhost/db", statement_cache_size=-1
+            )
+
+        repo = PostgresStateRepository(
+            "postgresql://localhost/db", statement_cache_size=0
+        )
+        with patch(
+            "src.pipeline.state.repository.asyncpg.create_pool",
+            new_callable=AsyncMock,
+        ) as create_pool:
+            run_async(repo.connect())
+
+        assert create_pool.call_args.kwargs["statement_cache_size"] == 0
+        assert create_pool.call_args.kwargs["server_settings"]["jit"] == "off"
+
+    def test_connections_register_jsonb_codec(self) -> None:
+        """Pool connections SHALL encode and decode jsonb columns themselves."""
+        from unittest.mock import AsyncMock, patch
+
+        repo = PostgresStateRepository("postgresql://localhost/db")
+        with patch(
+            "src.pipeline.state.repository.asyncpg.create_pool",
+            new_callable=AsyncMock,
+        ) as create_pool:
+            run_async(repo.connect())
+
+        conn = AsyncMock()
+        run_async(create_pool.call_args.kwargs["init"](conn))
+        conn.set_type_codec.assert_awaited_once_with(
+            "jsonb",
+            encoder=repository_module._encode_jsonb,
+            decoder=repository_module._decode_jsonb,
+            schema="pg_catalog",
+            format="binary",
+        )
+
+        value = {"error": "timeout", "attempts": [1, 2]}
+        encoded = repository_module._encode_jsonb(value)
+        assert encoded[:1] == b"\x01"
+        assert repository_module._decode_jsonb(encoded) == value
+
+    def test_connections_warm_read_statements(self) -> None:
+        """New connections SHALL prepare the read statements unless caching is off."""
+        from unittest.mock import AsyncMock
+
+        conn = AsyncMock()
+        repo = PostgresStateRepository("postgresql://localhost/db", history_limit=5)
+        run_async(repo._init_connection(conn))
+        assert [c.args for c in conn.fetch.await_args_list] == [
+            (repository_module._SELECT_STATE_SQL, "", 5),
+            (repository_module._SELECT_ALL_TRANSITIONS_SQL, ""),
+        ]
+
+        conn = AsyncMock()
+        repo = PostgresStateRepository(
+            "postgresql://localhost/db", statement_cache_size=0
+        )
+        run_async(repo._init_connection(conn))
+        conn.set_type_codec.assert_awaited_once()
+        conn.fetch.assert_not_awaited()
+
+    def test_history_limit_must_be_positive(self) -> None:
+        """A non-positive history limit SHALL be rejected."""
+        with pytest.raises(ValueError):
+            PostgresStateRepository("postgresql://localhost/db", history_limit=0)
+
+    @given(state=valid_pipeline_state())
+    @settings(max_examples=50)
+    def test_transition_rows_rebuild_equal_transitions(
+        self,
+        state: PipelineState,
+    ) -> None:
+        """History rows SHALL decode to transitions equal to those written."""
+        for transition in state.state_history:
+            row = {
+                "from_stage": transition.from_stage.value,
+                "to_stage": transition.to_stage.value,
+                "timestamp": transition.timestamp,
+                "details": transition.details or None,
+            }
+            rebuilt = PostgresStateRepository._transition_from_row(row)
+            assert rebuilt == transition
+            # get_history() unpacks records positionally
+            rebuilt = PostgresStateRepository._transition_from_values(*row.values())
+            assert rebuilt == transition
+
+    @given(
+        states=st.lists(valid_pipeline_state(), max_size=5, unique_by=lambda s: s.issue_id),
+        history_limit=st.one_of(st.none(), st.integers(min_value=1, max_value=3)),
+    )
+    @settings(max_examples=50)
+    def test_iter_by_stage_regroups_joined_rows(
+        self,
+        states: List[PipelineState],
+        history_limit: Optional[int],
+    ) -> None:
+        """Stage listings SHALL rebuild each state from its joined rows."""
+        rows = []
+        expected = []
+        for state in states:
+            kept = state.state_history
+            if history_limit is not None:
+                kept = kept[-history_limit:]
+            expected.append((state.model_copy(update={"state_history": kept}),
+                             len(state.state_history) - len(kept)))
+            base = state_row(state)
+            del base["transitions"], base["total"]
+            empty = {"from_stage": None, "to_stage": None, "timestamp": None,
+                     "details": None, "total": None}
+            if not kept:
+                rows.append({**base, **empty})
+            for transition in kept:
+                rows.append({
+                    **base,
+                    "from_stage": transition.from_stage.value,
+                    "to_stage": transition.to_stage.value,
+                    "timestamp": transition.timestamp,
+                    "details": transition.details or None,
+                    "total": len(state.state_history),
+                })
+
+        conn = FakeConnection(cursor_rows=rows)
+        repo = fake_repository(conn, history_limit=history_limit)
+
+        async def test():
+            listed = [s async for s in repo.iter_by_stage(PipelineStage.PENDING)]
+            assert len(listed) == len(expected)
+            for got, (want, offset) in zip(listed, expected):
+                assert states_are_equivalent(got, want)
+                assert got.history_offset == offset
+
+        run_async(test())
+        assert all(args[1] == history_limit for _, _, args in conn.calls)
+
+    @given(state=valid_pipeline_state(), repeat=st.integers(min_value=1, max_value=8))
+    @settings(max_examples=30)
+    def test_save_inserts_history_in_one_batch(
+        self, state: PipelineState, repeat: int
+    ) -> None:
+        """Saving a state SHALL insert its history in a single batch."""
+        # Long histories, as when replaying a state, are copied in
+        state = state.model_copy(
+            update={"state_history": state.state_history * repeat}
+        )
+
+        conn = FakeConnection()
+        run_async(fake_repository(conn).save(state))
+
+        if not state.state_history:
+            assert conn.batches == []
+            return
+        assert len(conn.batches) == 1
+        target, rows = conn.batches[0]
+        if len(rows) >= COPY_MIN_TRANSITIONS:
+            assert target == "state_transitions"
+        else:
+            assert target == "executemany"
+        assert [(row[1], row[2]) for row in rows] == [
+            (t.from_stage.value, t.to_stage.value) for t in state.state_history
+        ]
+
+    @given(state=valid_pipeline_state(), applied=st.booleans())
+    @settings(max_examples=30)
+    def test_update_with_version_is_one_statement(
+        self, state: PipelineState, applied: bool
+    ) -> None:
+        """Versioned updates SHALL write state and history in one statement."""
+        conn = FakeConnection(
+            fetchrow=lambda query, *args: {
+                "applied_version": state.version if applied else None,
+                "inserted_count": 0,
+            }
+        )
+
+        assert run_async(fake_repository(conn).update_with_version(state)) is applied
+        assert len(conn.calls) == 1
+        params = bound_parameters(*conn.calls[0][1:])
+        assert params["p_issue_id"] == state.issue_id
+        assert params["p_expected_version"] == state.version - 1
+        assert params["p_to_stages"] == [t.to_stage.value for t in state.state_history]
+        # Details are bound as jsonb values for the connection's codec
+        assert params["p_details"] == [t.details or None for t in state.state_history]
+        assert params["p_history_offset"] == state.history_offset
+        assert params["p_known_skip"] is None
+
+    @given(state=valid_pipeline_state(), data=st.data())
+    @settings(max_examples=30)
+    def test_update_sends_only_unstored_transitions(
+        self, state: PipelineState, data: st.DataObject
+    ) -> None:
+        """A state read at the expected version SHALL skip the count probe."""
+        stored = data.draw(st.integers(min_value=0, max_value=len(state.state_history)))
+        state._stored_history = (state.version - 1, stored)
+        conn = FakeConnection(
+            fetchrow=lambda query, *args: {
+                "applied_version": state.version,
+                "inserted_count": len(bound_parameters(query, args)["p_from_stages"]),
+            }
+        )
+
+        assert run_async(fake_repository(conn).update_with_version(state)) is True
+        params = bound_parameters(*conn.calls[0][1:])
+        assert params["p_to_stages"] == [
+            t.to_stage.value for t in state.state_history[stored:]
+        ]
+        assert params["p_known_skip"] == 0
+        assert state._stored_history == (state.version, len(state.state_history))
+
+    @given(
+        state=valid_pipeline_state(),
+        history_limit=st.one_of(st.none(), st.integers(min_value=1, max_value=3)),
+    )
+    @settings(max_examples=50)
+    def test_get_rebuilds_state_from_one_row(
+        self,
+        state: PipelineState,
+        history_limit: Optional[int],
+    ) -> None:
+        """get() SHALL rebuild a state and its history from a single row."""
+        kept = state.state_history
+        if history_limit is not None:
+            kept = kept[-history_limit:]
+        row = state_row(state, kept)
+        conn = FakeConnection(fetchrow=lambda query, *args: row)
+        repo = fake_repository(conn, history_limit=history_limit)
+
+        loaded = run_async(repo.get(state.issue_id))
+        assert [args for _, _, args in conn.calls] == [(state.issue_id, history_limit)]
+        assert states_are_equivalent(
+            loaded, state.model_copy(update={"state_history": kept})
+        )
+        assert loaded.state_history == kept
+        assert all(t.timestamp.tzinfo is timezone.utc for t in loaded.state_history)
+        assert loaded.history_offset == len(state.state_history) - len(kept)
+
+    @given(
+        states=st.lists(valid_pipeline_state(), max_size=4, unique_by=lambda s: s.issue_id),
+        missing=st.lists(st.text(min_size=1, max_size=10), max_size=2),
+    )
+    @settings(max_examples=30)
+    def test_get_many_is_one_query_in_input_order(
+        self,
+        states: List[PipelineState],
+        missing: List[str],
+    ) -> None:
+        """get_many() SHALL read every state in one query, in input order."""
+        stored = {state.issue_id: state for state in states}
+        missing = [issue_id for issue_id in missing if issue_id not in stored]
+        # The server may return rows in any order
+        conn = FakeConnection(
+            fetch=lambda query, *args: [
+                state_row(state) for state in reversed(states)
+            ]
+        )
+
+        issue_ids = missing + [state.issue_id for state in states]
+        loaded = run_async(fake_repository(conn).get_many(issue_ids))
+        assert [args for _, _, args in conn.calls] == (
+            [(issue_ids, None)] if issue_ids else []
+        )
+        assert [s.issue_id if s else None for s in loaded] == (
+            [None] * len(missing) + [state.issue_id for state in states]
+        )
+
+    def test_stage_iteration_reads_in_read_only_snapshot(self) -> None:
+        """Cursor reads SHALL run in a read-only repeatable-read transaction."""
+        conn = FakeConnection()
+
+        assert run_async(
+            fake_repository(conn).list_by_stage(PipelineStage.PENDING)
+        ) == []
+        assert conn.transactions == [{"isolation": "repeatable_read", "readonly": True}]
+
+    @given(
+        states=st.lists(valid_pipeline_state(), max_size=7, unique_by=lambda s: s.issue_id),
+        limit=st.integers(min_value=1, max_value=4),
+    )
+    @settings(max_examples=30)
+    def test_stage_pages_follow_the_keyset_cursor(
+        self,
+        states: List[PipelineState],
+        limit: int,
+    ) -> None:
+        """Stage pages SHALL resume after the last state of the previous page."""
+        ordered = sorted(states, key=lambda s: (s.created_at, s.issue_id))
+
+        def fetch(query, stage, history_limit, page_limit, *after):
+            remaining = [
+                s for s in ordered
+                if not after or (s.created_at, s.issue_id) > tuple(after)
+            ]
+            return [state_row(s) for s in remaining[:page_limit]]
+
+        conn = FakeConnection(fetch=fetch)
+        repo = fake_repository(conn)
+
+        async def test():
+            with pytest.raises(ValueError):
+                await repo.list_by_stage_page(PipelineStage.PENDING, limit=0)
+
+            listed = []
+            cursor = None
+            while True:
+                page, cursor = await repo.list_by_stage_page(
+                    PipelineStage.PENDING, limit=limit, after=cursor
+                )
+                assert len(page) <= limit
+                listed.extend(page)
+                if cursor is None:
+                    break
+            assert [s.issue_id for s in listed] == [s.issue_id for s in ordered]
+            # The first page has no cursor to resume after
+            assert conn.calls[0][2][3:] == ()
+
+        run_async(test())
@@ -14,6 +14,8 @@ Testing Configuration:
 - Tag format: Feature: agent-orchestration, Property N: <property_text>
 """
 
+import json
+
 from hypothesis import given, settings, strategies as st, assume
 
 from src.pipeline.webhook import WebhookHandler, GitHubIssueEvent, IssueAction
@@ -250,6 +252,60 @@ class TestIssueEventParsing:
         assert result is not None
         assert result.body == ""  # Null body should become empty string
 
+    @given(payload=github_issue_payload())
+    @settings(max_examples=100)
+    def test_parsed_event_passes_model_validation(self, payload: dict) -> None:
+        """Parsed events SHALL equal the same event built by the validating constructor.
+
+        **Validates: Requirements 1.5**
+        """
+        handler = WebhookHandler(secret="test-secret")
+        result = handler.parse_issue_event(payload)
+
+        assert result is not None
+        assert GitHubIssueEvent(**result.model_dump()) == result
+
+    @given(payload=github_issue_payload())
+    @settings(max_examples=100)
+    def test_raw_body_parses_like_decoded_payload(self, payload: dict) -> None:
+        """Parsing the raw request body SHALL match parsing the decoded dict.
+
+        **Validates: Requirements 1.3**
+        """
+        handler = WebhookHandler(secret="test-secret")
+        raw = json.dumps(payload).encode("utf-8")
+
+        assert handler.parse_issue_event_bytes(raw) == handler.parse_issue_event(
+            payload
+        )
+
+    @given(
+        payload=github_issue_payload(),
+        action=st.text(max_size=20).filter(
+            lambda a: a not in {action.value for action in IssueAction}
+        ),
+    )
+    @settings(max_examples=100)
+    def test_unsupported_action_ignored(self, payload: dict, action: str) -> None:
+        """Events with actions other than opened, edited or labeled SHALL be ignored.
+
+        **Validates: Requirements 1.3**
+        """
+        handler = WebhookHandler(secret="test-secret")
+        payload["action"] = action
+
+        assert handler.parse_issue_event(payload) is None
+
+    @given(raw=st.sampled_from([b"", b"{", b"\xff\xfe", b"not json"]))
+    def test_invalid_raw_body_ignored(self, raw: bytes) -> None:
+        """Bodies that are not valid UTF-8 JSON SHALL be ignored.
+
+        **Validates: Requirements 1.3**
+        """
+        handler = WebhookHandler(secret="test-secret")
+
+        assert handler.parse_issue_event_bytes(raw) is None
+
 
 class TestIssueFieldExtraction:
     """Property tests for issue field extraction.
@@ -317,11 +373,57 @@ class TestIssueFieldExtraction:
         result = handler.parse_issue_event(payload)
 
         assert result is not None
-        expected_labels = [
-            label["name"].strip() for label in payload["issue"]["labels"]
-        ]
+        expected_labels = tuple(
+            sorted(label["name"].strip() for label in payload["issue"]["labels"])
+        )
         assert result.labels == expected_labels
 
+    @given(payload=github_issue_payload(), other=valid_label_name())
+    @settings(max_examples=100)
+    def test_has_label_matches_labels(self, payload: dict, other: str) -> None:
+        """has_label SHALL report exactly the extracted labels.
+
+        **Validates: Requirements 1.5**
+        """
+        handler = WebhookHandler(secret="test-secret")
+        result = handler.parse_issue_event(payload)
+
+        assert result is not None
+        assert all(result.has_label(label) for label in result.labels)
+        assert result.has_label(other) == (other in result.labels)
+
+    @given(
+        payload=github_issue_payload(),
+        owner=valid_github_username(),
+        label=valid_label_name(),
+    )
+    @settings(max_examples=100)
+    def test_copied_event_recomputes_derived_values(
+        self, payload: dict, owner: str, label: str
+    ) -> None:
+        """Copies with updated fields SHALL NOT reuse the original's cached values.
+
+        **Validates: Requirements 1.5**
+        """
+        handler = WebhookHandler(secret="test-secret")
+        result = handler.parse_issue_event(payload)
+
+        assert result is not None
+        # Populate the caches on the original before copying
+        original_id = result.issue_id
+        original_labels = result.labels
+        assert all(result.has_label(name) for name in original_labels)
+
+        copied = result.model_copy(update={"owner": owner, "labels": (label,)})
+
+        assert copied.issue_id == f"{owner}/{result.repository}#{result.issue_number}"
+        assert copied.full_repository == f"{owner}/{result.repository}"
+        assert copied.has_label(label)
+        assert all(
+            copied.has_label(name) == (name == label) for name in original_labels
+        )
+        assert result.issue_id == original_id
+
     @given(payload=github_issue_payload())
     @settings(max_examples=100)
     def test_repository_matches_payload(self, payload: dict) -> None:
@@ -384,7 +486,7 @@ class TestIssueFieldExtraction:
         assert isinstance(result.title, str)
         assert len(result.title) > 0
         assert isinstance(result.body, str)  # Can be empty but must be string
-        assert isinstance(result.labels, list)
+        assert isinstance(result.labels, tuple)
         assert all(isinstance(label, str) for label in result.labels)
         assert isinstance(result.repository, str)
         assert len(result.repository) > 0
@@ -487,7 +589,7 @@ class TestEdgeCases:
 
         assert result is not None
         assert len(result.labels) == num_labels
-        assert result.labels == labels
+        assert result.labels == tuple(sorted(labels))
 
     @given(
         action=st.sampled_from(["opened", "edited", "labeled"]),
@@ -549,7 +651,7 @@ class TestEdgeCases:
         repo_name: str,
         author: str,
     ) -> None:
-        """Edge case: Empty labels list should result in empty list.
+        """Edge case: Empty labels list should result in empty tuple.
 
         **Validates: Requirements 1.5**
         """
@@ -572,7 +674,7 @@ class TestEdgeCases:
         result = handler.parse_issue_event(payload)
 
         assert result is not None
-        assert result.labels == []
+        assert result.labels == ()
 
     @given(payload=github_issue_payload())
     @settings(max_examples=100)